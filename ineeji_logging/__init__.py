@@ -3,6 +3,21 @@ ineeji_logging - ineeji 프로젝트를 위한 공통 로깅 라이브러리
 """
 
 from .logger import Logger, logger
+from .flush_policy import AdaptiveFlushPolicy
+from .remote import RemoteHandler
+from .bulk import BulkHandler
+from .database import DatabaseHandler
+from .context import logging_context, get_context, BoundLogger
+from .reader import read_parquet_logs
+from .stats import log_stats, LogStats
+from .export import export_logs
+from .search import search_logs, build_index
+from .retention import RetentionManager
+from .config import ConfigWatcher
+from .storage import make_storage, convert_partition
 
 __version__ = '0.1.0'
-__all__ = ['Logger', 'logger'] 
\ No newline at end of file
+__all__ = ['Logger', 'logger', 'AdaptiveFlushPolicy', 'RemoteHandler', 'BulkHandler', 'DatabaseHandler',
+           'logging_context', 'get_context', 'BoundLogger', 'read_parquet_logs',
+           'log_stats', 'LogStats', 'export_logs', 'search_logs', 'build_index',
+           'RetentionManager', 'ConfigWatcher', 'make_storage', 'convert_partition'] 
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""
+ineeji_logging 명령줄 도구
+
+사용법:
+    python -m ineeji_logging tail --project my_app --env production --level ERROR
+    python -m ineeji_logging stats --project my_app --env production --since 2024-01-01
+    python -m ineeji_logging export --project my_app --env production --format jsonl -o logs.jsonl
+    python -m ineeji_logging search --project my_app --env production "order-12345"
+    python -m ineeji_logging prune --project my_app --env production --max-age-days 30 --max-bytes 5G --dry-run
+    python -m ineeji_logging convert --project my_app --env production --compression zstd
+"""
+
+import sys
+import argparse
+from typing import Optional, List
+
+from . import tail, stats, export, search, retention, storage
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m ineeji_logging', description='ineeji_logging 로그 도구')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+    tail.add_arguments(commands.add_parser('tail', help='텍스트/파케이 로그 실시간 추적'))
+    stats.add_arguments(commands.add_parser('stats', help='레벨별 건수, 상위 로거, 일별 에러율 집계'))
+    export.add_arguments(commands.add_parser('export', help='파케이 로그를 CSV / JSON Lines로 내보내기'))
+    search.add_search_arguments(commands.add_parser('search', help='메시지 단어 검색 (토큰 색인 사용)'))
+    search.add_index_arguments(commands.add_parser('index', help='날짜 파티션 메시지 토큰 색인 생성/압축'))
+    retention.add_arguments(commands.add_parser('prune', help='보존 기간/용량 한도를 넘은 날짜 파티션 삭제'))
+    storage.add_arguments(commands.add_parser('convert', help='Arrow 스트림(log.arrows) 파티션을 파케이로 변환'))
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
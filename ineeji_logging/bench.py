@@ -0,0 +1,539 @@
+"""
+재현 가능한 로깅 벤치마크 스위트
+
+사용법:
+    python -m ineeji_logging.bench                          # 전체 시나리오 실행
+    python -m ineeji_logging.bench -s async_file -s sync_file
+    python -m ineeji_logging.bench --save-baseline          # 결과를 기준선으로 저장
+    python -m ineeji_logging.bench --baseline benchmarks/baseline.json
+
+각 시나리오는 별도의 프로세스(spawn)에서 임시 디렉토리를 대상으로 실행되며,
+호출자 지연 시간(p50/p99/p999), 처리량, 영구 저장까지 걸린 시간, CPU 시간, 저장된 파일 크기, 최대 RSS를
+측정합니다. storage_* 시나리오는 실제 로그 구성(INFO/WARNING/ERROR+예외)으로 저장 백엔드와 압축 코덱을 비교합니다.
+각 시나리오 프로세스는 시나리오 전후에 고정된 포맷팅 작업으로 장비 속도(calibration)를 측정하고,
+비교 시에는 기준선의 시간/처리량 지표를 시나리오별 calibration 비율로 보정하므로
+다른 장비나 실행 도중 CPU 속도가 바뀌는 환경(공유 VM, CI)에서도 같은 기준선과 비교할 수 있습니다.
+여러 스레드/프로세스가 경쟁하는 시나리오의 p99 지연은 GIL 스케줄링 잡음이 커서 비교하지 않습니다.
+보정 후에도 허용 범위를 벗어나면 종료 코드 1, 기준선 파일이 없거나 메시지 수가 달라 비교할 수 없으면 종료 코드 2로 실패합니다.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import importlib.util
+import platform
+import tempfile
+import threading
+import multiprocessing
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+DEFAULT_BASELINE = os.path.join('benchmarks', 'baseline.json')
+
+# 모든 시나리오의 공통 Logger 설정 - 환경 프리셋이 바뀌어도 측정 조건이 바뀌지 않도록 명시
+BASE_CONFIG: Dict[str, Any] = {
+    'level': logging.INFO,
+    'console_output': False,
+    'format_string': "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    'detailed_format_string': ("%(asctime)s [%(levelname)s] %(name)s "
+                               "(%(pathname)s:%(lineno)d - %(funcName)s): %(message)s"),
+    'colored_console': False,
+    'env': 'bench',
+    'parquet_flush_threshold': 100,
+    'parquet_flush_interval': 5.0,
+    'parquet_flush_delays': None,  # 레벨별 우선 플러시는 priority_* 시나리오에서만
+    'parquet_encoder_workers': 0,
+    'parquet_deferred_formatting': False,
+    'parquet_storage': 'fastparquet',
+    'parquet_compression': None,
+}
+
+# 시나리오 정의: BASE_CONFIG 덮어쓰기 + 스레드/프로세스 수
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    'sync_file': {'config': {'async_logging': False, 'log_file': True, 'parquet_logging': False}},
+    'async_file': {'config': {'async_logging': True, 'log_file': True, 'parquet_logging': False}},
+    'sync_parquet': {'config': {'async_logging': False, 'log_file': False, 'parquet_logging': True,
+                                'parquet_flush_threshold': 100}},
+    'async_parquet': {'config': {'async_logging': True, 'log_file': False, 'parquet_logging': True,
+                                 'parquet_flush_threshold': 100}},
+    'async_parquet_encoder': {'config': {'async_logging': True, 'log_file': False, 'parquet_logging': True,
+                                         'parquet_flush_threshold': 100, 'parquet_encoder_workers': 1}},
+    'async_parquet_deferred': {'config': {'async_logging': True, 'log_file': False, 'parquet_logging': True,
+                                          'parquet_flush_threshold': 100, 'parquet_deferred_formatting': True}},
+    'async_full': {'config': {'async_logging': True, 'log_file': True, 'parquet_logging': True,
+                              'parquet_flush_threshold': 100}},
+    'sync_threads_16': {'config': {'async_logging': False, 'log_file': True, 'parquet_logging': False},
+                        'threads': 16},
+    'threads_16': {'config': {'async_logging': True, 'log_file': True, 'parquet_logging': True,
+                              'parquet_flush_threshold': 100}, 'threads': 16},
+    'processes_4': {'config': {'async_logging': True, 'log_file': True, 'parquet_logging': True,
+                               'parquet_flush_threshold': 100}, 'processes': 4},
+}
+
+# flush 임계값별 시나리오
+for _threshold in (1, 10, 50, 100, 500):
+    SCENARIOS[f'threshold_{_threshold}'] = {
+        'config': {'async_logging': True, 'log_file': False, 'parquet_logging': True,
+                   'parquet_flush_threshold': _threshold},
+    }
+
+SCENARIOS['threshold_auto'] = {
+    'config': {'async_logging': True, 'log_file': False, 'parquet_logging': True,
+               'parquet_flush_threshold': 'auto', 'parquet_flush_interval': 1.0},
+}
+
+# 레벨별 우선 플러시 시나리오 (실제 로그 구성, ERROR 약 1%)
+for _name, _delays in (('priority_off', None), ('priority_error_5ms', {'ERROR': 0.005}),
+                       ('priority_error_now', {'ERROR': 0})):
+    SCENARIOS[_name] = {
+        'config': {'async_logging': True, 'log_file': False, 'parquet_logging': True,
+                   'parquet_flush_threshold': 1000, 'parquet_flush_delays': _delays},
+        'mix': True,
+    }
+
+# 저장 백엔드/압축 코덱별 시나리오 (pyarrow/arrow 백엔드는 pyarrow가 설치된 경우만)
+_STORAGE_VARIANTS = [('fastparquet', 'snappy'), ('fastparquet', 'zstd'), ('fastparquet', 'lz4')]
+if importlib.util.find_spec('pyarrow') is not None:
+    _STORAGE_VARIANTS += [('pyarrow', 'snappy'), ('pyarrow', 'zstd'), ('arrow', 'lz4'), ('arrow', 'zstd')]
+for _storage, _codec in _STORAGE_VARIANTS:
+    SCENARIOS[f'storage_{_storage}_{_codec}'] = {
+        'config': {'async_logging': True, 'log_file': False, 'parquet_logging': True,
+                   'parquet_flush_threshold': 100, 'parquet_storage': _storage, 'parquet_compression': _codec},
+        'mix': True,
+    }
+
+# 기준선 대비 허용 오차 (비율)
+DEFAULT_TOLERANCES = {
+    'msgs_per_sec': 0.35,      # 처리량은 35% 이상 떨어지면 실패
+    'p99_us': 1.00,            # 호출자 p99 지연은 2배 이상 늘면 실패 (스케줄링 잡음이 큼)
+    'persist_seconds': 0.50,   # 영구 저장 완료 시간은 50% 이상 늘면 실패
+    'peak_rss_mb': 0.30,       # 최대 RSS는 30% 이상 늘면 실패
+}
+
+# 값이 클수록 좋은 지표
+HIGHER_IS_BETTER = {'msgs_per_sec'}
+
+# 장비 속도에 비례하는 지표 (calibration 비율로 기준선을 보정)
+SPEED_METRICS = {'msgs_per_sec', 'p99_us', 'persist_seconds'}
+
+# 여러 스레드/프로세스가 경쟁하는 시나리오에서 비교하지 않는 지표
+# (p99 지연이 GIL 전환 주기(sys.getswitchinterval)의 배수로 양자화되어 실행마다 수십 배씩 달라짐)
+CONTENDED_SKIP = {'p99_us'}
+
+# calibration 작업량 (레코드 수 x 반복 횟수, 가장 빠른 반복을 사용)
+CALIBRATION_RECORDS = 10000
+CALIBRATION_ROUNDS = 3
+
+
+def _peak_rss_mb(include_children: bool = False) -> Optional[float]:
+    """현재 프로세스(및 자식 프로세스)의 최대 RSS (MB)"""
+    if resource is None:
+        return None
+    usage = [resource.getrusage(resource.RUSAGE_SELF).ru_maxrss]
+    if include_children:
+        usage.append(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # Linux는 KB, macOS는 바이트 단위
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return max(usage) / divisor
+
+
+def _cpu_seconds() -> float:
+    """현재 프로세스와 종료된 자식 프로세스(인코더 워커 등)의 CPU 시간 (초)"""
+    seconds = time.process_time()
+    if resource is not None:
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        seconds += children.ru_utime + children.ru_stime
+    return seconds
+
+
+def _disk_bytes(workdir: str) -> int:
+    """파케이 로그 디렉토리(~/.ineeji)에 저장된 파일 크기 합계"""
+    total = 0
+    for root, _, files in os.walk(os.path.join(workdir, '.ineeji')):
+        for file_name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, file_name))
+            except OSError:
+                pass
+    return total
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값 목록에서 q 백분위수 반환 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def calibrate(records: int = CALIBRATION_RECORDS, rounds: int = CALIBRATION_ROUNDS) -> float:
+    """
+    고정된 레코드 생성/포맷팅 작업으로 현재 장비의 속도 측정
+
+    로깅 경로와 같은 종류의 작업(LogRecord 생성, % 포맷팅, 문자열 쓰기)이므로
+    기준선을 저장한 장비와 현재 장비의 속도 비율로 시간/처리량 지표를 보정하는 데 사용합니다.
+
+    Args:
+        records: 반복마다 처리할 레코드 수
+        rounds: 반복 횟수 (가장 빠른 반복을 사용하여 일시적인 잡음 제거)
+
+    Returns:
+        초당 처리한 레코드 수
+    """
+    import io
+
+    formatter = logging.Formatter(BASE_CONFIG['format_string'])
+    best = float('inf')
+    for _ in range(rounds):
+        stream = io.StringIO()
+        started = time.perf_counter()
+        for i in range(records):
+            record = logging.LogRecord('bench', logging.INFO, __file__, 0,
+                                       "bench message %d from worker %d order_id=%s", (i, 0, "A1B2C3D4"), None)
+            stream.write(formatter.format(record) + '\n')
+        best = min(best, time.perf_counter() - started)
+    return records / best if best > 0 else 0.0
+
+
+def _build_logger(name: str, workdir: str, config: Dict[str, Any]):
+    """시나리오 설정으로 Logger 생성"""
+    from .logger import Logger
+
+    kwargs = dict(BASE_CONFIG, **config)
+    kwargs['project_name'] = name
+    kwargs['log_file'] = os.path.join(workdir, name, 'app.log') if config.get('log_file') else None
+    return Logger(name, **kwargs)
+
+
+def _persist(logger) -> None:
+    """큐를 비우고 모든 핸들러의 버퍼를 디스크에 기록"""
+    from .logger import Logger
+
+    listener = Logger._listeners.pop(logger.name, None)
+    if listener is not None:
+        listener.stop()  # 큐에 남은 레코드를 모두 처리한 뒤 종료
+    for handler in logger.handlers:
+        handler.flush()
+        encoder = getattr(handler, 'encoder', None)
+        if encoder is not None:
+            encoder.drain()  # 워커 프로세스의 저장 완료까지 포함
+
+
+def _log_mix(logger, i: int, index: int) -> None:
+    """실제 서비스와 비슷한 로그 구성 (INFO 대부분, WARNING 약 10%, 예외가 있는 ERROR 약 1%)"""
+    if i % 100 == 99:
+        try:
+            raise ValueError(f"payment declined for order {i}")
+        except ValueError:
+            logger.exception("order %d failed on worker %d", i, index)
+    elif i % 10 == 9:
+        logger.warning("slow response from %s took %.1f ms", "inventory-api", 250.0 + i % 50)
+    elif i % 2:
+        logger.info("request %s %s completed status=%d user_id=%d", "GET", f"/api/items/{i % 500}", 200, i % 97)
+    else:
+        logger.info("bench message %d from worker %d order_id=%s", i, index, "A1B2C3D4")
+
+
+def _run_workers(logger, messages: int, threads: int, mix: bool = False) -> List[int]:
+    """스레드별로 로그를 기록하고 호출자 지연 시간(ns) 목록 반환 (mix이면 실제 로그 구성으로 기록)"""
+    per_thread = messages // threads
+    latencies: List[List[int]] = [[] for _ in range(threads)]
+    start_barrier = threading.Barrier(threads)
+
+    def worker(index: int):
+        samples = latencies[index]
+        clock = time.perf_counter_ns
+        start_barrier.wait()
+        for i in range(per_thread):
+            before = clock()
+            if mix:
+                _log_mix(logger, i, index)
+            else:
+                logger.info("bench message %d from worker %d order_id=%s", i, index, "A1B2C3D4")
+            samples.append(clock() - before)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return [sample for samples in latencies for sample in samples]
+
+
+def run_scenario(name: str, spec: Dict[str, Any], messages: int, workdir: str) -> Dict[str, Any]:
+    """
+    현재 프로세스에서 단일 시나리오 실행
+
+    Args:
+        name: 시나리오 이름
+        spec: 시나리오 정의 (SCENARIOS 항목)
+        messages: 기록할 전체 메시지 수
+        workdir: 로그를 기록할 임시 디렉토리
+
+    Returns:
+        측정 결과 딕셔너리
+    """
+    # 파케이 경로(~/.ineeji/logs)를 임시 디렉토리로 돌림
+    os.environ['HOME'] = workdir
+    threads = spec.get('threads', 1)
+    logger = _build_logger(f"bench_{name}_{os.getpid()}", workdir, spec['config'])
+    calibration = calibrate()
+
+    cpu_started = _cpu_seconds()
+    started = time.perf_counter()
+    latencies = _run_workers(logger, messages, threads, spec.get('mix', False))
+    enqueued = time.perf_counter()
+    _persist(logger)
+    persisted = time.perf_counter()
+    cpu_seconds = _cpu_seconds() - cpu_started
+    # 시나리오 도중 CPU 속도 변화를 반영하도록 전후 측정값의 평균 사용
+    calibration = (calibration + calibrate()) / 2
+
+    latencies.sort()
+    write_errors = sum(h['write_errors'] for h in logger.stats()['handlers'].values())
+    return {
+        'messages': len(latencies),
+        'latencies_ns': latencies,
+        'call_seconds': enqueued - started,
+        'persist_seconds': persisted - started,
+        'write_errors': write_errors,
+        'cpu_seconds': cpu_seconds,
+        'disk_bytes': _disk_bytes(workdir),
+        'peak_rss_mb': _peak_rss_mb(),
+        'calibration': calibration,
+    }
+
+
+def _summarize(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """원시 측정값을 보고용 지표로 요약"""
+    latencies = raw.pop('latencies_ns')
+    to_us = 1 / 1000.0
+    return {
+        'messages': raw['messages'],
+        'msgs_per_sec': raw['messages'] / raw['persist_seconds'] if raw['persist_seconds'] else 0.0,
+        'call_msgs_per_sec': raw['messages'] / raw['call_seconds'] if raw['call_seconds'] else 0.0,
+        'p50_us': percentile(latencies, 0.50) * to_us,
+        'p99_us': percentile(latencies, 0.99) * to_us,
+        'p999_us': percentile(latencies, 0.999) * to_us,
+        'persist_seconds': raw['persist_seconds'],
+        'write_errors': raw['write_errors'],
+        'cpu_seconds': raw.get('cpu_seconds'),
+        'disk_bytes': raw.get('disk_bytes'),
+        'peak_rss_mb': raw['peak_rss_mb'],
+        'calibration': raw.get('calibration'),
+    }
+
+
+def _process_worker(name: str, spec: Dict[str, Any], messages: int, workdir: str, results) -> None:
+    results.put(run_scenario(name, spec, messages, workdir))
+
+
+def _scenario_entry(name: str, messages: int, result_queue) -> None:
+    """격리된 자식 프로세스에서 시나리오 실행 (spawn 진입점)"""
+    workdir = tempfile.mkdtemp(prefix=f'ineeji_bench_{name}_')
+    try:
+        os.chdir(workdir)
+        spec = SCENARIOS[name]
+        processes = spec.get('processes', 1)
+        if processes == 1:
+            raw = run_scenario(name, spec, messages, workdir)
+        else:
+            ctx = multiprocessing.get_context('spawn')
+            inner = ctx.Queue()
+            per_process = messages // processes
+            procs = [
+                ctx.Process(target=_process_worker, args=(f"{name}_{i}", spec, per_process, workdir, inner))
+                for i in range(processes)
+            ]
+            for p in procs:
+                p.start()
+            parts = [inner.get() for _ in procs]
+            for p in procs:
+                p.join()
+            # 프로세스 기동 시간은 제외하고 가장 늦게 끝난 프로세스 기준으로 집계
+            raw = {
+                'messages': sum(part['messages'] for part in parts),
+                'latencies_ns': sorted(s for part in parts for s in part['latencies_ns']),
+                'call_seconds': max(part['call_seconds'] for part in parts),
+                'persist_seconds': max(part['persist_seconds'] for part in parts),
+                'write_errors': sum(part['write_errors'] for part in parts),
+                'cpu_seconds': sum(part['cpu_seconds'] for part in parts),
+                'disk_bytes': _disk_bytes(workdir),
+                'peak_rss_mb': _peak_rss_mb(include_children=True),
+                'calibration': sum(part['calibration'] for part in parts) / len(parts),
+            }
+        result_queue.put(_summarize(raw))
+    except Exception as e:
+        result_queue.put({'error': f"{type(e).__name__}: {e}"})
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def run_isolated(name: str, messages: int, timeout: float = 600.0) -> Dict[str, Any]:
+    """시나리오를 새 프로세스에서 실행하고 요약 결과 반환"""
+    ctx = multiprocessing.get_context('spawn')
+    result_queue = ctx.Queue()
+    proc = ctx.Process(target=_scenario_entry, args=(name, messages, result_queue))
+    proc.start()
+    try:
+        result = result_queue.get(timeout=timeout)
+    except Exception:
+        proc.terminate()
+        result = {'error': 'timeout'}
+    proc.join()
+    return result
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerances: Optional[Dict[str, float]] = None
+) -> List[str]:
+    """
+    결과를 기준선과 비교하여 회귀 목록 반환
+
+    Args:
+        results: 시나리오별 현재 결과
+        baseline: 시나리오별 기준선 결과
+        tolerances: 지표별 허용 오차 비율
+
+    양쪽 결과에 calibration이 있으면 SPEED_METRICS의 기준선 값을
+    현재/기준선 calibration 비율로 보정한 뒤 비교합니다.
+
+    Returns:
+        회귀 설명 문자열 목록 (비어 있으면 통과)
+    """
+    tolerances = tolerances or DEFAULT_TOLERANCES
+    regressions = []
+    for name, current in results.items():
+        if 'error' in current:
+            regressions.append(f"{name}: 실행 실패 ({current['error']})")
+            continue
+        if current.get('write_errors'):
+            regressions.append(f"{name}: 쓰기 오류 {current['write_errors']}건")
+        reference = baseline.get(name)
+        if not reference or 'error' in reference:
+            continue
+        spec = SCENARIOS.get(name, {})
+        contended = spec.get('threads', 1) > 1 or spec.get('processes', 1) > 1
+        speed_ratio = 1.0
+        if current.get('calibration') and reference.get('calibration'):
+            speed_ratio = current['calibration'] / reference['calibration']
+        for metric, tolerance in tolerances.items():
+            if contended and metric in CONTENDED_SKIP:
+                continue
+            old, new = reference.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            if metric in SPEED_METRICS:
+                # 빠른 장비일수록 처리량은 높고 시간은 짧을 것으로 기대
+                old = old * speed_ratio if metric in HIGHER_IS_BETTER else old / speed_ratio
+            if metric in HIGHER_IS_BETTER:
+                limit = old * (1 - tolerance)
+                failed = new < limit
+            else:
+                limit = old * (1 + tolerance)
+                failed = new > limit
+            if failed:
+                regressions.append(
+                    f"{name}: {metric} {new:.2f} (보정된 기준선 {old:.2f}, 허용 한계 {limit:.2f})"
+                )
+    return regressions
+
+
+def _print_table(results: Dict[str, Dict[str, Any]]) -> None:
+    header = (f"{'scenario':<28}{'msgs/s':>12}{'p50 us':>10}{'p99 us':>10}{'p999 us':>10}{'persist s':>11}"
+              f"{'cpu s':>8}{'disk KB':>10}{'rss MB':>9}")
+    print(header)
+    print('-' * len(header))
+    for name, r in results.items():
+        if 'error' in r:
+            print(f"{name:<28}  ERROR: {r['error']}")
+            continue
+        rss = f"{r['peak_rss_mb']:.1f}" if r['peak_rss_mb'] is not None else '-'
+        cpu = f"{r['cpu_seconds']:.2f}" if r.get('cpu_seconds') is not None else '-'
+        disk = f"{r['disk_bytes'] / 1024:.1f}" if r.get('disk_bytes') is not None else '-'
+        print(f"{name:<28}{r['msgs_per_sec']:>12.0f}{r['p50_us']:>10.1f}{r['p99_us']:>10.1f}"
+              f"{r['p999_us']:>10.1f}{r['persist_seconds']:>11.3f}{cpu:>8}{disk:>10}{rss:>9}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m ineeji_logging.bench', description='ineeji_logging 벤치마크')
+    parser.add_argument('-s', '--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='실행할 시나리오 (여러 번 지정 가능, 기본값: 전체)')
+    parser.add_argument('-n', '--messages', type=int, default=10000, help='시나리오별 메시지 수')
+    parser.add_argument('-o', '--output', default=None, help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='비교할 기준선 JSON 경로')
+    parser.add_argument('--save-baseline', action='store_true', help='결과를 기준선으로 저장')
+    parser.add_argument('--tolerance', type=float, default=None, help='모든 지표에 동일한 허용 오차 적용')
+    args = parser.parse_args(argv)
+
+    names = args.scenario or list(SCENARIOS)
+    results = {}
+    for name in names:
+        print(f"running {name} ({args.messages} messages)...", file=sys.stderr)
+        results[name] = run_isolated(name, args.messages)
+
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'messages': args.messages,
+        'results': results,
+    }
+    _print_table(results)
+
+    output = args.output or f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n결과 저장: {output}")
+
+    if args.save_baseline:
+        directory = os.path.dirname(args.baseline)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"기준선 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"기준선 없음 ({args.baseline}) - --save-baseline으로 먼저 저장하세요", file=sys.stderr)
+        return 2
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('messages') != args.messages:
+        # 메시지 수가 다르면 지연/처리량 분포가 달라 비교 결과를 신뢰할 수 없음
+        print(f"기준선 메시지 수({baseline.get('messages')})가 현재({args.messages})와 달라 비교할 수 없습니다",
+              file=sys.stderr)
+        return 2
+
+    if not all(r.get('calibration') for r in baseline.get('results', {}).values() if 'error' not in r):
+        print("경고: 기준선에 calibration 값이 없는 시나리오는 장비 속도를 보정하지 않습니다")
+
+    tolerances = None
+    if args.tolerance is not None:
+        tolerances = {metric: args.tolerance for metric in DEFAULT_TOLERANCES}
+    regressions = compare(results, baseline.get('results', {}), tolerances)
+    if regressions:
+        print("\n!!! 성능 회귀 감지 !!!")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    print("\n기준선 대비 회귀 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,301 @@
+"""
+Elasticsearch `_bulk` API로 로그를 전송하는 HTTP 핸들러 (NDJSON + gzip)
+"""
+
+import json
+import gzip
+import time
+import queue
+import random
+import logging
+import threading
+import http.client
+from datetime import datetime
+from urllib.parse import urlsplit
+from typing import Optional, Dict, Any, List, Tuple
+
+from .metrics import HandlerStats
+from .context import record_context
+
+
+# 재시도할 HTTP 상태 코드
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class BulkHandler(logging.Handler):
+    """
+    로그 레코드를 `_bulk` NDJSON 본문으로 묶어 전송하는 핸들러
+
+    emit은 현재 배치에 문서를 추가하기만 하며, 완성된 배치는 큐를 거쳐
+    keep-alive 연결을 하나씩 가진 전송 스레드들이 병렬로 전송합니다.
+    (동시에 진행되는 요청 수 = max_in_flight)
+    429/5xx 응답과 연결 오류는 지수 백오프로 재시도하고,
+    응답 항목 중 429/5xx로 실패한 문서만 다시 보냅니다.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        index: str = 'logs-%Y.%m.%d',
+        batch_size: int = 1000,
+        flush_interval: float = 1.0,
+        max_in_flight: int = 2,
+        max_queued_batches: int = 64,
+        compress_level: int = 6,
+        max_retries: int = 5,
+        backoff_initial: float = 0.5,
+        backoff_max: float = 30.0,
+        timeout: float = 10.0,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        벌크 핸들러 초기화
+
+        Args:
+            url: `_bulk` 엔드포인트 URL (예: http://localhost:9200/_bulk)
+            index: 인덱스 이름 (strftime 형식 지원, 레코드 시각 기준)
+            batch_size: 요청 하나에 담을 최대 문서 수
+            flush_interval: 배치를 기다리는 최대 시간 (초)
+            max_in_flight: 동시에 진행할 요청 수 (전송 스레드/연결 수)
+            max_queued_batches: 전송 대기 배치 최대 개수 (초과 시 유실로 집계)
+            compress_level: gzip 압축 레벨 (0이면 압축하지 않음)
+            max_retries: 배치당 최대 재시도 횟수
+            backoff_initial: 재시도 대기 시간 초기값 (초)
+            backoff_max: 재시도 대기 시간 최대값 (초)
+            timeout: 요청 제한 시간 (초)
+            headers: 추가 HTTP 헤더 (예: Authorization)
+        """
+        super().__init__()
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f"지원하지 않는 URL입니다: {url}")
+        self.url = url
+        self.index = index
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.compress_level = compress_level
+        self.max_retries = max_retries
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self._scheme = parts.scheme
+        self._netloc = parts.netloc
+        self._path = parts.path or '/_bulk'
+        if parts.query:
+            self._path += '?' + parts.query
+        self._headers = {'Content-Type': 'application/x-ndjson', 'Connection': 'keep-alive'}
+        if compress_level > 0:
+            self._headers['Content-Encoding'] = 'gzip'
+        self._headers.update(headers or {})
+
+        self.stats = HandlerStats()
+        self.stats.gauges['queued_batches'] = lambda: self._batches.qsize()
+        self.stats.gauges['in_flight'] = lambda: self._in_flight
+        self.stats.gauges['retries'] = lambda: self._retries
+
+        self._batch: List[Tuple[bytes, bytes]] = []  # (action 줄, 문서 줄)
+        self._batch_lock = threading.Lock()
+        self._batch_started = time.monotonic()
+        self._batches: 'queue.Queue[Optional[List[Tuple[bytes, bytes]]]]' = queue.Queue(max_queued_batches)
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self._retries = 0
+        self._stop = threading.Event()
+        self._senders = [
+            threading.Thread(target=self._send_loop, name=f'ineeji-bulk-{i}', daemon=True)
+            for i in range(max_in_flight)
+        ]
+        for sender in self._senders:
+            sender.start()
+        self._ticker = threading.Thread(target=self._tick, name='ineeji-bulk-flush', daemon=True)
+        self._ticker.start()
+
+    # ---- 배치 구성 ----
+
+    def _document(self, record: logging.LogRecord) -> Dict[str, Any]:
+        doc = {
+            '@timestamp': datetime.fromtimestamp(record.created).astimezone().isoformat(),
+            'levelname': record.levelname,
+            'name': record.name,
+            'message': self.format(record),
+            'raw_message': record.getMessage(),
+            'pathname': record.pathname,
+            'lineno': record.lineno,
+            'funcName': record.funcName,
+            'process': record.process,
+            'thread': record.thread,
+        }
+        if record.exc_text:
+            doc['exception'] = record.exc_text
+        context = record_context(record)
+        if context is not None:
+            doc.update(context.values)
+        return doc
+
+    def emit(self, record):
+        """문서를 현재 배치에 추가 (배치가 차면 전송 큐로 넘김)"""
+        try:
+            index = datetime.fromtimestamp(record.created).strftime(self.index)
+            action = json.dumps({'index': {'_index': index}}).encode('utf-8')
+            doc = json.dumps(self._document(record), ensure_ascii=False, default=str).encode('utf-8')
+        except Exception:
+            self.handleError(record)
+            return
+
+        full = None
+        with self._batch_lock:
+            if not self._batch:
+                self._batch_started = time.monotonic()
+            self._batch.append((action, doc))
+            if len(self._batch) >= self.batch_size:
+                full, self._batch = self._batch, []
+        if full:
+            self._enqueue(full)
+
+    def _enqueue(self, batch: List[Tuple[bytes, bytes]]):
+        try:
+            self._batches.put_nowait(batch)
+        except queue.Full:
+            # 전송이 밀리면 애플리케이션을 막지 않고 유실로 집계
+            self.stats.drops.inc(len(batch))
+
+    def _take_partial(self) -> Optional[List[Tuple[bytes, bytes]]]:
+        with self._batch_lock:
+            if not self._batch:
+                return None
+            batch, self._batch = self._batch, []
+            return batch
+
+    def _tick(self):
+        """flush_interval이 지난 미완성 배치를 전송 큐로 넘김"""
+        while not self._stop.wait(self.flush_interval / 2):
+            if self._batch and time.monotonic() - self._batch_started >= self.flush_interval:
+                batch = self._take_partial()
+                if batch:
+                    self._enqueue(batch)
+
+    # ---- 전송 ----
+
+    def _body(self, batch: List[Tuple[bytes, bytes]]) -> bytes:
+        body = b''.join(action + b'\n' + doc + b'\n' for action, doc in batch)
+        if self.compress_level > 0:
+            body = gzip.compress(body, compresslevel=self.compress_level)
+        return body
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self._scheme == 'https':
+            return http.client.HTTPSConnection(self._netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(self._netloc, timeout=self.timeout)
+
+    def _retry_items(self, batch, payload: bytes) -> List[Tuple[bytes, bytes]]:
+        """200 응답 중 재시도할 문서만 골라내고 나머지 실패는 유실로 집계"""
+        try:
+            result = json.loads(payload)
+        except ValueError:
+            return []
+        if not result.get('errors'):
+            return []
+        retry, failed = [], 0
+        for item, entry in zip(result.get('items', []), batch):
+            status = next(iter(item.values()), {}).get('status', 200)
+            if status in RETRY_STATUSES:
+                retry.append(entry)
+            elif status >= 300:
+                failed += 1
+        if failed:
+            self.stats.write_errors.inc()
+            self.stats.drops.inc(failed)
+            self.stats.last_error = f"bulk item errors: {failed}"
+        return retry
+
+    def _send_batch(self, conn_holder: List[Optional[http.client.HTTPConnection]], batch):
+        backoff = self.backoff_initial
+        attempt = 0
+        while batch:
+            start = time.perf_counter()
+            body = self._body(batch)
+            error = None
+            try:
+                if conn_holder[0] is None:
+                    conn_holder[0] = self._connect()
+                conn = conn_holder[0]
+                conn.request('POST', self._path, body=body, headers=self._headers)
+                response = conn.getresponse()
+                payload = response.read()
+                if response.status in RETRY_STATUSES:
+                    error = f"HTTP {response.status}"
+                elif response.status >= 300:
+                    # 재시도해도 성공할 수 없는 오류 (예: 400)
+                    self.stats.record_flush(len(batch), time.perf_counter() - start,
+                                            error=f"HTTP {response.status}: {payload[:200]!r}")
+                    return
+                else:
+                    sent = len(batch)
+                    batch = self._retry_items(batch, payload)
+                    self.stats.record_flush(sent - len(batch), time.perf_counter() - start, len(body))
+                    if batch:
+                        error = "bulk items rejected (429/5xx)"
+                if response.getheader('Connection', '').lower() == 'close':
+                    conn.close()
+                    conn_holder[0] = None
+            except (OSError, http.client.HTTPException) as e:
+                error = f"{type(e).__name__}: {e}"
+                if conn_holder[0] is not None:
+                    conn_holder[0].close()
+                    conn_holder[0] = None
+
+            if error is None:
+                return
+            attempt += 1
+            self.stats.write_errors.inc()
+            self.stats.last_error = error
+            if attempt > self.max_retries:
+                self.stats.drops.inc(len(batch))
+                return
+            self._retries += 1
+            # 지수 백오프 + 지터
+            time.sleep(min(backoff, self.backoff_max) * random.uniform(0.5, 1.0))
+            backoff *= 2
+
+    def _send_loop(self):
+        conn_holder: List[Optional[http.client.HTTPConnection]] = [None]
+        while True:
+            batch = self._batches.get()
+            if batch is None:
+                self._batches.task_done()
+                break
+            with self._in_flight_lock:
+                self._in_flight += 1
+            try:
+                self._send_batch(conn_holder, batch)
+            except Exception as e:
+                self.stats.write_errors.inc()
+                self.stats.last_error = f"{type(e).__name__}: {e}"
+            finally:
+                with self._in_flight_lock:
+                    self._in_flight -= 1
+                self._batches.task_done()
+        if conn_holder[0] is not None:
+            conn_holder[0].close()
+
+    def flush(self):
+        """미완성 배치를 전송 큐로 넘김 (전송 완료는 기다리지 않음)"""
+        batch = self._take_partial()
+        if batch:
+            self._enqueue(batch)
+
+    def wait(self):
+        """큐에 있는 모든 배치가 처리될 때까지 대기"""
+        self.flush()
+        self._batches.join()
+
+    def close(self):
+        """남은 배치를 전송한 뒤 전송 스레드 종료"""
+        if not self._stop.is_set():
+            self._stop.set()
+            self.flush()
+            for _ in self._senders:
+                self._batches.put(None)
+            for sender in self._senders:
+                sender.join(timeout=self.timeout * (self.max_retries + 1))
+        super().close()
@@ -0,0 +1,273 @@
+"""
+로거 설정 파일/환경 변수 읽기와 실행 중 재적용
+
+설정 파일은 JSON(.json) 또는 TOML(.toml)이며 키는 Logger 생성 인자와 같습니다:
+    {"level": "INFO", "parquet_flush_threshold": 500, "levels": {"my_app.db": "DEBUG"}}
+
+환경 변수는 INEEJI_LOG_ 뒤에 대문자 설정 이름을 붙입니다 (파일보다 우선):
+    INEEJI_LOG_LEVEL=DEBUG
+    INEEJI_LOG_PARQUET_FLUSH_THRESHOLD=auto
+    INEEJI_LOG_LEVELS=my_app.db=DEBUG,my_app.http=WARNING
+    INEEJI_LOG_PARQUET_FLUSH_DELAYS=ERROR=0.005,WARNING=1
+
+사용법:
+    watcher = logger.watch_config("logging.json")  # 파일이나 환경 변수가 바뀌면 바뀐 부분만 적용
+"""
+
+import os
+import json
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, Union, Mapping
+
+from .retention import parse_size
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10 이하
+    tomllib = None
+
+
+ENV_PREFIX = 'INEEJI_LOG_'
+
+_TRUE = {'1', 'true', 'yes', 'on'}
+_FALSE = {'0', 'false', 'no', 'off'}
+
+
+def _bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    raise ValueError(f"참/거짓 값이 아닙니다: {value}")
+
+
+def _bool_or_auto(value: str) -> Union[bool, str]:
+    return 'auto' if value.strip().lower() == 'auto' else _bool(value)
+
+
+def _int_or_auto(value: str) -> Union[int, str]:
+    return 'auto' if value.strip().lower() == 'auto' else int(value)
+
+
+def _optional_str(value: str) -> Optional[str]:
+    return value or None
+
+
+def _optional_int(value: str) -> Optional[int]:
+    return int(value) if value.strip() else None
+
+
+def _levels(value: str) -> Dict[str, str]:
+    """'my_app.db=DEBUG,my_app.http=WARNING' 형식의 하위 로거별 레벨"""
+    levels = {}
+    for item in value.split(','):
+        if not item.strip():
+            continue
+        name, sep, level = item.partition('=')
+        if not sep or not name.strip():
+            raise ValueError(f"잘못된 하위 로거 레벨입니다: {item} (이름=레벨 형식)")
+        levels[name.strip()] = level.strip()
+    return levels
+
+
+def _level_delays(value: str) -> Dict[str, float]:
+    """'ERROR=0.005,WARNING=1' 형식의 레벨별 최대 저장 지연 (초)"""
+    delays = {}
+    for item in value.split(','):
+        if not item.strip():
+            continue
+        level, sep, delay = item.partition('=')
+        if not sep or not level.strip():
+            raise ValueError(f"잘못된 레벨별 지연입니다: {item} (레벨=초 형식)")
+        delays[level.strip()] = float(delay)
+    return delays
+
+
+# 환경 변수로 지정할 수 있는 설정과 변환 함수 (extra_handlers는 코드로만 지정)
+_ENV_PARSERS = {
+    'level': str,
+    'levels': _levels,
+    'log_file': _optional_str,
+    'console_output': _bool,
+    'console_mode': str,
+    'colored_console': _bool_or_auto,
+    'format_string': _optional_str,
+    'detailed_format_string': _optional_str,
+    'async_logging': _bool,
+    'project_name': _optional_str,
+    'env': str,
+    'parquet_logging': _bool,
+    'parquet_flush_threshold': _int_or_auto,
+    'parquet_flush_interval': float,
+    'parquet_max_buffer_bytes': parse_size,
+    'parquet_encoder_workers': int,
+    'parquet_merge_by_time': _bool,
+    'parquet_dedupe_exceptions': _bool,
+    'parquet_deferred_formatting': _bool,
+    'parquet_index_messages': _bool,
+    'parquet_storage': str,
+    'parquet_compression': _optional_str,
+    'parquet_compression_level': _optional_int,
+    'parquet_flush_delays': _level_delays,
+}
+
+
+def config_from_env(prefix: str = ENV_PREFIX, environ: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
+    """
+    환경 변수에서 로거 설정 읽기
+
+    Args:
+        prefix: 환경 변수 접두사
+        environ: 읽을 환경 (기본값: os.environ)
+
+    Returns:
+        설정 딕셔너리 (지정된 항목만)
+
+    Raises:
+        ValueError: 값을 변환할 수 없는 경우
+    """
+    environ = os.environ if environ is None else environ
+    config = {}
+    for key, parse in _ENV_PARSERS.items():
+        value = environ.get(prefix + key.upper())
+        if value is None:
+            continue
+        try:
+            config[key] = parse(value)
+        except ValueError as e:
+            raise ValueError(f"{prefix + key.upper()}: {e}") from None
+    return config
+
+
+def load_config(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    설정 파일 읽기
+
+    Args:
+        path: JSON(.json) 또는 TOML(.toml) 파일 경로
+
+    Returns:
+        설정 딕셔너리
+
+    Raises:
+        ValueError: 파일 형식이 잘못된 경우
+        OSError: 파일을 읽을 수 없는 경우
+    """
+    path = Path(os.path.expanduser(str(path)))
+    if path.suffix == '.toml':
+        if tomllib is None:
+            raise ValueError("TOML 설정 파일은 Python 3.11 이상에서 지원합니다")
+        with open(path, 'rb') as f:
+            config = tomllib.load(f)
+    else:
+        with open(path, encoding='utf-8') as f:
+            config = json.load(f)  # json.JSONDecodeError는 ValueError
+    if not isinstance(config, dict):
+        raise ValueError(f"설정 파일의 최상위 값은 객체여야 합니다: {path}")
+    return config
+
+
+def read_config(path: Optional[Union[str, Path]] = None, env_prefix: Optional[str] = ENV_PREFIX) -> Dict[str, Any]:
+    """설정 파일과 환경 변수를 합친 설정 (환경 변수가 우선)"""
+    config = load_config(path) if path is not None else {}
+    if env_prefix is not None:
+        config.update(config_from_env(env_prefix))
+    return config
+
+
+class ConfigWatcher:
+    """
+    설정 파일/환경 변수 변경 감시
+
+    파일의 수정 시각·크기나 환경 변수가 바뀌면 설정을 다시 읽어 Logger.reconfigure로 적용합니다.
+    파일에서 빠진 항목은 감시를 시작할 때의 설정으로 돌아갑니다. 설정이 잘못되면 적용하지 않고
+    last_error에 기록하며 현재 설정을 유지합니다.
+    """
+
+    def __init__(
+        self,
+        logger,
+        path: Optional[Union[str, Path]] = None,
+        env_prefix: Optional[str] = ENV_PREFIX,
+        interval: float = 1.0
+    ):
+        """
+        설정 감시자 초기화
+
+        Args:
+            logger: 설정을 적용할 Logger
+            path: 설정 파일 경로 (없으면 환경 변수만 읽음)
+            env_prefix: 환경 변수 접두사 (None이면 환경 변수를 읽지 않음)
+            interval: 변경 확인 주기 (초)
+        """
+        self.logger = logger
+        self.path = Path(os.path.expanduser(str(path))) if path is not None else None
+        self.env_prefix = env_prefix
+        self.interval = interval
+        self.applied = 0  # 적용한 횟수
+        self.last_error: Optional[str] = None
+        self._baseline = dict(logger._config)
+        self._signature = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _current_signature(self):
+        file_state = None
+        if self.path is not None:
+            try:
+                stat = self.path.stat()
+                file_state = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+        env_state = None
+        if self.env_prefix is not None:
+            env_state = tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith(self.env_prefix)))
+        return file_state, env_state
+
+    def check(self) -> bool:
+        """
+        바뀐 설정이 있으면 적용
+
+        Returns:
+            새 설정을 적용했는지 여부
+        """
+        signature = self._current_signature()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            config = dict(self._baseline)
+            if self.path is None or signature[0] is not None:
+                config.update(read_config(self.path, self.env_prefix))
+            else:
+                # 설정 파일이 없으면 (삭제되었거나 아직 없음) 환경 변수만 적용
+                config.update(read_config(None, self.env_prefix))
+            self.logger.reconfigure(**config)
+        except Exception as e:
+            # 잘못된 설정이 로깅을 멈춰서는 안 됨 (현재 설정 유지)
+            self.last_error = f"{type(e).__name__}: {e}"
+            return False
+        self.last_error = None
+        self.applied += 1
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self) -> 'ConfigWatcher':
+        """현재 설정을 바로 적용하고 백그라운드 감시 시작"""
+        if self._thread is None:
+            self.check()
+            self._thread = threading.Thread(target=self._run, name='ineeji-config', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """감시 중지 (적용한 설정은 유지)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
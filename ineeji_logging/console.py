@@ -0,0 +1,149 @@
+"""
+배치 쓰기를 지원하는 TTY 인식 콘솔 핸들러
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+from typing import Optional, List, Union
+
+from .metrics import HandlerStats
+
+
+# 콘솔 출력 모드
+LINE_MODE = 'line'              # 레코드마다 즉시 쓰고 flush (대화형 터미널용)
+THROUGHPUT_MODE = 'throughput'  # 여러 레코드를 모아 한 번에 쓰기 (컨테이너/수집기용)
+
+
+def stream_supports_color(stream) -> bool:
+    """
+    스트림에 ANSI 색상을 써도 되는지 여부
+
+    NO_COLOR 환경변수가 있으면 항상 False, FORCE_COLOR가 있으면 항상 True,
+    그 외에는 스트림이 TTY일 때만 True를 반환합니다.
+    """
+    if os.environ.get('NO_COLOR'):
+        return False
+    if os.environ.get('FORCE_COLOR'):
+        return True
+    isatty = getattr(stream, 'isatty', None)
+    try:
+        return bool(isatty and isatty())
+    except Exception:
+        return False
+
+
+def resolve_color(colored: Union[bool, str], stream) -> bool:
+    """colored_console 설정값('auto', True, False)을 실제 색상 사용 여부로 변환"""
+    if colored == 'auto':
+        return stream_supports_color(stream)
+    return bool(colored)
+
+
+class BatchedConsoleHandler(logging.StreamHandler):
+    """
+    레코드를 모아 한 번의 write 호출로 출력하는 콘솔 핸들러
+
+    line 모드에서는 StreamHandler와 같이 레코드마다 쓰고 flush하며,
+    throughput 모드에서는 batch_size개가 모이거나 flush_interval이 지나거나
+    flush_level 이상의 레코드가 들어오면 한 번에 출력합니다.
+    """
+
+    def __init__(
+        self,
+        stream=None,
+        mode: str = LINE_MODE,
+        batch_size: int = 256,
+        flush_interval: float = 0.2,
+        flush_level: int = logging.ERROR
+    ):
+        """
+        콘솔 핸들러 초기화
+
+        Args:
+            stream: 출력 스트림 (기본값: sys.stdout)
+            mode: 'line' 또는 'throughput'
+            batch_size: throughput 모드에서 한 번에 쓸 최대 레코드 수
+            flush_interval: throughput 모드에서 버퍼를 비우는 최대 주기 (초)
+            flush_level: 이 레벨 이상의 레코드는 즉시 출력
+        """
+        if mode not in (LINE_MODE, THROUGHPUT_MODE):
+            raise ValueError(f"지원하지 않는 콘솔 모드입니다: {mode}")
+        super().__init__(stream if stream is not None else sys.stdout)
+        self.mode = mode
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.stats = HandlerStats()
+        self._pending: List[str] = []
+        self._stop_flusher = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self.stats.gauges['buffer_size'] = lambda: len(self._pending)
+
+        if mode == THROUGHPUT_MODE:
+            self._flusher = threading.Thread(target=self._flush_periodically, name='ineeji-console-flush', daemon=True)
+            self._flusher.start()
+
+    def _flush_periodically(self):
+        while not self._stop_flusher.wait(self.flush_interval):
+            self.flush()
+
+    def _write_pending(self):
+        """모아둔 레코드를 한 번에 출력 (self.lock을 잡은 상태에서 호출)"""
+        if not self._pending:
+            return
+        lines, self._pending = self._pending, []
+        start = time.perf_counter()
+        data = ''.join(lines)
+        try:
+            self.stream.write(data)
+            self.stream.flush()
+        except Exception as e:
+            self.stats.record_flush(len(lines), time.perf_counter() - start, error=f"{type(e).__name__}: {e}")
+            return
+        self.stats.record_flush(len(lines), time.perf_counter() - start, len(data))
+
+    def emit(self, record):
+        """로그 레코드 처리 (Handler.handle이 self.lock을 잡은 상태로 호출)"""
+        try:
+            msg = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+
+        if self.mode == LINE_MODE:
+            try:
+                self.stream.write(msg)
+                self.stream.flush()
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+            return
+
+        self._pending.append(msg)
+        if len(self._pending) >= self.batch_size or record.levelno >= self.flush_level:
+            self._write_pending()
+
+    def flush(self):
+        """버퍼에 남은 레코드 출력"""
+        self.acquire()
+        try:
+            if self._pending:
+                self._write_pending()
+            elif self.stream and hasattr(self.stream, 'flush'):
+                self.stream.flush()
+        finally:
+            self.release()
+
+    def close(self):
+        """핸들러 종료 시 남은 레코드 출력"""
+        self._stop_flusher.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=self.flush_interval + 1)
+        try:
+            self.flush()
+        finally:
+            super().close()
@@ -0,0 +1,195 @@
+"""
+로그 레코드에 공통 필드(request_id, tenant 등)를 붙이는 컨텍스트 바인딩
+
+필드는 bind()나 logging_context()를 호출할 때 한 번만 정규화/렌더링해 두고,
+레코드에는 미리 계산된 ContextFields 객체 하나만 첨부하므로 로깅 호출마다 딕셔너리를 만들지 않습니다.
+"""
+
+import re
+import json
+import logging
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+
+# LogRecord에 컨텍스트를 첨부하는 속성 이름
+RECORD_ATTR = 'ineeji_context'
+
+# 핸들러가 사용하는 기본 컬럼 이름 (컨텍스트 필드 이름으로 사용할 수 없음)
+RESERVED_FIELDS = frozenset({
+    'datetime', 'created', 'levelno', 'levelname', 'name', 'message', 'raw_message',
+    'pathname', 'lineno', 'funcName', 'exception', 'process', 'thread',
+    'exception_id', 'exception_message', 'template', 'args',
+})
+
+_FIELD_NAME = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+_NEEDS_QUOTE = re.compile(r'[\s"=]')
+
+
+def _render(value: Optional[str]) -> str:
+    if value is None:
+        return '-'
+    if not value or _NEEDS_QUOTE.search(value):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class ContextFields:
+    """
+    미리 계산된 컨텍스트 필드 (불변)
+
+    값은 문자열로 정규화되어(None은 그대로) 파케이 컬럼 타입이 배치마다 달라지지 않으며,
+    텍스트 로그에 붙일 logfmt 형식 문자열도 생성 시점에 만들어 둡니다.
+    """
+
+    __slots__ = ('values', 'text', '_merged')
+
+    def __init__(self, values: Dict[str, Optional[str]]):
+        self.values = values
+        self.text = ' '.join(f'{key}={_render(value)}' for key, value in values.items())
+        self._merged = None  # (덮어쓴 ContextFields, 결과) - 직전 병합 결과 캐시
+
+    @classmethod
+    def build(cls, fields: Dict[str, Any], base: Optional['ContextFields'] = None) -> 'ContextFields':
+        """
+        필드 이름을 검증하고 값을 정규화하여 생성
+
+        Args:
+            fields: 추가할 필드
+            base: 기존 필드 (같은 이름은 fields가 덮어씀)
+
+        Returns:
+            새 ContextFields
+        """
+        values = dict(base.values) if base is not None else {}
+        for key, value in fields.items():
+            if not _FIELD_NAME.match(key) or key in RESERVED_FIELDS:
+                raise ValueError(f"컨텍스트 필드 이름으로 사용할 수 없습니다: {key}")
+            values[key] = None if value is None else str(value)
+        return cls(values)
+
+    def merge(self, other: 'ContextFields') -> 'ContextFields':
+        """other의 필드로 덮어쓴 결과 반환 (같은 조합은 캐시된 객체 재사용)"""
+        if not other.values:
+            return self
+        if not self.values:
+            return other
+        cached = self._merged
+        if cached is not None and cached[0] is other:
+            return cached[1]
+        merged = ContextFields({**self.values, **other.values})
+        self._merged = (other, merged)
+        return merged
+
+    def __bool__(self) -> bool:
+        return bool(self.values)
+
+    def __repr__(self) -> str:
+        return f"ContextFields({self.values!r})"
+
+
+EMPTY_CONTEXT = ContextFields({})
+
+_current: contextvars.ContextVar = contextvars.ContextVar('ineeji_logging_context', default=EMPTY_CONTEXT)
+
+
+@contextmanager
+def logging_context(**fields) -> Iterator[ContextFields]:
+    """
+    블록 안에서 기록되는 모든 레코드에 필드 추가
+
+    contextvars 기반이므로 asyncio 태스크와 스레드마다 독립적으로 유지되며, 중첩하면 필드가 합쳐집니다.
+
+    사용 예:
+        with logging_context(request_id=request.id, tenant=tenant):
+            logger.info("요청 처리")
+    """
+    context = ContextFields.build(fields, base=_current.get())
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
+
+
+def get_context() -> Dict[str, Optional[str]]:
+    """현재 컨텍스트 필드 반환"""
+    return dict(_current.get().values)
+
+
+def record_context(record: logging.LogRecord) -> Optional[ContextFields]:
+    """레코드에 첨부된 컨텍스트 반환 (없으면 None)"""
+    return record.__dict__.get(RECORD_ATTR)
+
+
+class ContextFilter(logging.Filter):
+    """
+    호출한 스레드/태스크의 컨텍스트를 레코드에 첨부하는 필터
+
+    Logger는 로거에 직접 붙은 핸들러(비동기 로깅에서는 큐 핸들러)에서 실행하므로, 하위 로거의 레코드에도
+    적용되고 비동기 로깅에서도 큐 리스너가 아닌 로그를 남긴 태스크의 컨텍스트가 기록됩니다. bind()로 붙은 필드가 컨텍스트보다 우선합니다.
+    """
+
+    def filter(self, record):
+        context = _current.get()
+        bound = record.__dict__.get(RECORD_ATTR)
+        if bound is not None:
+            context = context.merge(bound)
+        if context.values:
+            record.__dict__[RECORD_ATTR] = context
+        return True
+
+
+class BoundLogger:
+    """
+    필드가 바인딩된 자식 로거 (Logger.bind()로 생성)
+
+    바인딩된 필드는 생성 시 한 번만 계산되며, 로깅 호출마다 같은 extra 딕셔너리를 재사용합니다.
+    """
+
+    def __init__(self, logger: logging.Logger, fields: ContextFields):
+        self.logger = logger
+        self.fields = fields
+        self._extra = {RECORD_ATTR: fields}
+
+    def bind(self, **fields) -> 'BoundLogger':
+        """필드를 추가로 바인딩한 새 로거 반환"""
+        return BoundLogger(self.logger, ContextFields.build(fields, base=self.fields))
+
+    def _log(self, level: int, message: Any, args, kwargs):
+        extra = kwargs.pop('extra', None)
+        kwargs['extra'] = {**extra, **self._extra} if extra else self._extra
+        kwargs.setdefault('stacklevel', 3)
+        self.logger.log(level, message, *args, **kwargs)
+
+    def debug(self, message: Any, *args, **kwargs):
+        """디버그 레벨 로그 메시지"""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, message, args, kwargs)
+
+    def info(self, message: Any, *args, **kwargs):
+        """정보 레벨 로그 메시지"""
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, message, args, kwargs)
+
+    def warning(self, message: Any, *args, **kwargs):
+        """경고 레벨 로그 메시지"""
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, message, args, kwargs)
+
+    def error(self, message: Any, *args, **kwargs):
+        """에러 레벨 로그 메시지"""
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, message, args, kwargs)
+
+    def critical(self, message: Any, *args, **kwargs):
+        """치명적 레벨 로그 메시지"""
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self._log(logging.CRITICAL, message, args, kwargs)
+
+    def exception(self, message: Any, *args, exc_info=True, **kwargs):
+        """예외 정보를 포함한 에러 로그"""
+        if self.logger.isEnabledFor(logging.ERROR):
+            kwargs['exc_info'] = exc_info
+            self._log(logging.ERROR, message, args, kwargs)
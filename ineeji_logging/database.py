@@ -0,0 +1,263 @@
+"""
+SQLite에 로그를 배치 저장하는 데이터베이스 핸들러
+"""
+
+import os
+import re
+import time
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from typing import Optional, List, Tuple, Any, Dict
+
+from .metrics import HandlerStats
+
+
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# 한 번에 삭제할 최대 행 수 (쓰기 잠금을 오래 잡지 않도록 나눠서 삭제)
+_DELETE_CHUNK = 10000
+
+
+def _database_path(connection_string: str) -> str:
+    """'sqlite:///path' 또는 파일 경로를 SQLite 파일 경로로 변환"""
+    if connection_string.startswith('sqlite:///'):
+        connection_string = connection_string[len('sqlite:///'):]
+    return os.path.expanduser(connection_string)
+
+
+class DatabaseHandler(logging.Handler):
+    """
+    로그를 SQLite 테이블에 배치 저장하는 핸들러
+
+    배치마다 하나의 트랜잭션에서 executemany로 삽입하며(준비된 문장 재사용),
+    WAL 모드를 사용하므로 쓰는 중에도 다른 연결에서 인덱스 조회가 가능합니다.
+    """
+
+    COLUMNS = ('created', 'datetime', 'levelno', 'levelname', 'name', 'message',
+               'raw_message', 'pathname', 'lineno', 'funcName', 'exception')
+
+    def __init__(
+        self,
+        connection_string: str,
+        table: str = 'logs',
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        retention_days: Optional[float] = None,
+        retention_interval: float = 3600.0,
+        synchronous: str = 'NORMAL'
+    ):
+        """
+        데이터베이스 핸들러 초기화
+
+        Args:
+            connection_string: SQLite 파일 경로 또는 'sqlite:///path'
+            table: 로그 테이블 이름
+            batch_size: 이 개수만큼 쌓이면 저장
+            flush_interval: 배치를 기다리는 최대 시간 (초)
+            retention_days: 보관 기간 (일). 지정하면 오래된 행을 주기적으로 삭제
+            retention_interval: 보관 기간 정리 주기 (초)
+            synchronous: SQLite synchronous 설정 ('OFF', 'NORMAL', 'FULL')
+        """
+        if not _IDENTIFIER.match(table):
+            raise ValueError(f"잘못된 테이블 이름입니다: {table}")
+        if synchronous.upper() not in ('OFF', 'NORMAL', 'FULL', 'EXTRA'):
+            raise ValueError(f"잘못된 synchronous 설정입니다: {synchronous}")
+        super().__init__()
+        self.path = _database_path(connection_string)
+        self.table = table
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retention_days = retention_days
+        self.retention_interval = retention_interval
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(f'PRAGMA synchronous={synchronous.upper()}')
+        self._conn.execute('PRAGMA busy_timeout=5000')
+        self._create_schema()
+        self._insert_sql = (
+            f'INSERT INTO {table} ({", ".join(self.COLUMNS)}) '
+            f'VALUES ({", ".join("?" for _ in self.COLUMNS)})'
+        )
+
+        self.stats = HandlerStats()
+        self.stats.gauges['buffer_size'] = lambda: len(self._rows)
+        self._rows: List[Tuple[Any, ...]] = []
+        self._rows_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._rows_started = time.monotonic()
+        self._last_retention = 0.0
+        self._stop = threading.Event()
+        self._ticker = threading.Thread(target=self._tick, name=f'ineeji-db-{table}', daemon=True)
+        self._ticker.start()
+
+    def _create_schema(self):
+        table = self.table
+        self._conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                id INTEGER PRIMARY KEY,
+                created REAL NOT NULL,
+                datetime TEXT NOT NULL,
+                levelno INTEGER NOT NULL,
+                levelname TEXT NOT NULL,
+                name TEXT NOT NULL,
+                message TEXT,
+                raw_message TEXT,
+                pathname TEXT,
+                lineno INTEGER,
+                funcName TEXT,
+                exception TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_{table}_created ON {table} (created);
+            CREATE INDEX IF NOT EXISTS idx_{table}_level ON {table} (levelno, created);
+            CREATE INDEX IF NOT EXISTS idx_{table}_name ON {table} (name, created);
+        """)
+
+    def emit(self, record):
+        """로그 레코드를 배치에 추가 (배치가 차면 저장)"""
+        try:
+            message = self.format(record)
+            row = (
+                record.created,
+                datetime.fromtimestamp(record.created).isoformat(sep=' '),
+                record.levelno,
+                record.levelname,
+                record.name,
+                message,
+                record.getMessage(),
+                record.pathname,
+                record.lineno,
+                record.funcName,
+                record.exc_text,
+            )
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._rows_lock:
+            if not self._rows:
+                self._rows_started = time.monotonic()
+            self._rows.append(row)
+            full = len(self._rows) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self):
+        """버퍼의 행을 하나의 트랜잭션으로 저장"""
+        # 쓰기 잠금 안에서 버퍼를 가져와야 배치 순서가 뒤바뀌지 않음
+        with self._write_lock:
+            with self._rows_lock:
+                if not self._rows:
+                    return
+                rows, self._rows = self._rows, []
+
+            start = time.perf_counter()
+            try:
+                self._conn.execute('BEGIN')
+                self._conn.executemany(self._insert_sql, rows)
+                self._conn.execute('COMMIT')
+            except sqlite3.Error as e:
+                try:
+                    self._conn.execute('ROLLBACK')
+                except sqlite3.Error:
+                    pass
+                self.stats.record_flush(len(rows), time.perf_counter() - start, error=f"{type(e).__name__}: {e}")
+                return
+        self.stats.record_flush(len(rows), time.perf_counter() - start)
+
+    def delete_older_than(self, seconds: float) -> int:
+        """
+        지정한 시간보다 오래된 행 삭제
+
+        Args:
+            seconds: 현재 시각 기준 보관 시간 (초)
+
+        Returns:
+            삭제한 행 수
+        """
+        cutoff = time.time() - seconds
+        sql = (f'DELETE FROM {self.table} WHERE id IN '
+               f'(SELECT id FROM {self.table} WHERE created < ? ORDER BY created LIMIT {_DELETE_CHUNK})')
+        deleted = 0
+        while True:
+            with self._write_lock:
+                cursor = self._conn.execute(sql, (cutoff,))
+            deleted += cursor.rowcount
+            if cursor.rowcount < _DELETE_CHUNK:
+                return deleted
+
+    def _tick(self):
+        """주기적으로 미완성 배치 저장 및 보관 기간 정리"""
+        while not self._stop.wait(self.flush_interval / 2):
+            try:
+                if self._rows and time.monotonic() - self._rows_started >= self.flush_interval:
+                    self.flush()
+                if self.retention_days is not None and \
+                        time.monotonic() - self._last_retention >= self.retention_interval:
+                    self._last_retention = time.monotonic()
+                    self.delete_older_than(self.retention_days * 86400)
+            except Exception as e:
+                self.stats.write_errors.inc()
+                self.stats.last_error = f"{type(e).__name__}: {e}"
+
+    def query(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        level: Optional[int] = None,
+        name: Optional[str] = None,
+        limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        인덱스를 사용한 로그 조회 (별도 읽기 연결 사용, 쓰기와 동시에 가능)
+
+        Args:
+            start: 시작 시각 (포함)
+            end: 종료 시각 (미포함)
+            level: 최소 로그 레벨
+            name: 로거 이름
+            limit: 최대 행 수
+
+        Returns:
+            행 딕셔너리 목록 (시간순)
+        """
+        clauses, params = [], []
+        if start is not None:
+            clauses.append('created >= ?')
+            params.append(start.timestamp())
+        if end is not None:
+            clauses.append('created < ?')
+            params.append(end.timestamp())
+        if level is not None:
+            clauses.append('levelno >= ?')
+            params.append(level)
+        if name is not None:
+            clauses.append('name = ?')
+            params.append(name)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        sql = f'SELECT {", ".join(self.COLUMNS)} FROM {self.table} {where} ORDER BY created LIMIT ?'
+        params.append(limit)
+
+        reader = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True)
+        try:
+            reader.row_factory = sqlite3.Row
+            return [dict(row) for row in reader.execute(sql, params)]
+        finally:
+            reader.close()
+
+    def close(self):
+        """남은 행을 저장한 뒤 연결 종료"""
+        if not self._stop.is_set():
+            self._stop.set()
+            if self._ticker is not threading.current_thread():
+                self._ticker.join(timeout=self.flush_interval + 1)
+            try:
+                self.flush()
+            finally:
+                self._conn.close()
+        super().close()
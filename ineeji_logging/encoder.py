@@ -0,0 +1,396 @@
+"""
+파케이 인코딩을 별도 프로세스로 넘기는 인코더 풀
+
+로깅 프로세스는 버퍼링과 가벼운 컬럼 직렬화만 수행하고,
+DataFrame 생성과 파케이 인코딩(저장 백엔드)은 GIL을 공유하지 않는 워커 프로세스가 담당합니다.
+배치는 딕셔너리 목록을 pickle하는 대신 컬럼 단위 바이너리 프레임으로 전달됩니다.
+"""
+
+import time
+import struct
+import atexit
+import itertools
+import threading
+import multiprocessing
+from array import array
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+
+import pandas as pd
+
+
+_MAGIC = b'ILB1'
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# 사전 인코딩으로 저장할 컬럼 (값의 종류가 적고 반복이 많음)
+DICTIONARY_COLUMNS = ('template',)
+
+# 로우 그룹당 최대 행 수 (읽는 쪽이 최근 로우 그룹만 골라 읽을 수 있도록 파일을 나눠 저장)
+ROW_GROUP_ROWS = 50000
+
+# 컬럼 타입 코드
+_STR, _INT, _FLOAT, _DATETIME = b's', b'i', b'f', b'd'
+
+# 프레임 플래그: 저장 후 메시지 토큰 색인 갱신
+_FLAG_INDEX = 0x01
+
+
+def append_parquet(log_file: Path, df: pd.DataFrame, index_messages: bool = False,
+                   compression: Any = 'snappy') -> int:
+    """
+    기존 파케이 파일에 DataFrame을 추가하여 저장
+
+    Args:
+        log_file: 파케이 파일 경로
+        df: 추가할 로그 DataFrame
+        index_messages: 저장 후 같은 파티션의 메시지 토큰 색인(index.parquet)에 새 행 추가
+        compression: fastparquet 압축 설정 ('SNAPPY', 'ZSTD', {'_default': {'type': ..., 'args': ...}} 등)
+
+    Returns:
+        저장된 파일 크기 (바이트)
+    """
+    batch, base_row = df, 0
+    # 기존 파일이 있으면 추가, 없으면 새로 생성
+    try:
+        if log_file.exists():
+            existing_df = pd.read_parquet(log_file)
+            base_row = len(existing_df)
+            df = pd.concat([existing_df, df], ignore_index=True)
+    except Exception:
+        # 파일 읽기 실패 시 새로 저장
+        pass
+
+    # 반복이 많은 컬럼은 사전(dictionary) 인코딩으로 저장
+    for column in DICTIONARY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    
+    # 파케이 파일로 저장
+    df.to_parquet(log_file, index=False, engine='fastparquet', compression=compression,
+                  row_group_offsets=ROW_GROUP_ROWS)
+    if index_messages:
+        from .search import update_index
+        update_index(log_file.parent, batch, base_row)
+    return log_file.stat().st_size
+
+
+def _column_type(values: List[Any]) -> bytes:
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            return _STR
+        if isinstance(value, int):
+            return _INT
+        if isinstance(value, float):
+            return _FLOAT
+        if isinstance(value, datetime):
+            return _DATETIME
+        return _STR
+    return _STR
+
+
+def encode_batch(batch_id: int, log_file: str, records: List[Dict[str, Any]],
+                 index_messages: bool = False) -> bytes:
+    """
+    로그 레코드 목록을 컬럼 단위 바이너리 프레임으로 직렬화
+
+    Args:
+        batch_id: 배치 식별자
+        log_file: 배치를 저장할 파케이 파일 경로
+        records: 로그 레코드 딕셔너리 목록
+        index_messages: 워커가 저장 후 메시지 토큰 색인을 갱신할지 여부
+
+    Returns:
+        바이너리 프레임
+    """
+    columns: Dict[str, None] = {}
+    for record in records:
+        for key in record:
+            columns.setdefault(key)
+
+    path = log_file.encode('utf-8')
+    parts = [_MAGIC, struct.pack('<I', len(path)), path,
+             struct.pack('<QIHB', batch_id, len(records), len(columns), _FLAG_INDEX if index_messages else 0)]
+
+    for name in columns:
+        values = [record.get(name) for record in records]
+        kind = _column_type(values)
+        has_nulls = any(value is None for value in values)
+        encoded_name = name.encode('utf-8')
+        parts.append(struct.pack('<H', len(encoded_name)))
+        parts.append(encoded_name)
+        parts.append(kind)
+        parts.append(b'\x01' if has_nulls else b'\x00')
+        if has_nulls:
+            parts.append(bytes(0 if value is None else 1 for value in values))
+
+        if kind == _STR:
+            encoded = [b'' if value is None else str(value).encode('utf-8') for value in values]
+            offsets = array('q', [0])
+            position = 0
+            for item in encoded:
+                position += len(item)
+                offsets.append(position)
+            parts.append(offsets.tobytes())
+            parts.append(b''.join(encoded))
+        elif kind == _INT:
+            parts.append(array('q', [0 if value is None else value for value in values]).tobytes())
+        elif kind == _FLOAT:
+            parts.append(array('d', [0.0 if value is None else value for value in values]).tobytes())
+        else:
+            parts.append(array('q', [
+                0 if value is None else (value - _EPOCH) // _MICROSECOND for value in values
+            ]).tobytes())
+
+    return b''.join(parts)
+
+
+def read_header(frame: bytes) -> Tuple[int, str, int, int, int]:
+    """프레임 헤더를 읽어 (batch_id, 파일 경로, 레코드 수, 플래그, 본문 시작 위치) 반환"""
+    if frame[:4] != _MAGIC:
+        raise ValueError("잘못된 배치 프레임입니다")
+    (path_len,) = struct.unpack_from('<I', frame, 4)
+    offset = 8 + path_len
+    path = frame[8:offset].decode('utf-8')
+    batch_id, n_rows, _, flags = struct.unpack_from('<QIHB', frame, offset)
+    return batch_id, path, n_rows, flags, offset
+
+
+def decode_batch(frame: bytes) -> Tuple[int, str, pd.DataFrame]:
+    """
+    바이너리 프레임을 DataFrame으로 복원
+
+    Args:
+        frame: encode_batch로 만든 프레임
+
+    Returns:
+        (batch_id, 파일 경로, DataFrame)
+    """
+    batch_id, path, n_rows, _, offset = read_header(frame)
+    (n_cols,) = struct.unpack_from('<H', frame, offset + 12)
+    offset += 15
+    view = memoryview(frame)
+    data: Dict[str, Any] = {}
+
+    for _ in range(n_cols):
+        (name_len,) = struct.unpack_from('<H', frame, offset)
+        offset += 2
+        name = frame[offset:offset + name_len].decode('utf-8')
+        offset += name_len
+        kind = frame[offset:offset + 1]
+        has_nulls = frame[offset + 1] == 1
+        offset += 2
+        mask = None
+        if has_nulls:
+            mask = frame[offset:offset + n_rows]
+            offset += n_rows
+
+        if kind == _STR:
+            offsets = array('q')
+            offsets.frombytes(view[offset:offset + 8 * (n_rows + 1)])
+            offset += 8 * (n_rows + 1)
+            blob = frame[offset:offset + offsets[-1]]
+            offset += offsets[-1]
+            values = [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(n_rows)]
+        else:
+            numbers = array('d' if kind == _FLOAT else 'q')
+            numbers.frombytes(view[offset:offset + 8 * n_rows])
+            offset += 8 * n_rows
+            values = numbers.tolist()
+
+        if mask is not None:
+            values = [value if mask[i] else None for i, value in enumerate(values)]
+        if kind == _DATETIME:
+            data[name] = pd.to_datetime(pd.Series(values, dtype='float64'), unit='us')
+        else:
+            data[name] = values
+
+    return batch_id, path, pd.DataFrame(data)
+
+
+def _encoder_main(conn, storage=None) -> None:
+    """워커 프로세스 진입점: 프레임을 받아 저장 백엔드로 저장하고 결과 회신"""
+    if storage is None:
+        from .storage import FastParquetBackend
+        storage = FastParquetBackend()
+    while True:
+        try:
+            frame = conn.recv_bytes()
+        except (EOFError, OSError):
+            break
+        if not frame:
+            break  # 종료 신호
+
+        start = time.perf_counter()
+        batch_id, n_rows = None, 0
+        try:
+            batch_id, _, n_rows, flags, _ = read_header(frame)
+            _, log_file, df = decode_batch(frame)
+            written = storage.append_frame(Path(log_file), df, index_messages=bool(flags & _FLAG_INDEX))
+            conn.send((batch_id, n_rows, time.perf_counter() - start, written, None))
+        except Exception as e:
+            conn.send((batch_id, n_rows, time.perf_counter() - start, 0, f"{type(e).__name__}: {e}"))
+    conn.close()
+
+
+class ParquetEncoderPool:
+    """
+    파케이 인코딩 워커 프로세스 풀
+
+    같은 파일로 가는 배치는 항상 같은 워커로 보내 파일 내 순서를 보장합니다.
+    """
+
+    _pools: List['ParquetEncoderPool'] = []  # 종료 시 정리할 풀
+
+    def __init__(self, workers: int = 1, storage=None):
+        """
+        인코더 풀 초기화
+
+        Args:
+            workers: 워커 프로세스 수
+            storage: 워커가 배치를 저장할 StorageBackend (기본값: fastparquet/snappy)
+        """
+        if workers < 1:
+            raise ValueError("workers는 1 이상이어야 합니다")
+        ctx = multiprocessing.get_context('spawn')
+        self._ids = itertools.count()
+        self._pending: Dict[int, Tuple[int, Any]] = {}  # batch_id -> (워커 번호, 메트릭)
+        self._pending_cond = threading.Condition()
+        self._workers = []
+        self._closed = False
+        self.storage = storage
+
+        for index in range(workers):
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(
+                target=_encoder_main, args=(child_conn, storage), name=f'ineeji-parquet-encoder-{index}', daemon=True
+            )
+            process.start()
+            child_conn.close()
+            reader = threading.Thread(
+                target=self._read_results, args=(index, parent_conn),
+                name=f'ineeji-parquet-encoder-results-{index}', daemon=True
+            )
+            self._workers.append({'process': process, 'conn': parent_conn,
+                                  'lock': threading.Lock(), 'reader': reader, 'alive': True})
+            reader.start()
+
+        ParquetEncoderPool._pools.append(self)
+        if len(ParquetEncoderPool._pools) == 1:
+            atexit.register(ParquetEncoderPool._close_all)
+
+    @classmethod
+    def _close_all(cls):
+        """프로그램 종료 시 모든 풀 정리"""
+        for pool in list(cls._pools):
+            try:
+                pool.close()
+            except Exception:
+                pass
+
+    @property
+    def in_flight(self) -> int:
+        """처리 대기 중인 배치 수"""
+        with self._pending_cond:
+            return len(self._pending)
+
+    def _finish(self, batch_id: Optional[int], elapsed: float, written: int, error: Optional[str]):
+        with self._pending_cond:
+            entry = self._pending.pop(batch_id, None)
+            self._pending_cond.notify_all()
+        if entry is None:
+            return
+        rows, stats = entry[1]
+        if stats is not None:
+            stats.record_flush(rows, elapsed, written, error)
+
+    def _read_results(self, index: int, conn):
+        """워커 결과를 받아 핸들러 메트릭에 반영"""
+        while True:
+            try:
+                batch_id, _, elapsed, written, error = conn.recv()
+            except (EOFError, OSError):
+                break
+            self._finish(batch_id, elapsed, written, error)
+
+        # 워커가 종료되면 남은 배치는 유실로 처리
+        self._workers[index]['alive'] = False
+        with self._pending_cond:
+            lost = [batch_id for batch_id, (worker, _) in self._pending.items() if worker == index]
+        for batch_id in lost:
+            self._finish(batch_id, 0.0, 0, 'EncoderWorkerExited: 인코더 워커가 종료되었습니다')
+
+    def submit(self, log_file: Path, records: List[Dict[str, Any]], stats=None, index_messages: bool = False) -> bool:
+        """
+        배치를 워커에 전달
+
+        Args:
+            log_file: 저장할 파케이 파일 경로
+            records: 로그 레코드 목록
+            stats: 결과를 반영할 HandlerStats
+            index_messages: 저장 후 메시지 토큰 색인 갱신 여부
+
+        Returns:
+            전달 성공 여부 (False이면 호출자가 직접 저장해야 함)
+        """
+        if self._closed:
+            return False
+        path = str(log_file)
+        index = hash(path) % len(self._workers)
+        worker = self._workers[index]
+        if not worker['alive']:
+            return False
+
+        batch_id = next(self._ids)
+        frame = encode_batch(batch_id, path, records, index_messages)
+        with self._pending_cond:
+            self._pending[batch_id] = (index, (len(records), stats))
+        try:
+            with worker['lock']:
+                worker['conn'].send_bytes(frame)
+        except (OSError, ValueError):
+            worker['alive'] = False
+            with self._pending_cond:
+                self._pending.pop(batch_id, None)
+                self._pending_cond.notify_all()
+            return False
+        return True
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        전달한 모든 배치가 저장될 때까지 대기
+
+        Returns:
+            제한 시간 안에 모두 처리되었는지 여부
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._pending_cond:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._pending_cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 30.0):
+        """남은 배치를 처리한 뒤 워커 종료"""
+        if self._closed:
+            return
+        self.drain(timeout)
+        self._closed = True
+        for worker in self._workers:
+            try:
+                with worker['lock']:
+                    worker['conn'].send_bytes(b'')
+            except (OSError, ValueError):
+                pass
+        for worker in self._workers:
+            worker['process'].join(timeout=5)
+            if worker['process'].is_alive():
+                worker['process'].terminate()
+            worker['conn'].close()
+        if self in ParquetEncoderPool._pools:
+            ParquetEncoderPool._pools.remove(self)
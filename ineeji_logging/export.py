@@ -0,0 +1,142 @@
+"""
+파케이 로그를 CSV / JSON Lines로 내보내기
+
+사용법:
+    python -m ineeji_logging export --project my_app --env production --since 2024-01-01 -o logs.csv
+    python -m ineeji_logging export --project my_app --format jsonl --level ERROR -o errors.jsonl
+
+로우 그룹 하나씩 읽어 변환 후 바로 쓰므로 메모리 사용량은 전체 기간이 아니라 로우 그룹 크기에 비례합니다.
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Optional, Union, List, IO
+
+import pandas as pd
+
+from .reader import list_partitions, iter_row_groups, filter_logs, parse_level, log_columns
+from .fingerprint import attach_tracebacks
+from .templates import rebuild_messages
+
+
+EXPORT_FORMATS = ('csv', 'jsonl')
+
+
+def _output_columns(partitions: List[Path], columns: Optional[List[str]]) -> List[str]:
+    """파티션 footer만 읽어 출력 컬럼 순서 결정 (파티션마다 컨텍스트 컬럼이 달라도 같은 열 구성 유지)"""
+    if columns is not None:
+        return list(columns)
+    result = []
+    for partition in partitions:
+        for column in log_columns(partition):
+            if column not in result:
+                result.append(column)
+    # 읽을 때 복원되는 컬럼
+    if 'template' in result and 'raw_message' not in result:
+        result.append('raw_message')
+    if 'exception_id' in result and 'exception' not in result:
+        result.append('exception')
+    return result
+
+
+def _write_chunk(df: pd.DataFrame, out: IO[str], fmt: str, header: bool):
+    if fmt == 'csv':
+        df.to_csv(out, index=False, header=header, date_format='%Y-%m-%d %H:%M:%S.%f')
+    else:
+        text = df.to_json(orient='records', lines=True, force_ascii=False, date_format='iso', date_unit='us')
+        # 오래된 pandas는 마지막 줄바꿈을 붙이지 않으므로 청크 경계가 붙지 않도록 보정
+        out.write(text if text.endswith('\n') else text + '\n')
+
+
+def export_logs(
+    base_path: Union[str, Path],
+    project_name: str,
+    env: str,
+    out: IO[str],
+    fmt: str = 'csv',
+    since: Optional[Union[date, str]] = None,
+    until: Optional[Union[date, str]] = None,
+    level: Optional[str] = None,
+    name: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    tracebacks: bool = True
+) -> int:
+    """
+    날짜 파티션들의 파케이 로그를 로우 그룹 단위로 내보내기
+
+    Args:
+        base_path: 기본 로그 저장 경로
+        project_name: 프로젝트 이름
+        env: 환경 이름
+        out: 출력 텍스트 스트림
+        fmt: 출력 형식 ('csv' 또는 'jsonl')
+        since: 시작 날짜 (포함)
+        until: 종료 날짜 (포함)
+        level: 최소 로그 레벨
+        name: 로거 이름 (하위 로거 포함)
+        columns: 출력할 컬럼 (기본값: 전체)
+        tracebacks: exception 컬럼에 전체 트레이스백 복원 여부
+
+    Returns:
+        내보낸 행 수
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+    min_level = parse_level(level)
+    partitions = list_partitions(base_path, project_name, env, since, until)
+    output_columns = _output_columns(partitions, columns)
+
+    rows = 0
+    for partition in partitions:
+        for chunk in iter_row_groups(partition):
+            chunk = filter_logs(chunk, min_level, name)
+            if chunk.empty:
+                continue
+            chunk = rebuild_messages(chunk)
+            if tracebacks:
+                chunk = attach_tracebacks(chunk, partition)
+            _write_chunk(chunk.reindex(columns=output_columns), out, fmt, header=rows == 0)
+            rows += len(chunk)
+    return rows
+
+
+# ---- CLI ----
+
+def add_arguments(parser):
+    """export 하위 명령 인자 등록"""
+    parser.add_argument('--project', required=True, help='프로젝트 이름')
+    parser.add_argument('--env', default='development', help='환경 이름 (기본값: development)')
+    parser.add_argument('--base-path', default='~/.ineeji/logs', help='파케이 로그 기본 경로')
+    parser.add_argument('--since', default=None, help='시작 날짜 (YYYY-MM-DD, 포함)')
+    parser.add_argument('--until', default=None, help='종료 날짜 (YYYY-MM-DD, 포함)')
+    parser.add_argument('--level', default=None, help='최소 로그 레벨 (예: ERROR)')
+    parser.add_argument('--name', default=None, help='로거 이름 (하위 로거 포함)')
+    parser.add_argument('--columns', default=None, help='출력할 컬럼 (쉼표로 구분)')
+    parser.add_argument('--format', choices=EXPORT_FORMATS, default=None,
+                        help='출력 형식 (기본값: 출력 파일 확장자, 없으면 csv)')
+    parser.add_argument('--no-tracebacks', action='store_true', help='전체 트레이스백을 복원하지 않음')
+    parser.add_argument('-o', '--output', default=None, help='출력 파일 경로 (기본값: 표준 출력)')
+    parser.set_defaults(func=run)
+
+
+def run(args) -> int:
+    """export 하위 명령 실행"""
+    fmt = args.format
+    if fmt is None:
+        fmt = 'jsonl' if args.output and args.output.endswith(('.jsonl', '.ndjson')) else 'csv'
+    columns = [column.strip() for column in args.columns.split(',')] if args.columns else None
+
+    out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        rows = export_logs(args.base_path, args.project, args.env, out, fmt=fmt, since=args.since,
+                           until=args.until, level=args.level, name=args.name, columns=columns,
+                           tracebacks=not args.no_tracebacks)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"{rows}건 내보냄", file=sys.stderr)
+    return 0
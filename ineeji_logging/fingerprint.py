@@ -0,0 +1,248 @@
+"""
+예외 지문(fingerprint) 계산과 파티션별 트레이스백 중복 제거 저장
+
+같은 위치에서 반복되는 예외는 예외 타입과 정규화된 프레임(파일, 함수, 라인)이 같으므로
+지문이 같습니다. 트레이스백 본문은 지문별로 한 번만 포맷해 캐시하고, 파케이에는 날짜 파티션마다
+`exceptions.parquet`에 한 번만 저장하며 로그 행에는 지문(exception_id)과 예외 메시지만 남깁니다.
+"""
+
+import io
+import os
+import hashlib
+import logging
+import threading
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Set
+
+import pandas as pd
+
+from .encoder import append_parquet
+
+
+# 파티션 디렉토리 안의 트레이스백 테이블 파일 이름
+EXCEPTIONS_FILE = 'exceptions.parquet'
+
+# 지문별 트레이스백 캐시 최대 크기
+_CACHE_SIZE = 1024
+
+_SITE_PACKAGES = os.sep + 'site-packages' + os.sep
+
+
+def _normalize_filename(filename: str) -> str:
+    """설치 위치에 따라 달라지는 경로 앞부분 제거"""
+    index = filename.rfind(_SITE_PACKAGES)
+    if index >= 0:
+        return filename[index + len(_SITE_PACKAGES):]
+    return os.path.normcase(filename)
+
+
+def exception_fingerprint(exc_info) -> str:
+    """
+    예외 지문 계산
+
+    예외 타입과 정규화된 프레임(파일, 함수, 라인)으로 계산하며 예외 메시지는 포함하지 않습니다.
+    연결된 예외(__cause__, __context__)도 포함됩니다.
+
+    Args:
+        exc_info: (타입, 예외, 트레이스백) 튜플
+
+    Returns:
+        16자리 16진수 지문
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    exc_type, exc, tb = exc_info
+    seen = set()
+    while True:
+        digest.update(f"{exc_type.__module__}.{exc_type.__qualname__}\n".encode('utf-8'))
+        while tb is not None:
+            code = tb.tb_frame.f_code
+            digest.update(f"{_normalize_filename(code.co_filename)}:{code.co_name}:{tb.tb_lineno}\n".encode('utf-8'))
+            tb = tb.tb_next
+        if exc is None:
+            break
+        seen.add(id(exc))
+        exc = exc.__cause__ or (None if exc.__suppress_context__ else exc.__context__)
+        if exc is None or id(exc) in seen:
+            break
+        exc_type, tb = type(exc), exc.__traceback__
+        digest.update(b'--\n')
+    return digest.hexdigest()
+
+
+def _format_exception(exc_info) -> str:
+    """logging.Formatter.formatException과 같은 형식으로 트레이스백 포맷"""
+    sio = io.StringIO()
+    traceback.print_exception(exc_info[0], exc_info[1], exc_info[2], None, sio)
+    text = sio.getvalue()
+    sio.close()
+    if text[-1:] == "\n":
+        text = text[:-1]
+    return text
+
+
+def _is_chained(exc: Optional[BaseException]) -> bool:
+    """트레이스백에 연결된 예외(__cause__, 표시되는 __context__)가 함께 출력되는지 여부"""
+    if exc is None:
+        return False
+    return exc.__cause__ is not None or (exc.__context__ is not None and not exc.__suppress_context__)
+
+
+class ExceptionFingerprinter:
+    """
+    지문별로 트레이스백 포맷 결과를 캐시하는 예외 기술자
+
+    같은 지문의 예외는 프레임 부분을 다시 포맷하지 않고, 달라질 수 있는 예외 메시지만 새로 만듭니다.
+    연결된 예외는 앞쪽 예외의 메시지도 달라질 수 있으므로 캐시하지 않습니다.
+    """
+
+    def __init__(self, cache_size: int = _CACHE_SIZE):
+        self.cache_size = cache_size
+        self._stacks: Dict[str, str] = {}  # 지문 -> 예외 메시지를 뺀 트레이스백
+        self.hits = 0
+        self.misses = 0
+
+    def describe(self, record: logging.LogRecord) -> bool:
+        """
+        레코드에 예외 지문과 메시지를 첨부하고 exc_text 설정
+
+        Returns:
+            예외 정보가 있어 첨부했는지 여부
+        """
+        exc_info = record.exc_info
+        if not exc_info or exc_info[0] is None or hasattr(record, 'exception_id'):
+            return False
+
+        fingerprint = exception_fingerprint(exc_info)
+        message = ''.join(traceback.format_exception_only(exc_info[0], exc_info[1])).rstrip('\n')
+        # 연결된 예외는 앞쪽 예외의 메시지가 트레이스백 중간에 들어가므로 캐시하지 않고 매번 포맷
+        chained = _is_chained(exc_info[1])
+        stack = None if chained else self._stacks.get(fingerprint)
+        if stack is None:
+            self.misses += 1
+            text = _format_exception(exc_info)
+            stack = text[:len(text) - len(message)] if text.endswith(message) else text + '\n'
+            if not chained:
+                if len(self._stacks) >= self.cache_size:
+                    self._stacks.clear()
+                self._stacks[fingerprint] = stack
+        else:
+            self.hits += 1
+
+        record.exception_id = fingerprint
+        record.exception_type = exc_info[0].__qualname__
+        record.exception_message = message
+        record.exception_stack = None if chained else stack  # None이면 지문별로 공유할 수 없는 트레이스백
+        if not record.exc_text:
+            record.exc_text = stack + message
+        return True
+
+
+class ExceptionFilter(logging.Filter):
+    """
+    호출자 쪽에서 예외 지문을 계산하는 필터 (Logger는 로거에 직접 붙은 핸들러에서 실행)
+
+    트레이스백 객체는 큐를 건너지 못하므로 비동기 로깅에서도 지문은 로그를 남긴 스레드에서 계산합니다.
+    """
+
+    def __init__(self, fingerprinter: Optional[ExceptionFingerprinter] = None):
+        super().__init__()
+        self.fingerprinter = fingerprinter or ExceptionFingerprinter()
+
+    def filter(self, record):
+        if record.exc_info:
+            self.fingerprinter.describe(record)
+        return True
+
+
+class TracebackStore:
+    """
+    날짜 파티션별 트레이스백 테이블 (exceptions.parquet) 관리
+
+    파티션마다 이미 저장된 지문을 기억하여 새 지문의 트레이스백만 추가합니다.
+    """
+
+    def __init__(self):
+        self._known: Dict[Path, Set[str]] = {}
+        self._pending: Dict[str, Dict[str, Any]] = {}  # 아직 저장하지 않았을 수 있는 트레이스백
+        self._lock = threading.Lock()
+
+    def remember(self, record: logging.LogRecord, created: datetime):
+        """emit 시점에 레코드의 트레이스백을 보관 (같은 지문은 처음 것만)"""
+        fingerprint = record.exception_id
+        if fingerprint not in self._pending:
+            self._pending[fingerprint] = {
+                'exception_id': fingerprint,
+                'exception_type': record.exception_type,
+                'traceback': record.exception_stack,
+                'first_seen': created,
+            }
+
+    def _known_ids(self, partition: Path) -> Set[str]:
+        known = self._known.get(partition)
+        if known is None:
+            known = set()
+            table = partition / EXCEPTIONS_FILE
+            if table.exists():
+                try:
+                    known.update(pd.read_parquet(table, columns=['exception_id'])['exception_id'])
+                except Exception:
+                    pass
+            self._known = {partition: known}  # 지난 파티션은 다시 쓰지 않으므로 현재 것만 유지
+        return known
+
+    def store(self, partition: Path, records: List[Dict[str, Any]]) -> int:
+        """
+        배치에 나온 지문 중 파티션에 없는 트레이스백 저장
+
+        Args:
+            partition: 날짜 파티션 디렉토리
+            records: 저장한 로그 레코드 배치
+
+        Returns:
+            새로 저장한 트레이스백 수
+        """
+        ids = {record['exception_id'] for record in records if record.get('exception_id')}
+        if not ids:
+            return 0
+        with self._lock:
+            known = self._known_ids(partition)
+            new_rows = [self._pending[i] for i in ids - known if i in self._pending]
+            if not new_rows:
+                return 0
+            append_parquet(partition / EXCEPTIONS_FILE, pd.DataFrame(new_rows))
+            known.update(row['exception_id'] for row in new_rows)
+            if len(self._pending) > _CACHE_SIZE:
+                # 파티션에 이미 저장한 지문만 정리 (버퍼에 남은 행이 가리키는 트레이스백은 유지)
+                # emit 쪽 remember와 겹쳐도 새 지문이 사라지지 않도록 딕셔너리를 바꾸지 않고 제자리에서 삭제
+                for fingerprint in [i for i in self._pending if i in known]:
+                    self._pending.pop(fingerprint, None)
+        return len(new_rows)
+
+
+def attach_tracebacks(df: pd.DataFrame, partition: Path) -> pd.DataFrame:
+    """
+    트레이스백 테이블을 합쳐 exception 컬럼에 전체 예외 텍스트 복원
+
+    Args:
+        df: 파티션의 로그 DataFrame
+        partition: exceptions.parquet가 있는 날짜 파티션 디렉토리
+
+    Returns:
+        exception_id가 있는 행의 exception 컬럼에 전체 트레이스백이 채워진 DataFrame
+    """
+    table = partition / EXCEPTIONS_FILE
+    if 'exception_id' not in df.columns or not table.exists():
+        return df
+
+    stacks = pd.read_parquet(table, columns=['exception_id', 'traceback'])
+    stacks = stacks.drop_duplicates('exception_id').set_index('exception_id')['traceback']
+    stack = df['exception_id'].map(stacks)
+    rebuilt = stack + df['exception_message'].fillna('')
+    if 'exception' in df.columns:
+        # 행에 전체 트레이스백이 있으면(연결된 예외) 그대로 사용
+        df['exception'] = df['exception'].where(df['exception'].notna(), rebuilt.where(stack.notna(), None))
+    else:
+        df['exception'] = rebuilt.where(stack.notna(), None)
+    return df
@@ -0,0 +1,117 @@
+"""
+관측된 로그 유입률에 맞춰 스스로 조정되는 플러시 임계값
+"""
+
+import time
+import threading
+from typing import Optional, Dict, Any
+
+
+class AdaptiveFlushPolicy:
+    """
+    적응형 플러시 정책
+
+    유입률(EWMA)에 목표 플러시 주기를 곱해 배치 크기를 정합니다.
+    부하가 높으면 배치를 키워 큰(저렴한) 파케이 쓰기를 하고,
+    트래픽이 적으면 배치를 줄여 지연 시간을 낮춥니다.
+    버퍼 메모리 한도를 넘지 않도록 레코드당 평균 크기로 상한을 둡니다.
+    """
+
+    def __init__(
+        self,
+        target_interval: float = 1.0,
+        min_threshold: int = 10,
+        max_threshold: int = 20000,
+        max_buffer_bytes: int = 64 * 1024 * 1024,
+        initial_threshold: int = 100,
+        smoothing: float = 0.3
+    ):
+        """
+        적응형 플러시 정책 초기화
+
+        Args:
+            target_interval: 목표 플러시 주기 (초). 버퍼가 이보다 오래되면 임계값과 무관하게 플러시
+            min_threshold: 임계값 하한
+            max_threshold: 임계값 상한
+            max_buffer_bytes: 버퍼 메모리 한도 (바이트, 추정치 기준)
+            initial_threshold: 관측 전 초기 임계값
+            smoothing: 유입률 EWMA 가중치 (0~1, 클수록 최근 값 반영이 빠름)
+        """
+        if target_interval <= 0:
+            raise ValueError("target_interval은 0보다 커야 합니다")
+        if not 0 < min_threshold <= max_threshold:
+            raise ValueError("0 < min_threshold <= max_threshold 이어야 합니다")
+
+        self.target_interval = target_interval
+        self.min_threshold = min_threshold
+        self.max_threshold = max_threshold
+        self.max_buffer_bytes = max_buffer_bytes
+        self.smoothing = smoothing
+
+        self.threshold = min(max(initial_threshold, min_threshold), max_threshold)
+        self.rate: Optional[float] = None        # 초당 레코드 수 추정치
+        self.record_bytes: Optional[float] = None  # 레코드당 평균 크기 추정치
+        self.last_reason = 'initial'
+        self.adjustments = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _ewma(self, previous: Optional[float], value: float) -> float:
+        if previous is None:
+            return value
+        return previous + self.smoothing * (value - previous)
+
+    def update(self, batch_size: int, batch_bytes: Optional[int] = None) -> int:
+        """
+        플러시 결과를 반영하여 새 임계값 계산
+
+        Args:
+            batch_size: 방금 플러시한 레코드 수
+            batch_bytes: 방금 플러시한 배치의 추정 크기 (바이트)
+
+        Returns:
+            다음 배치에 사용할 임계값
+        """
+        now = time.monotonic()
+        with self._lock:
+            elapsed = max(now - self._last_flush, 1e-6)
+            self._last_flush = now
+            if batch_size <= 0:
+                return self.threshold
+
+            self.rate = self._ewma(self.rate, batch_size / elapsed)
+            if batch_bytes:
+                self.record_bytes = self._ewma(self.record_bytes, batch_bytes / batch_size)
+
+            threshold = int(round(self.rate * self.target_interval))  # 부동소수점 오차로 1 작아지지 않도록 반올림
+            reason = 'rate'
+            if threshold < self.min_threshold:
+                threshold, reason = self.min_threshold, 'min'
+            if threshold > self.max_threshold:
+                threshold, reason = self.max_threshold, 'max'
+            if self.record_bytes:
+                memory_cap = max(self.min_threshold, int(self.max_buffer_bytes / self.record_bytes))
+                if threshold > memory_cap:
+                    threshold, reason = memory_cap, 'memory'
+
+            if threshold != self.threshold:
+                self.adjustments += 1
+            self.threshold = threshold
+            self.last_reason = reason
+            return threshold
+
+    def is_due(self, buffer_age: float) -> bool:
+        """버퍼가 목표 주기보다 오래되었는지 여부"""
+        return buffer_age >= self.target_interval
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 결정 상태 반환"""
+        return {
+            'threshold': self.threshold,
+            'rate': self.rate,
+            'record_bytes': self.record_bytes,
+            'target_interval': self.target_interval,
+            'max_buffer_bytes': self.max_buffer_bytes,
+            'reason': self.last_reason,
+            'adjustments': self.adjustments,
+        }
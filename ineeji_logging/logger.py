@@ -5,16 +5,33 @@ Logger 클래스 구현
 import logging
 import sys
 import os
-import pandas as pd
 import signal
 import atexit
 import queue
 import threading
+import time
+import copy
+import heapq
+import itertools
+import inspect
+from operator import itemgetter
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Union
 from pathlib import Path
 from logging.handlers import QueueHandler, QueueListener
 
+from .metrics import Counter, Histogram, HandlerStats, MetricsExporter, handler_stats
+from .flush_policy import AdaptiveFlushPolicy
+from .encoder import ParquetEncoderPool
+from .storage import StorageBackend, FastParquetBackend, make_storage
+from .console import BatchedConsoleHandler, resolve_color
+from .context import ContextFilter, BoundLogger, ContextFields, record_context
+from .fingerprint import ExceptionFingerprinter, ExceptionFilter, TracebackStore
+from .templates import message_template, deferrable_args, encode_args
+from .reader import partition_dir, parse_level, PARTITION_NAME
+from .retention import RetentionManager
+from .config import ConfigWatcher, ENV_PREFIX
+
 
 class ColoredFormatter(logging.Formatter):
     """
@@ -45,6 +62,41 @@ class ColoredFormatter(logging.Formatter):
         return log_message
 
 
+class _PartitionWriter:
+    """
+    파티션 디렉토리별 쓰기 락
+
+    같은 파티션에 쓰는 핸들러가 여럿이어도(재구성으로 교체되는 이전/새 핸들러, 같은 프로젝트의 여러 Logger)
+    로그 파일과 트레이스백 테이블의 추가 저장이 겹치지 않도록 합니다.
+    """
+    
+    _writers: Dict[str, '_PartitionWriter'] = {}
+    _writers_lock = threading.Lock()
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.encoder: Optional[ParquetEncoderPool] = None  # 마지막으로 배치를 넘긴 인코더 풀
+    
+    @classmethod
+    def get(cls, log_dir: Path) -> '_PartitionWriter':
+        key = os.path.abspath(str(log_dir))
+        with cls._writers_lock:
+            writer = cls._writers.get(key)
+            if writer is None:
+                writer = cls._writers[key] = cls()
+            return writer
+    
+    def hand_over(self, encoder: Optional[ParquetEncoderPool]):
+        """
+        다른 인코더 풀에 넘긴 배치가 남아 있으면 저장될 때까지 대기 (lock을 잡은 상태에서 호출)
+        
+        같은 풀은 같은 파일의 배치를 한 워커가 순서대로 저장하므로 기다리지 않습니다.
+        """
+        if self.encoder is not None and self.encoder is not encoder:
+            self.encoder.drain(timeout=30)
+        self.encoder = encoder
+
+
 class ParquetLogHandler(logging.Handler):
     """
     파케이 형식으로 로그를 저장하는 핸들러
@@ -52,7 +104,21 @@ class ParquetLogHandler(logging.Handler):
     
     _instances = []  # 모든 인스턴스를 추적
     
-    def __init__(self, base_path: str, env: str, project_name: str, flush_threshold: int = 100):
+    def __init__(
+        self,
+        base_path: str,
+        env: str,
+        project_name: str,
+        flush_threshold: int = 100,
+        flush_policy: Optional[AdaptiveFlushPolicy] = None,
+        encoder: Optional[ParquetEncoderPool] = None,
+        merge_by_time: bool = False,
+        dedupe_exceptions: bool = True,
+        deferred_formatting: bool = False,
+        index_messages: bool = False,
+        storage: Optional[StorageBackend] = None,
+        flush_delays: Optional[Dict[Union[int, str], float]] = None
+    ):
         """
         파케이 로그 핸들러 초기화
         
@@ -60,14 +126,70 @@ class ParquetLogHandler(logging.Handler):
             base_path: 기본 로그 저장 경로
             env: 환경 이름 ('development', 'test', 'production')
             flush_threshold: 버퍼 플러시 임계값 (이 개수만큼 로그가 쌓이면 저장)
+            flush_policy: 적응형 플러시 정책 (지정 시 flush_threshold를 자동 조정)
+            encoder: 파케이 인코딩을 넘길 워커 프로세스 풀 (없으면 현재 프로세스에서 저장)
+            merge_by_time: 플러시할 때 스레드별 버퍼를 시간순으로 병합 (기본값: 스레드 순서대로 이어붙임)
+            dedupe_exceptions: 트레이스백을 지문별로 파티션당 한 번만 저장 (행에는 exception_id와 메시지만 저장)
+            deferred_formatting: message/raw_message를 저장하지 않고 template/args로 읽을 때 복원
+            index_messages: 플러시할 때 메시지 토큰 역색인(index.parquet)도 함께 갱신
+            storage: 배치 저장 백엔드 (기본값: fastparquet/snappy, 인코더 워커를 쓰면 풀의 백엔드로 저장)
+            flush_delays: 레벨별 최대 저장 지연 (초, 예: {'ERROR': 0.005}). 해당 레벨 이상의 레코드가 들어오면
+                임계값과 무관하게 지연 안에 버퍼 전체를 저장 (0이면 기록한 스레드에서 바로 저장)
         """
         super().__init__()
         self.env = env
         self.project_name = project_name
         self.base_path = base_path
-        self.logs_buffer: List[Dict[str, Any]] = []
         self.flush_threshold = flush_threshold  # 버퍼 플러시 임계값 
-        self.buffer_lock = threading.RLock()  # 스레드 안전성을 위한 락
+        self.merge_by_time = merge_by_time
+        self.encoder = encoder
+        self.storage = storage if storage is not None else FastParquetBackend()
+        
+        # 예외 중복 제거: 트레이스백은 지문별로 exceptions.parquet에 한 번만 저장
+        self.dedupe_exceptions = dedupe_exceptions
+        self.fingerprinter = ExceptionFingerprinter()
+        self.tracebacks = TracebackStore()
+        
+        # 메시지 템플릿/인자는 항상 저장하고, 지연 포맷 모드에서는 포맷된 메시지를 저장하지 않음
+        self.deferred_formatting = deferred_formatting
+        
+        # 메시지 토큰 역색인: search_logs()가 토큰이 들어 있는 로우 그룹만 읽도록 함
+        self.index_messages = index_messages
+        
+        # 스레드별 스테이징 버퍼: emit은 자기 스레드의 리스트에만 추가하므로 락 경합이 없음
+        # 플러시 시점에만 모든 스레드 버퍼를 모아 저장
+        self._local = threading.local()
+        self._staging: List[Tuple[threading.Thread, List[Dict[str, Any]]]] = []
+        self._staging_lock = threading.Lock()  # 스레드 버퍼 등록/정리용 (스레드당 최초 1회)
+        self._emitted = itertools.count(1)
+        self._next_flush_at = flush_threshold
+        self.buffer_lock = threading.RLock()  # 플러시 직렬화용 락 (파일 쓰기 순서 보장)
+        
+        self.stats = HandlerStats()  # 플러시/쓰기 메트릭
+        self.stats.gauges['buffer_size'] = self._buffered_count
+        self.stats.gauges['staging_buffers'] = lambda: len(self._staging)
+        self.stats.gauges['flush_threshold'] = lambda: self.flush_threshold
+        
+        # 적응형 플러시 정책: 임계값 자동 조정 + 오래된 버퍼 주기적 플러시
+        self.flush_policy = flush_policy
+        self._buffer_started: Optional[float] = None
+        self._stop_watch = threading.Event()  # close()가 호출되면 설정 (이후 들어온 레코드는 바로 저장)
+        self._watcher: Optional[threading.Thread] = None
+        if flush_policy is not None:
+            self.flush_threshold = flush_policy.threshold
+            self.stats.gauges['flush_policy'] = flush_policy.snapshot
+            self._watcher = threading.Thread(target=self._watch_buffer_age, name='ineeji-parquet-flush', daemon=True)
+            self._watcher.start()
+        
+        # 레벨별 우선 플러시: 심각한 레코드가 들어오면 앞서 쌓인 레코드와 함께 저장 (파일 내 시간 순서 유지)
+        self._flush_delays: List[Tuple[int, float]] = []
+        self._priority_level = sys.maxsize  # 우선 플러시 대상 최저 레벨 (emit에서 빠르게 거르기 위함)
+        self._flush_deadline: Optional[float] = None
+        self._deadline_cond = threading.Condition()
+        self._deadline_thread: Optional[threading.Thread] = None
+        self.priority_flushes = Counter()
+        self.stats.gauges['priority_flushes'] = lambda: self.priority_flushes.value
+        self.set_flush_delays(flush_delays)
         
         # 인스턴스 등록 및 종료 시 처리
         ParquetLogHandler._instances.append(self)
@@ -83,91 +205,345 @@ class ParquetLogHandler(logging.Handler):
         for instance in cls._instances:
             try:
                 instance.flush()
+                if instance.encoder is not None:
+                    instance.encoder.drain(timeout=30)
             except Exception:
                 # 종료 시 예외는 무시
                 pass
     
+    def _watch_buffer_age(self):
+        """목표 플러시 주기보다 오래 머문 버퍼를 저장 (트래픽이 적을 때 지연 시간 제한)"""
+        interval = self.flush_policy.target_interval
+        while not self._stop_watch.wait(interval / 2):
+            started = self._buffer_started
+            if started is not None and self.flush_policy.is_due(time.monotonic() - started):
+                self.flush()
+    
+    def _watch_deadline(self):
+        """우선 플러시 기한이 되면 버퍼 저장 (기한 전에 들어온 심각한 레코드를 한 번에 모아 저장)"""
+        with self._deadline_cond:
+            while not self._stop_watch.is_set():
+                deadline = self._flush_deadline
+                if deadline is None:
+                    self._deadline_cond.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._deadline_cond.wait(remaining)
+                    continue
+                self._deadline_cond.release()
+                try:
+                    self._priority_flush()  # 기한을 지움
+                finally:
+                    self._deadline_cond.acquire()
+    
     @classmethod
     def _handle_signal(cls, signum, frame):
         """시그널 처리"""
         cls._flush_all_on_exit()
         # 기본 시그널 핸들러 호출
         signal.default_int_handler(signum, frame)
+    
+    def _thread_buffer(self) -> List[Dict[str, Any]]:
+        """현재 스레드의 스테이징 버퍼 반환 (없으면 생성 후 등록)"""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            buffer = []
+            self._local.buffer = buffer
+            with self._staging_lock:
+                self._staging.append((threading.current_thread(), buffer))
+        return buffer
+    
+    def _buffered_count(self) -> int:
+        """모든 스레드 버퍼에 쌓인 레코드 수"""
+        return sum(len(buffer) for _, buffer in list(self._staging))
+    
+    @property
+    def logs_buffer(self) -> List[Dict[str, Any]]:
+        """저장 대기 중인 레코드 (스레드 순서대로 이어붙인 사본)"""
+        return [entry for _, buffer in list(self._staging) for entry in list(buffer)]
+    
+    def _drain_staging(self, merge_by_time: bool) -> List[Dict[str, Any]]:
+        """
+        모든 스레드 버퍼에서 레코드를 꺼내 하나의 배치로 병합
+        
+        각 버퍼의 앞쪽 n개만 잘라내므로 그 사이 해당 스레드가 추가한 레코드는 다음 배치로 남습니다.
+        스레드 내 순서는 항상 유지되며, merge_by_time이면 전체를 시간순으로 병합합니다.
+        """
+        with self._staging_lock:
+            staging = list(self._staging)
+            # 종료된 스레드의 빈 버퍼 정리
+            self._staging = [(t, b) for t, b in staging if b or t.is_alive()]
+        
+        chunks = []
+        for _, buffer in staging:
+            count = len(buffer)
+            if count:
+                chunks.append(buffer[:count])
+                del buffer[:count]
         
+        if merge_by_time and len(chunks) > 1:
+            return list(heapq.merge(*chunks, key=itemgetter('datetime')))
+        return [entry for chunk in chunks for entry in chunk]
+    
+    def handle(self, record):
+        """
+        필터 통과 시 emit 호출
+        
+        logging.Handler.handle과 달리 핸들러 락을 잡지 않습니다 (emit이 스레드별 버퍼를 사용하므로 불필요).
+        """
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+        
+    def _format_without_exception(self, record) -> str:
+        """트레이스백을 붙이지 않고 포맷 (트레이스백은 별도 테이블에 저장)"""
+        formatter = self.formatter or logging.Formatter()
+        record.message = record.getMessage()
+        if formatter.usesTime():
+            record.asctime = formatter.formatTime(record, formatter.datefmt)
+        message = formatter.formatMessage(record)
+        if record.stack_info:
+            message = f"{message}\n{formatter.formatStack(record.stack_info)}"
+        return message
+    
     def emit(self, record):
         """로그 레코드 처리"""
         try:
+            # 비동기 로깅에서는 ExceptionFilter가 호출자 쪽에서 이미 지문을 계산해 둠
+            if self.dedupe_exceptions and record.exc_info:
+                self.fingerprinter.describe(record)
+            fingerprinted = self.dedupe_exceptions and getattr(record, 'exception_id', None) is not None
+            # 연결된 예외는 트레이스백을 지문별로 공유할 수 없으므로 행에 전체 트레이스백을 저장
+            dedupe = fingerprinted and getattr(record, 'exception_stack', None) is not None
+            
+            template, args = message_template(record)
+            if args and not deferrable_args(args):
+                args = None  # 변경 가능한 객체는 보관하지 않음 (메시지는 지금 포맷)
             log_entry = {
                 'datetime': datetime.fromtimestamp(record.created),
                 'levelname': record.levelname,
                 'name': record.name,
-                'message': self.format(record),  # 포맷된 메시지
-                'raw_message': record.getMessage(),  # 원본 메시지
+                'template': template,  # 메시지 템플릿 (사전 인코딩)
+                'args': args or None,  # 인자 (플러시할 때 JSON으로 변환)
                 'pathname': record.pathname,
                 'lineno': record.lineno,
                 'funcName': record.funcName
             }
             
+            if not self.deferred_formatting:
+                log_entry['message'] = self._format_without_exception(record) if fingerprinted else self.format(record)  # 포맷된 메시지
+                log_entry['raw_message'] = record.getMessage()  # 원본 메시지
+            elif not args:
+                # 템플릿만으로 복원할 수 없는 메시지(문자열이 아닌 메시지, 변경 가능한 인자)는 지금 포맷
+                raw_message = record.getMessage()
+                if raw_message != template:
+                    log_entry['raw_message'] = raw_message
+            
+            # 컨텍스트 필드는 각각 별도 컬럼으로 저장
+            context = record_context(record)
+            if context is not None:
+                log_entry.update(context.values)
+            
             # 예외 정보가 있으면 추가
-            if record.exc_info:
+            if fingerprinted:
+                log_entry['exception_id'] = record.exception_id
+                log_entry['exception_message'] = record.exception_message
+            if dedupe:
+                self.tracebacks.remember(record, log_entry['datetime'])
+            elif record.exc_text:
+                log_entry['exception'] = record.exc_text
+            elif record.exc_info:
                 if self.formatter:
                     log_entry['exception'] = self.formatter.formatException(record.exc_info)
                 else:
                     log_entry['exception'] = logging.Formatter().formatException(record.exc_info)
             
-            with self.buffer_lock:
-                self.logs_buffer.append(log_entry)
-                
-                # 버퍼 크기가 임계값에 도달하면 파일에 저장
-                if len(self.logs_buffer) >= self.flush_threshold:
-                    self.flush()
+            self._thread_buffer().append(log_entry)
+            if self._stop_watch.is_set():
+                # 닫히는 중에 들어온 레코드 (동기 로깅에서 교체 직전 핸들러 목록을 받은 스레드 등)
+                # 추가한 뒤에 확인하므로 close()의 마지막 플러시가 가져가지 못했으면 여기서 저장
+                self.flush()
+                return
+            if self._buffer_started is None:
+                self._buffer_started = time.monotonic()
+            
+            # 우선 플러시 레벨이면 임계값을 기다리지 않고 버퍼 전체를 저장
+            emitted = next(self._emitted)
+            if record.levelno >= self._priority_level:
+                delay = self._flush_delay(record.levelno)
+                if delay == 0:
+                    # 다른 스레드가 플러시 중이면 끝날 때까지 기다렸다가 저장 (레코드가 다음 주기로 밀리지 않도록)
+                    self._priority_flush()
+                    return
+                if delay is not None:
+                    self._schedule_flush(delay)
+            
+            # 누적 레코드 수가 임계값에 도달하면 파일에 저장
+            # (다른 스레드가 이미 플러시 중이면 그 플러시 또는 다음 임계값에서 처리)
+            if emitted >= self._next_flush_at:
+                self._next_flush_at = emitted + self.flush_threshold
+                if self.buffer_lock.acquire(blocking=False):
+                    try:
+                        self.flush()
+                    finally:
+                        self.buffer_lock.release()
         except Exception:
             self.handleError(record)
     
+    def set_flush_threshold(self, flush_threshold: int):
+        """
+        플러시 임계값 변경 (버퍼에 쌓인 레코드는 그대로 유지)
+        
+        적응형 플러시 정책을 쓰는 경우 다음 플러시에서 정책이 임계값을 다시 정합니다.
+        """
+        with self.buffer_lock:
+            self._next_flush_at += flush_threshold - self.flush_threshold
+            self.flush_threshold = flush_threshold
+    
+    @staticmethod
+    def parse_flush_delays(flush_delays: Optional[Dict[Union[int, str], float]]) -> List[Tuple[int, float]]:
+        """
+        레벨별 지연 설정을 (레벨 번호, 지연) 목록으로 변환 (높은 레벨부터)
+        
+        Raises:
+            ValueError: 알 수 없는 레벨이거나 지연이 음수인 경우
+        """
+        delays = []
+        for level, delay in (flush_delays or {}).items():
+            delay = float(delay)
+            if delay < 0:
+                raise ValueError(f"플러시 지연은 0 이상이어야 합니다: {level}={delay}")
+            delays.append((_level_number(level), delay))
+        return sorted(delays, reverse=True)
+    
+    def set_flush_delays(self, flush_delays: Optional[Dict[Union[int, str], float]]):
+        """
+        레벨별 최대 저장 지연 변경 (None이나 빈 딕셔너리면 우선 플러시 사용 안 함)
+        
+        레코드에는 그 레벨 이하로 지정된 항목 중 가장 짧은 지연이 적용됩니다.
+        """
+        delays = self.parse_flush_delays(flush_delays)
+        with self._deadline_cond:
+            self._flush_delays = delays
+            self._priority_level = delays[-1][0] if delays else sys.maxsize
+            start = (self._deadline_thread is None and not self._stop_watch.is_set()
+                     and any(delay > 0 for _, delay in delays))
+            if start:
+                self._deadline_thread = threading.Thread(target=self._watch_deadline,
+                                                         name='ineeji-parquet-priority', daemon=True)
+                self._deadline_thread.start()
+    
+    def _flush_delay(self, levelno: int) -> Optional[float]:
+        """레코드 레벨에 적용할 최대 저장 지연 (대상이 아니면 None)"""
+        return min((delay for level, delay in self._flush_delays if level <= levelno), default=None)
+    
+    def _schedule_flush(self, delay: float):
+        """delay초 안에 버퍼를 저장하도록 기한 설정 (이미 더 이른 기한이 있으면 유지)"""
+        deadline = time.monotonic() + delay
+        with self._deadline_cond:
+            if self._flush_deadline is None or deadline < self._flush_deadline:
+                self._flush_deadline = deadline
+                self._deadline_cond.notify()
+    
     def flush(self):
         """버퍼에 있는 로그를 파케이 파일로 저장"""
-        buffer_copy = None
-        with self.buffer_lock:
-            if not self.logs_buffer:
-                return
-            
-            # 버퍼 복사 후 비우기
-            buffer_copy = self.logs_buffer.copy()
-            self.logs_buffer = []
+        self._flush(self.merge_by_time)
+    
+    def _priority_flush(self):
+        """
+        우선 플러시 (심각한 레코드와 그 앞에 쌓인 레코드를 저장)
         
-        if not buffer_copy:
-            return
-            
+        merge_by_time 설정과 관계없이 스레드별 버퍼를 시간순으로 병합하므로, 다른 스레드에서 먼저 기록한
+        레코드가 심각한 레코드 뒤에 저장되지 않습니다.
+        """
+        self.priority_flushes.inc()
+        self._flush(merge_by_time=True)
+    
+    def _flush(self, merge_by_time: bool):
+        with self.buffer_lock:
+            # 꺼내기 전에 기한을 지움 (이후에 들어온 심각한 레코드는 새 기한을 잡음)
+            with self._deadline_cond:
+                self._flush_deadline = None
+            self._buffer_started = None
+            buffer_copy = self._drain_staging(merge_by_time)
+            if buffer_copy and self.flush_policy is not None:
+                # 다음 배치 크기를 먼저 정해 다음 플러시 시점에 바로 반영
+                self._update_policy(buffer_copy)
+            self._next_flush_at = next(self._emitted) + self.flush_threshold
+            if self._buffered_count():
+                # 꺼내는 동안 추가된 레코드는 다음 주기에 저장
+                self._buffer_started = time.monotonic()
+            if buffer_copy:
+                self._write_batch(buffer_copy)
+    
+    def _update_policy(self, buffer_copy: List[Dict[str, Any]]):
+        """적응형 정책으로 다음 배치 크기 결정 (메모리 한도 계산용 크기는 문자열 길이로 추정)"""
+        batch_bytes = sum(
+            len(value) for entry in buffer_copy for value in entry.values() if isinstance(value, str)
+        ) + 256 * len(buffer_copy)
+        self.flush_threshold = self.flush_policy.update(len(buffer_copy), batch_bytes)
+    
+    def _write_batch(self, buffer_copy: List[Dict[str, Any]]):
+        """배치를 파케이 파일로 저장 (buffer_lock을 잡은 상태에서 호출)"""
+        start = time.perf_counter()
         try:    
+            # 인자는 타입을 보존하는 JSON 문자열로 저장
+            for entry in buffer_copy:
+                if entry.get('args') is not None:
+                    entry['args'] = encode_args(entry['args'])
+            
             # 로그 저장 경로 생성 (~/user/.ineeji/logs/<project_name>/<env>/<YYYY-MM-DD>/log.parquet)
-            today = datetime.now().strftime('%Y-%m-%d')
-            log_dir = Path(os.path.expanduser(self.base_path)) / self.project_name / self.env / today
+            log_dir = partition_dir(self.base_path, self.project_name, self.env)
             log_dir.mkdir(parents=True, exist_ok=True)
             
-            log_file = log_dir / 'log.parquet'
-            
-            # 데이터프레임 생성
-            df = pd.DataFrame(buffer_copy)
-            
-            # 기존 파일이 있으면 추가, 없으면 새로 생성
-            try:
-                if log_file.exists():
-                    existing_df = pd.read_parquet(log_file)
-                    df = pd.concat([existing_df, df], ignore_index=True)
-            except Exception:
-                # 파일 읽기 실패 시 새로 저장
-                pass
+            log_file = log_dir / self.storage.file_name
             
-            # 파케이 파일로 저장
-            df.to_parquet(log_file, index=False, engine='fastparquet', compression='snappy')
-        except Exception:
+            # 같은 파티션에 쓰는 다른 핸들러와 저장이 겹치지 않도록 파티션 락을 잡고 저장
+            writer = _PartitionWriter.get(log_dir)
+            with writer.lock:
+                writer.hand_over(self.encoder)
+                
+                # 새 지문의 트레이스백을 먼저 저장 (로그 행이 항상 조회 가능한 지문을 가리키도록)
+                if self.dedupe_exceptions:
+                    try:
+                        self.tracebacks.store(log_dir, buffer_copy)
+                    except Exception as e:
+                        # 트레이스백 테이블 저장 실패가 로그 행 저장을 막지 않도록 메트릭에만 기록
+                        self.stats.write_errors.inc()
+                        self.stats.last_error = f"{type(e).__name__}: {e}"
+                
+                # 인코더 워커가 있으면 인코딩과 저장을 넘기고 반환 (메트릭은 워커 회신 시 기록)
+                if self.encoder is not None and self.encoder.submit(log_file, buffer_copy, self.stats,
+                                                                    index_messages=self.index_messages):
+                    return
+                
+                # 저장 백엔드로 기존 파일에 추가 저장
+                written = self.storage.append(log_file, buffer_copy, index_messages=self.index_messages)
+        except Exception as e:
             # 에러가 발생해도 계속 진행 (로깅 실패가 애플리케이션을 중단해서는 안 됨)
-            pass
+            # 대신 메트릭에 기록하여 Logger.stats()로 확인할 수 있도록 함
+            self.stats.record_flush(len(buffer_copy), time.perf_counter() - start,
+                                    error=f"{type(e).__name__}: {e}")
+        else:
+            self.stats.record_flush(len(buffer_copy), time.perf_counter() - start, written)
     
     def close(self):
         """핸들러 종료 시 버퍼에 남은 로그 저장"""
+        self._stop_watch.set()
+        with self._deadline_cond:
+            self._deadline_cond.notify_all()
+        for watcher in (self._watcher, self._deadline_thread):
+            if watcher is not None and watcher is not threading.current_thread():
+                # 진행 중인 주기적/우선 플러시가 끝날 때까지 대기
+                watcher.join(timeout=5)
         try:
             self.flush()
+            if self.encoder is not None:
+                self.encoder.drain(timeout=30)
         finally:
             super().close()
 
@@ -187,17 +563,22 @@ class DetailedFormatter(logging.Formatter):
             
         super().__init__(fmt=fmt, datefmt=datefmt, style=style_char)
         self.detailed_fmt = detailed_fmt or fmt
+        # 상세 포맷용 스타일을 미리 만들어 두고 레벨에 따라 선택 (포맷 문자열을 바꾸지 않으므로 스레드 안전)
+        self._detailed_style = type(self._style)(self.detailed_fmt) if self.detailed_fmt else self._style
     
-    def format(self, record):
+    def usesTime(self):
+        return self._style.usesTime() or self._detailed_style.usesTime()
+    
+    def formatMessage(self, record):
         # WARNING, ERROR, CRITICAL 레벨은 상세 포맷 사용
-        if record.levelno >= logging.WARNING and self.detailed_fmt:
-            original_fmt = self._style._fmt
-            self._style._fmt = self.detailed_fmt
-            result = super().format(record)
-            self._style._fmt = original_fmt
-            return result
-        else:
-            return super().format(record)
+        style = self._detailed_style if record.levelno >= logging.WARNING else self._style
+        message = style.format(record)
+        
+        # 컨텍스트 필드가 있으면 미리 렌더링된 key=value 문자열을 덧붙임
+        context = record_context(record)
+        if context is not None:
+            message = f"{message} | {context.text}"
+        return message
 
 
 class ColoredDetailedFormatter(ColoredFormatter):
@@ -215,17 +596,155 @@ class ColoredDetailedFormatter(ColoredFormatter):
             
         super().__init__(fmt=fmt, datefmt=datefmt, style=style_char)
         self.detailed_fmt = detailed_fmt or fmt
+        # 상세 포맷용 스타일을 미리 만들어 두고 레벨에 따라 선택 (포맷 문자열을 바꾸지 않으므로 스레드 안전)
+        self._detailed_style = type(self._style)(self.detailed_fmt) if self.detailed_fmt else self._style
     
-    def format(self, record):
+    def usesTime(self):
+        return self._style.usesTime() or self._detailed_style.usesTime()
+    
+    def formatMessage(self, record):
         # WARNING, ERROR, CRITICAL 레벨은 상세 포맷 사용
-        if record.levelno >= logging.WARNING and self.detailed_fmt:
-            original_fmt = self._style._fmt
-            self._style._fmt = self.detailed_fmt
-            result = super().format(record)
-            self._style._fmt = original_fmt
-            return result
-        else:
-            return super().format(record)
+        style = self._detailed_style if record.levelno >= logging.WARNING else self._style
+        message = style.format(record)
+        
+        # 컨텍스트 필드가 있으면 미리 렌더링된 key=value 문자열을 덧붙임
+        context = record_context(record)
+        if context is not None:
+            message = f"{message} | {context.text}"
+        return message
+
+
+class _CountingFilter(logging.Filter):
+    """
+    통과하는 레코드 수를 세는 필터 (항상 통과)
+    """
+    
+    def __init__(self, counter: Counter):
+        super().__init__()
+        self.counter = counter
+    
+    def filter(self, record):
+        self.counter.inc()
+        return True
+
+
+class _RecordFilter(logging.Filter):
+    """
+    호출자 쪽에서 레코드를 준비하는 핸들러 필터 (항상 통과)
+    
+    로거에 직접 붙은 핸들러(비동기 로깅에서는 큐 핸들러)에 추가되므로 하위 로거(my_app.db 등)에서
+    전파된 레코드에도 실행됩니다. 레코드 수 집계, 컨텍스트 필드 첨부, 예외 지문 계산을
+    핸들러가 여러 개여도 레코드당 한 번만 수행합니다.
+    """
+    
+    def __init__(self, counter: Counter):
+        super().__init__()
+        self.counter = counter
+        self.context = ContextFilter()  # 로그를 남긴 스레드/태스크의 컨텍스트 필드 첨부
+        self.exceptions = ExceptionFilter()  # 트레이스백 객체가 큐를 건너기 전에 예외 지문 계산
+        self._mark = id(self)
+    
+    def filter(self, record):
+        if record.__dict__.get('_ineeji_prepared') == self._mark:
+            return True
+        record._ineeji_prepared = self._mark
+        self.counter.inc()
+        self.context.filter(record)
+        self.exceptions.filter(record)
+        return True
+
+
+class _MetricsQueueHandler(QueueHandler):
+    """
+    큐 적재 지연 시간과 유실을 측정하는 큐 핸들러
+    """
+    
+    def __init__(self, log_queue, enqueue_latency: Histogram, drops: Counter):
+        super().__init__(log_queue)
+        self.enqueue_latency = enqueue_latency
+        self.drops = drops
+    
+    def prepare(self, record):
+        """
+        큐에 넣을 레코드 준비
+        
+        QueueHandler.prepare와 달리 트레이스백을 메시지에 합치지 않고 exc_text로 보존합니다.
+        (핸들러가 예외를 별도 컬럼/테이블에 저장할 수 있도록)
+        """
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = (self.formatter or logging.Formatter()).formatException(record.exc_info)
+        template, args = message_template(record)
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        
+        # 파케이 핸들러가 템플릿/인자를 따로 저장할 수 있도록 보존 (변경 가능한 인자는 넘기지 않음)
+        if template is not None:
+            record.ineeji_template = template
+            record.ineeji_template_args = args if args and deferrable_args(args) else None
+        return record
+    
+    def emit(self, record):
+        start = time.perf_counter()
+        try:
+            self.enqueue(self.prepare(record))
+        except queue.Full:
+            self.drops.inc()
+            return
+        except Exception:
+            self.handleError(record)
+            return
+        self.enqueue_latency.observe(time.perf_counter() - start)
+
+
+class _Barrier:
+    """
+    큐 리스너가 앞선 레코드를 모두 처리했음을 알리는 표식 (재구성 시 빠지는 핸들러를 닫기 전에 사용)
+    """
+    
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class _MetricsQueueListener(QueueListener):
+    """
+    핸들러별 처리 시간을 측정하는 큐 리스너
+    """
+    
+    def handle(self, record):
+        if isinstance(record, _Barrier):
+            record.done.set()
+            return
+        record = self.prepare(record)
+        for handler in self.handlers:
+            if not self.respect_handler_level or record.levelno >= handler.level:
+                start = time.perf_counter()
+                handler.handle(record)
+                handler.stats.emit_time.observe(time.perf_counter() - start)
+
+
+def _level_number(level: Union[int, str]) -> int:
+    """레벨 숫자 또는 이름('DEBUG', '10')을 숫자로 변환"""
+    if isinstance(level, int):
+        return level
+    if level.strip().isdigit():
+        return int(level)
+    return parse_level(level.strip())
+
+
+def _close_handler(handler: logging.Handler):
+    """설정으로 만든 핸들러 종료 (파케이 핸들러의 인코더 워커도 함께 종료)"""
+    try:
+        handler.close()
+        encoder = getattr(handler, 'encoder', None)
+        if encoder is not None:
+            encoder.close()
+    except Exception:
+        # 종료 실패가 재구성을 중단해서는 안 됨
+        pass
 
 
 class Logger:
@@ -243,6 +762,13 @@ class Logger:
     
     # 각 로거 이름당 하나의 QueueListener를 유지 
     _listeners = {}
+    _exit_hook_registered = False  # 리스너 종료 훅 등록 여부 (프로세스당 한 번)
+    
+    # 각 로거 이름당 가장 최근 Logger 인스턴스 (메트릭 수집용)
+    _instances = {}
+    
+    # reconfigure 직렬화용 락 (설정 감시 스레드와 동시에 호출될 수 있음)
+    _reconfigure_lock = threading.RLock()
     
     def __init__(
         self, 
@@ -255,9 +781,23 @@ class Logger:
         parquet_logging: bool = False,
         project_name: Optional[str] = None,
         env: str = "development",
-        colored_console: bool = True,
+        colored_console: Union[bool, str] = 'auto',
         async_logging: bool = True,
-        parquet_flush_threshold: int = 100
+        parquet_flush_threshold: Union[int, str] = 100,
+        parquet_flush_interval: float = 1.0,
+        parquet_max_buffer_bytes: int = 64 * 1024 * 1024,
+        parquet_encoder_workers: int = 0,
+        parquet_merge_by_time: bool = False,
+        parquet_dedupe_exceptions: bool = True,
+        parquet_deferred_formatting: bool = False,
+        parquet_index_messages: bool = False,
+        parquet_storage: str = 'fastparquet',
+        parquet_compression: Optional[str] = None,
+        parquet_compression_level: Optional[int] = None,
+        parquet_flush_delays: Optional[Dict[Union[int, str], float]] = None,
+        console_mode: str = 'line',
+        extra_handlers: Optional[List[logging.Handler]] = None,
+        levels: Optional[Dict[str, Union[int, str]]] = None
     ):
         """
         Logger 초기화
@@ -271,28 +811,67 @@ class Logger:
             detailed_format_string: 심각한 로그 레벨용 상세 포맷
             parquet_logging: 파케이 로그 저장 여부
             env: 환경 이름 ('development', 'test', 'production')
-            colored_console: 콘솔 출력에 색상 적용 여부
+            colored_console: 콘솔 출력에 색상 적용 여부 ('auto'이면 stdout이 TTY일 때만 적용)
             async_logging: 비동기 로깅 사용 여부 (True 권장)
-            parquet_flush_threshold: 파케이 로그 버퍼 플러시 임계값
+            parquet_flush_threshold: 파케이 로그 버퍼 플러시 임계값 ('auto'이면 유입률에 맞춰 자동 조정)
+            parquet_flush_interval: 'auto' 모드의 목표 플러시 주기 (초)
+            parquet_max_buffer_bytes: 'auto' 모드의 버퍼 메모리 한도 (바이트)
+            parquet_encoder_workers: 파케이 인코딩 워커 프로세스 수 (0이면 현재 프로세스에서 인코딩)
+            parquet_merge_by_time: 플러시할 때 스레드별 버퍼를 시간순으로 병합
+            parquet_dedupe_exceptions: 트레이스백을 지문별로 날짜 파티션당 한 번만 저장
+            parquet_deferred_formatting: 파케이에 포맷된 메시지를 저장하지 않고 template/args로 읽을 때 복원
+            parquet_index_messages: 플러시할 때 메시지 토큰 역색인을 함께 갱신 (search_logs() 가속)
+            parquet_storage: 저장 백엔드 ('fastparquet', 'pyarrow', 'arrow': Arrow IPC 스트림에 추가 후 나중에 변환)
+            parquet_compression: 압축 코덱 ('snappy', 'zstd', 'lz4', 'gzip', 'none', 기본값: 백엔드 기본값)
+            parquet_compression_level: 압축 레벨 (zstd/gzip 등)
+            parquet_flush_delays: 레벨별 최대 저장 지연 (초, 예: {"ERROR": 0.005}이면 ERROR/CRITICAL은 5ms 안에 저장)
+            console_mode: 콘솔 출력 모드 ('line': 레코드마다 출력, 'throughput': 배치로 모아 출력)
+            extra_handlers: 추가 핸들러 목록 (예: RemoteHandler, 포맷터가 없으면 파일용 포맷터 적용)
+            levels: 하위 로거별 레벨 (예: {"my_app.db": "DEBUG"})
         """
+        # 재구성 시 비교/병합할 전체 설정 (생성 인자 그대로)
+        config = {key: value for key, value in locals().items() if key in _CONFIG_KEYS}
+        
         self.name = name
+        self._started_at = time.time()
+        self._records = Counter()
+        self._drops = Counter()
+        self._enqueue_latency = Histogram()
+        self._queue: Optional[queue.Queue] = None
+        self._owned: Dict[Tuple, logging.Handler] = {}  # 설정으로 만든 핸들러 (설정 키 -> 핸들러)
+        self._config: Dict[str, Any] = {}
+        self.handlers: List[logging.Handler] = []
         self.async_logging = async_logging
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(level)
         self.logger.propagate = False
-
-        self.project_name = project_name if project_name else Path.cwd().name
-
         
-        # 기존 핸들러 제거
-        for handler in self.logger.handlers[:]:
-            self.logger.removeHandler(handler)
+        # 호출자 쪽 레코드 준비 (레코드 수 집계, 컨텍스트 필드, 예외 지문)
+        # 로거 필터는 하위 로거에서 전파된 레코드에 실행되지 않으므로 _apply에서 로거에 붙은 핸들러에 추가
+        self._record_filter = _RecordFilter(self._records)
         
-        # 모든 리스너 등록 취소 (리로드 시)
-        if name in Logger._listeners:
-            listener = Logger._listeners.pop(name)
-            if hasattr(listener, 'stop') and listener.is_alive():
-                listener.stop()
+        # 같은 이름으로 다시 생성하면 이전 인스턴스의 핸들러와 큐 리스너를 이어받음 (리로드 시)
+        self._apply(config, Logger._instances.get(name))
+        Logger._instances[name] = self
+    
+    def _apply(self, config: Dict[str, Any], previous: Optional['Logger'] = None):
+        """
+        설정 적용
+        
+        새로 필요한 핸들러를 모두 만든 뒤 한 번에 교체하므로 적용 도중의 상태가 로그 호출에 보이지 않습니다.
+        설정이 바뀌지 않은 핸들러와 큐 리스너는 그대로 재사용하고, 빠지는 핸들러는 닫으면서 버퍼를 저장합니다.
+        
+        Args:
+            config: Logger 생성 인자와 같은 키의 전체 설정
+            previous: 핸들러를 이어받을 이전 인스턴스 (reconfigure에서는 자기 자신)
+        """
+        # 레벨을 먼저 검증 (잘못된 설정이면 아무것도 바꾸지 않음)
+        level = _level_number(config['level'])
+        levels = {child: _level_number(value) for child, value in (config['levels'] or {}).items()}
+        flush_delays = dict(config['parquet_flush_delays'] or {})
+        ParquetLogHandler.parse_flush_delays(flush_delays)
+        
+        format_string = config['format_string']
+        detailed_format_string = config['detailed_format_string']
         
         # 기본 포맷
         if format_string is None:
@@ -302,73 +881,259 @@ class Logger:
         if detailed_format_string is None:
             detailed_format_string = "%(asctime)s [%(levelname)s] %(name)s (%(pathname)s:%(lineno)d - %(funcName)s): %(message)s"
         
-        # 실제 로그 핸들러 생성 (큐 리스너에 전달될)
+        # 이전 인스턴스가 지금 실제로 쓰고 있는 핸들러만 재사용 대상
+        listener = Logger._listeners.get(self.name)
+        if listener is not None and listener._thread is None:
+            listener = None
+        live = set(self.logger.handlers) | set(listener.handlers if listener is not None else ())
+        reusable = {}
+        if previous is not None:
+            reusable = {key: handler for key, handler in previous._owned.items() if handler in live}
+        
+        # 실제 로그 핸들러 목록 (큐 리스너에 전달될)
         handlers = []
+        owned = {}
+        created = []
+        updates = []  # 재사용하는 핸들러에 교체 시점에 적용할 변경 (formatter, 임계값, 레벨별 지연)
         
-        # 콘솔 출력 핸들러
-        if console_output:
-            console_handler = logging.StreamHandler(sys.stdout)
-            
-            # 색상 적용 여부에 따라 포맷터 선택
-            if colored_console:
-                console_formatter = ColoredDetailedFormatter(format_string, detailed_fmt=detailed_format_string)
-            else:
-                console_formatter = DetailedFormatter(format_string, detailed_fmt=detailed_format_string)
+        def reuse_or_create(key, factory):
+            handler = reusable.pop(key, None)
+            if handler is None:
+                handler = factory()
+                created.append(handler)
+            owned[key] = handler
+            handlers.append(handler)
+            return handler
+        
+        project_name = config['project_name'] if config['project_name'] else Path.cwd().name
+        try:
+            # 콘솔 출력 핸들러
+            if config['console_output']:
+                console_mode = config['console_mode']
+                console_handler = reuse_or_create(('console', console_mode),
+                                                  lambda: BatchedConsoleHandler(sys.stdout, mode=console_mode))
                 
-            console_handler.setFormatter(console_formatter)
-            handlers.append(console_handler)
-        
-        # 일반 포맷터 (파일 및 파케이용)
-        file_formatter = DetailedFormatter(format_string, detailed_fmt=detailed_format_string)
-        
-        # 파일 출력 핸들러
-        if log_file:
-            # 로그 디렉토리 생성
-            log_dir = os.path.dirname(log_file)
-            if log_dir and not os.path.exists(log_dir):
-                os.makedirs(log_dir)
+                # 색상 적용 여부에 따라 포맷터 선택 (TTY가 아니면 ANSI 코드를 쓰지 않음)
+                if resolve_color(config['colored_console'], console_handler.stream):
+                    console_formatter = ColoredDetailedFormatter(format_string, detailed_fmt=detailed_format_string)
+                else:
+                    console_formatter = DetailedFormatter(format_string, detailed_fmt=detailed_format_string)
+                updates.append((console_handler, console_formatter, None, None))
+            
+            # 일반 포맷터 (파일 및 파케이용)
+            file_formatter = DetailedFormatter(format_string, detailed_fmt=detailed_format_string)
+            
+            # 파일 출력 핸들러
+            log_file = config['log_file']
+            if log_file:
+                def make_file_handler():
+                    # 로그 디렉토리 생성
+                    log_dir = os.path.dirname(log_file)
+                    if log_dir and not os.path.exists(log_dir):
+                        os.makedirs(log_dir)
+                    return logging.FileHandler(log_file, encoding='utf-8')
+                file_handler = reuse_or_create(('file', os.path.abspath(log_file)), make_file_handler)
+                updates.append((file_handler, file_formatter, None, None))
+            
+            # 파케이 로그 핸들러 (임계값과 레벨별 지연은 재사용하는 핸들러에 바로 적용할 수 있으므로 설정 키에서 제외)
+            if config['parquet_logging']:
+                flush_threshold = config['parquet_flush_threshold']
+                adaptive = flush_threshold == 'auto'
+                key = ('parquet', project_name, config['env'], config['parquet_encoder_workers'],
+                       config['parquet_merge_by_time'], config['parquet_dedupe_exceptions'],
+                       config['parquet_deferred_formatting'], config['parquet_index_messages'],
+                       config['parquet_storage'], config['parquet_compression'], config['parquet_compression_level'],
+                       adaptive,
+                       config['parquet_flush_interval'] if adaptive else None,
+                       config['parquet_max_buffer_bytes'] if adaptive else None)
                 
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setFormatter(file_formatter)
-            handlers.append(file_handler)
-        
-        # 파케이 로그 핸들러
-        if parquet_logging:
-            parquet_handler = ParquetLogHandler(
-                base_path="~/.ineeji/logs", 
-                project_name=self.project_name,
-                env=env,
-                flush_threshold=parquet_flush_threshold
-            )
-            parquet_handler.setFormatter(file_formatter)
-            handlers.append(parquet_handler)
-        
-        if async_logging and handlers:
-            # 비동기 로깅 설정
-            self._setup_async_logging(handlers)
+                def make_parquet_handler():
+                    flush_policy = None
+                    threshold = flush_threshold
+                    if adaptive:
+                        flush_policy = AdaptiveFlushPolicy(
+                            target_interval=config['parquet_flush_interval'],
+                            max_buffer_bytes=config['parquet_max_buffer_bytes']
+                        )
+                        threshold = flush_policy.threshold
+                    workers = config['parquet_encoder_workers']
+                    storage = make_storage(config['parquet_storage'], config['parquet_compression'],
+                                           config['parquet_compression_level'])
+                    return ParquetLogHandler(
+                        base_path="~/.ineeji/logs", 
+                        project_name=project_name,
+                        env=config['env'],
+                        flush_threshold=threshold,
+                        flush_policy=flush_policy,
+                        encoder=ParquetEncoderPool(workers, storage=storage) if workers > 0 else None,
+                        merge_by_time=config['parquet_merge_by_time'],
+                        dedupe_exceptions=config['parquet_dedupe_exceptions'],
+                        deferred_formatting=config['parquet_deferred_formatting'],
+                        index_messages=config['parquet_index_messages'],
+                        storage=storage,
+                        flush_delays=flush_delays
+                    )
+                parquet_handler = reuse_or_create(key, make_parquet_handler)
+                updates.append((parquet_handler, file_formatter, None if adaptive else flush_threshold, flush_delays))
+            
+            # 추가 핸들러 (원격 전송 등)
+            for handler in config['extra_handlers'] or []:
+                if handler.formatter is None:
+                    handler.setFormatter(file_formatter)
+                handlers.append(handler)
+        except Exception:
+            # 만들다 만 핸들러 정리 (기존 설정은 그대로 유지)
+            for handler in created:
+                _close_handler(handler)
+            raise
+        
+        # 빠지는 핸들러가 있으면 교체 전에 큐에 먼저 들어온 레코드를 기존 핸들러로 모두 처리
+        previous_handlers = set(previous.handlers) if previous is not None else set()
+        previous_owned = set(previous._owned.values()) if previous is not None else set()
+        removed_extras = [handler for handler in previous_handlers
+                          if handler in live and handler not in handlers and handler not in previous_owned]
+        removed = bool(reusable or removed_extras)
+        if removed and listener is not None:
+            Logger._wait_for_listener(listener)
+        
+        # ---- 여기서부터 교체 ----
+        for handler, formatter, flush_threshold, handler_flush_delays in updates:
+            handler.setFormatter(formatter)
+            if flush_threshold is not None:
+                handler.set_flush_threshold(flush_threshold)
+            if handler_flush_delays is not None:
+                handler.set_flush_delays(handler_flush_delays)
+        
+        # 핸들러별 메트릭 연결 (재사용하는 핸들러에는 이미 연결되어 있음)
+        for handler in handlers:
+            if handler not in previous_handlers:
+                handler.addFilter(_CountingFilter(handler_stats(handler).records))
+        
+        if config['async_logging'] and handlers:
+            if listener is not None:
+                # 실행 중인 큐 리스너의 핸들러 목록만 교체 (리스너 스레드와 큐는 그대로 유지)
+                listener.handlers = tuple(handlers)
+                self._queue = listener.queue
+                self.logger.handlers = [self._queue_handler(self._queue)]
+            else:
+                self.logger.handlers = []
+                self._setup_async_logging(handlers)
         else:
-            # 동기식 로깅 (직접 핸들러 추가)
+            self._queue = None
             for handler in handlers:
-                self.logger.addHandler(handler)
+                handler.addFilter(self._record_filter)
+            self.logger.handlers = list(handlers)
+            if listener is not None:
+                # 큐에 남은 레코드를 새 핸들러 목록으로 처리한 뒤 종료
+                Logger._listeners.pop(self.name, None)
+                listener.handlers = tuple(handlers)
+                listener.stop()
+                listener = None
+        
+        # 로거에서 빠졌거나(큐 리스너 뒤로 옮겨진 핸들러 등) 이전 인스턴스의 레코드 준비 필터 제거
+        for handler in live | set(handlers):
+            for log_filter in handler.filters[:]:
+                if isinstance(log_filter, _RecordFilter) and (
+                        log_filter is not self._record_filter or handler not in self.logger.handlers):
+                    handler.removeFilter(log_filter)
+        
+        self.logger.setLevel(level)
+        old_levels = (previous._config.get('levels') or {}) if previous is not None else {}
+        for child in old_levels:
+            if child not in levels:
+                logging.getLogger(child).setLevel(logging.NOTSET)
+        for child, child_level in levels.items():
+            logging.getLogger(child).setLevel(child_level)
+        
+        self.project_name = project_name
+        self.async_logging = config['async_logging']
+        self.handlers = handlers
+        self._owned = owned
+        self._config = dict(config)
+        
+        # 빠진 핸들러 정리: 리스너가 처리 중이던 레코드를 마칠 때까지 기다린 뒤 닫아 버퍼를 저장
+        # (직접 만들지 않은 추가 핸들러는 닫지 않고 버퍼만 비움)
+        if removed:
+            if listener is not None:
+                Logger._wait_for_listener(listener)
+            for handler in reusable.values():
+                _close_handler(handler)
+            for handler in removed_extras:
+                handler.flush()
+    
+    def reconfigure(self, **changes):
+        """
+        실행 중에 설정 변경
+        
+        바뀐 항목만 현재 설정에 덮어써서 적용합니다. 설정이 바뀌지 않은 핸들러와 큐 리스너는 그대로 유지되어
+        버퍼에 쌓인 레코드가 유실되지 않으며, 레벨만 바꾸는 경우 핸들러를 전혀 건드리지 않습니다.
+        
+        사용 예:
+            logger.reconfigure(levels={"my_app.db": "DEBUG"})
+            logger.reconfigure(parquet_flush_threshold=500, console_output=False)
+        
+        Args:
+            **changes: Logger 생성 인자와 같은 이름의 설정 (levels: 하위 로거 이름 -> 레벨)
+            
+        Raises:
+            ValueError: 알 수 없는 설정 이름이나 레벨 (이 경우 아무것도 바뀌지 않음)
+        """
+        unknown = set(changes) - set(_CONFIG_KEYS)
+        if unknown:
+            raise ValueError(f"알 수 없는 설정입니다: {', '.join(sorted(unknown))}")
+        with Logger._reconfigure_lock:
+            config = dict(self._config)
+            config.update(changes)
+            self._apply(config, self)
+    
+    def watch_config(self, path: Optional[str] = None, env_prefix: Optional[str] = ENV_PREFIX,
+                     interval: float = 1.0) -> ConfigWatcher:
+        """
+        설정 파일/환경 변수를 주기적으로 읽어 바뀌면 reconfigure로 적용
+        
+        Args:
+            path: JSON(.json) 또는 TOML(.toml) 설정 파일 경로
+            env_prefix: 설정으로 읽을 환경 변수 접두사 (None이면 환경 변수를 읽지 않음)
+            interval: 변경 확인 주기 (초)
+            
+        Returns:
+            시작된 ConfigWatcher (stop()으로 중지)
+        """
+        return ConfigWatcher(self, path=path, env_prefix=env_prefix, interval=interval).start()
+    
+    @staticmethod
+    def _wait_for_listener(listener: QueueListener, timeout: float = 5.0):
+        """지금까지 큐에 들어온 레코드를 리스너가 모두 처리할 때까지 대기"""
+        barrier = _Barrier()
+        listener.queue.put_nowait(barrier)
+        barrier.done.wait(timeout)
+    
+    def _queue_handler(self, log_queue: queue.Queue) -> '_MetricsQueueHandler':
+        """로거에 붙일 큐 핸들러 생성 (레코드 준비는 큐에 넣기 전에 호출자 쪽에서)"""
+        queue_handler = _MetricsQueueHandler(log_queue, self._enqueue_latency, self._drops)
+        queue_handler.addFilter(self._record_filter)
+        return queue_handler
     
     def _setup_async_logging(self, handlers):
         """비동기 로깅 설정"""
         # 로그 메시지를 담을 큐 생성
         log_queue = queue.Queue(-1)  # 무제한 큐 크기
         
+        self._queue = log_queue
+        
         # 큐 핸들러 생성 및 로거에 연결
-        queue_handler = QueueHandler(log_queue)
-        self.logger.addHandler(queue_handler)
+        self.logger.addHandler(self._queue_handler(log_queue))
         
         # 큐 리스너 생성 및 시작
-        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener = _MetricsQueueListener(log_queue, *handlers, respect_handler_level=True)
         listener.start()
         
         # 나중에 종료를 위해 리스너 저장
         Logger._listeners[self.name] = listener
         
-        # 프로그램 종료 시 리스너 정리
-        if len(Logger._listeners) == 1:
+        # 프로그램 종료 시 리스너 정리 (리스너를 다시 만들어도 종료 훅은 한 번만 등록)
+        if not Logger._exit_hook_registered:
+            Logger._exit_hook_registered = True
             atexit.register(Logger._stop_all_listeners)
     
     @classmethod
@@ -376,7 +1141,7 @@ class Logger:
         """모든 큐 리스너 정지"""
         for name, listener in cls._listeners.items():
             try:
-                if hasattr(listener, 'stop') and listener.is_alive():
+                if listener._thread is not None:
                     listener.stop()
             except:
                 pass
@@ -406,10 +1171,123 @@ class Logger:
         """예외 정보를 포함한 에러 로그"""
         self.logger.exception(message, *args, exc_info=exc_info, stacklevel=2, **kwargs)
     
+    def bind(self, **fields) -> BoundLogger:
+        """
+        필드가 바인딩된 자식 로거 반환
+        
+        바인딩된 필드는 텍스트 로그 끝에 key=value로 붙고 파케이에는 별도 컬럼으로 저장됩니다.
+        
+        사용 예:
+            request_logger = logger.bind(request_id="abc123", tenant="acme")
+            request_logger.info("요청 처리 시작")
+        
+        Args:
+            **fields: 바인딩할 필드 (값은 문자열로 저장)
+            
+        Returns:
+            BoundLogger 인스턴스
+        """
+        return BoundLogger(self.logger, ContextFields.build(fields))
+    
     def set_level(self, level: int):
         """로그 레벨 변경"""
         self.logger.setLevel(level)
     
+    def stats(self) -> Dict[str, Any]:
+        """
+        로깅 파이프라인 메트릭 스냅샷 반환
+        
+        Returns:
+            로거 단위 카운터/히스토그램과 핸들러별 메트릭을 담은 딕셔너리
+        """
+        uptime = max(time.time() - self._started_at, 1e-9)
+        handlers = {}
+        for handler in self.handlers:
+            key = handler.get_name() or type(handler).__name__
+            if key in handlers:
+                key = f"{key}#{len(handlers)}"
+            handlers[key] = handler_stats(handler).snapshot()
+        
+        return {
+            'name': self.name,
+            'async': self._queue is not None,
+            'uptime': uptime,
+            'records': self._records.value,
+            'records_per_sec': self._records.value / uptime,
+            'drops': self._drops.value,
+            'queue_depth': self._queue.qsize() if self._queue is not None else None,
+            'enqueue_latency': self._enqueue_latency.snapshot(),
+            'handlers': handlers,
+        }
+    
+    @classmethod
+    def stats_all(cls) -> List[Dict[str, Any]]:
+        """생성된 모든 로거의 메트릭 스냅샷 반환"""
+        return [instance.stats() for instance in list(cls._instances.values())]
+    
+    @classmethod
+    def start_metrics_exporter(
+        cls,
+        textfile: Optional[str] = None,
+        http_port: Optional[int] = None,
+        interval: float = 15.0
+    ) -> MetricsExporter:
+        """
+        메트릭 주기적 내보내기 시작
+        
+        Args:
+            textfile: 프로메테우스 textfile collector용 파일 경로
+            http_port: 로컬 HTTP 엔드포인트 포트 (0이면 임의 포트)
+            interval: 텍스트 파일 갱신 주기 (초)
+            
+        Returns:
+            시작된 MetricsExporter (stop()으로 중지)
+        """
+        exporter = MetricsExporter(cls.stats_all, textfile=textfile, http_port=http_port, interval=interval)
+        return exporter.start()
+    
+    @classmethod
+    def _active_log_paths(cls) -> List[Path]:
+        """모든 로거가 현재 쓰고 있는 파케이 파티션과 텍스트 로그 파일 경로"""
+        paths = []
+        for instance in list(cls._instances.values()):
+            for handler in instance.handlers:
+                if isinstance(handler, ParquetLogHandler):
+                    paths.append(partition_dir(handler.base_path, handler.project_name, handler.env))
+                elif isinstance(handler, logging.FileHandler):
+                    paths.append(Path(handler.baseFilename))
+        return paths
+    
+    def start_retention(
+        self,
+        max_age_days: Optional[int] = None,
+        max_bytes: Optional[Union[int, str]] = None,
+        interval: float = 3600.0
+    ) -> RetentionManager:
+        """
+        이 로거의 파케이/텍스트 로그 날짜 파티션 보존 관리 시작
+        
+        Args:
+            max_age_days: 보존 일수
+            max_bytes: 전체 용량 한도 (바이트 또는 '5G' 같은 문자열)
+            interval: 실행 주기 (초)
+            
+        Returns:
+            시작된 RetentionManager (stop()으로 중지)
+        """
+        roots = []
+        for handler in self.handlers:
+            if isinstance(handler, ParquetLogHandler):
+                roots.append(partition_dir(handler.base_path, handler.project_name, handler.env).parent)
+            elif isinstance(handler, logging.FileHandler):
+                # logs/<env>/<YYYY-MM-DD>/app.log 형태일 때만 날짜 디렉토리의 상위 경로를 관리
+                day_dir = Path(handler.baseFilename).parent
+                if PARTITION_NAME.match(day_dir.name):
+                    roots.append(day_dir.parent)
+        manager = RetentionManager(roots, max_age_days=max_age_days, max_bytes=max_bytes, interval=interval,
+                                   protected=Logger._active_log_paths)
+        return manager.start()
+    
     @staticmethod
     def get_default_config(env: str = "development") -> Dict[str, Any]:
         """
@@ -437,7 +1315,7 @@ class Logger:
                 "detailed_format_string": detailed_format,  # 심각한 레벨용 상세 포맷 추가
                 "parquet_logging": True,
                 "env": "development",
-                "colored_console": True,
+                "colored_console": "auto",
                 "async_logging": True,
                 "parquet_flush_threshold": 20
             },
@@ -449,7 +1327,7 @@ class Logger:
                 "detailed_format_string": detailed_format,  # 심각한 레벨용 상세 포맷 추가
                 "parquet_logging": True,
                 "env": "test", 
-                "colored_console": True,
+                "colored_console": "auto",
                 "async_logging": True,
                 "parquet_flush_threshold": 10
             },
@@ -463,10 +1341,15 @@ class Logger:
                 "env": "production",
                 "colored_console": False,
                 "async_logging": True,
-                "parquet_flush_threshold": 30  # 프로덕션 환경에서는 더 큰 버퍼
+                "parquet_flush_threshold": "auto",  # 프로덕션 환경에서는 유입률에 맞춰 자동 조정
+                "parquet_flush_interval": 5.0,
+                "parquet_flush_delays": {"ERROR": 0.005}  # ERROR/CRITICAL은 배치를 기다리지 않고 5ms 안에 저장
             }
         }
         
         return configs.get(env, configs["development"]) 
     
+# reconfigure와 설정 파일에서 쓸 수 있는 설정 이름 (Logger 생성 인자와 같음)
+_CONFIG_KEYS = tuple(inspect.signature(Logger.__init__).parameters)[2:]
+
 logger = Logger("ineeji_log", **Logger.get_default_config("development"))
\ No newline at end of file
@@ -0,0 +1,370 @@
+"""
+로깅 파이프라인 런타임 메트릭 (카운터, 히스토그램, 주기적 내보내기)
+"""
+
+import os
+import threading
+from bisect import bisect_left
+from typing import Optional, Dict, Any, List, Callable, Sequence
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+
+# 지연 시간 히스토그램 기본 버킷 (초 단위)
+LATENCY_BUCKETS = (
+    0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005, 0.0001,
+    0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# 배치 크기 히스토그램 기본 버킷 (레코드 수)
+SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 50000)
+
+
+class _ThreadCells:
+    """
+    스레드별 누적 칸
+
+    각 스레드는 자기 칸에만 더하므로 기록 경로에 락이 없습니다 (락은 스레드당 최초 등록과 읽기에만 사용).
+    읽을 때 모든 칸을 원소별로 합산하며, 종료된 스레드의 칸은 등록 시점에 retired 칸으로 합쳐 정리합니다.
+    """
+
+    __slots__ = ('_local', '_cells', '_retired', '_size', '_lock')
+
+    def __init__(self, size: int):
+        self._local = threading.local()
+        self._cells: List[tuple] = []  # (스레드, 칸)
+        self._retired = [0] * size
+        self._size = size
+        self._lock = threading.Lock()
+
+    def get(self) -> list:
+        """현재 스레드의 칸 반환 (없으면 등록)"""
+        try:
+            return self._local.cell
+        except AttributeError:
+            pass
+        cell = [0] * self._size
+        with self._lock:
+            live = []
+            for thread, other in self._cells:
+                if thread.is_alive():
+                    live.append((thread, other))
+                else:
+                    self._retired = [a + b for a, b in zip(self._retired, other)]
+            live.append((threading.current_thread(), cell))
+            self._cells = live
+        self._local.cell = cell
+        return cell
+
+    def total(self) -> list:
+        """모든 칸의 원소별 합계"""
+        with self._lock:
+            totals = list(self._retired)
+            cells = [cell for _, cell in self._cells]
+        for cell in cells:
+            for index, value in enumerate(list(cell)):
+                totals[index] += value
+        return totals
+
+
+class Counter:
+    """
+    단조 증가 카운터 (스레드별로 누적하고 읽을 때 합산)
+    """
+
+    __slots__ = ('_cells',)
+
+    def __init__(self):
+        self._cells = _ThreadCells(1)
+
+    def inc(self, amount: int = 1):
+        """카운터 증가"""
+        self._cells.get()[0] += amount
+
+    @property
+    def value(self) -> int:
+        """현재 값"""
+        return self._cells.total()[0]
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램 (백분위수는 버킷 상한으로 근사, 스레드별로 누적하고 읽을 때 합산)
+    """
+
+    __slots__ = ('bounds', '_cells')
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        # 칸 구성: 버킷별 개수 (마지막 버킷은 +Inf) + 관측값 합계
+        self._cells = _ThreadCells(len(self.bounds) + 2)
+
+    def observe(self, value: float):
+        """관측값 기록"""
+        cell = self._cells.get()
+        cell[bisect_left(self.bounds, value)] += 1
+        cell[-1] += value
+
+    def _totals(self):
+        """(버킷별 개수, 관측 수, 합계)"""
+        totals = self._cells.total()
+        counts = totals[:-1]
+        return counts, sum(counts), float(totals[-1])
+
+    def _quantile(self, counts: List[int], total: int, q: float) -> float:
+        if total == 0:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return self.bounds[index] if index < len(self.bounds) else float('inf')
+        return float('inf')
+
+    def quantile(self, q: float) -> float:
+        """q 백분위수 근사값 반환 (관측값이 없으면 0)"""
+        counts, total, _ = self._totals()
+        return self._quantile(counts, total, q)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태의 사본 반환 (한 번 합산한 값으로 계산)"""
+        counts, total, value_sum = self._totals()
+        return {
+            'count': total,
+            'sum': value_sum,
+            'buckets': dict(zip(list(self.bounds) + [float('inf')], counts)),
+            'p50': self._quantile(counts, total, 0.5),
+            'p99': self._quantile(counts, total, 0.99),
+            'p999': self._quantile(counts, total, 0.999),
+        }
+
+
+class HandlerStats:
+    """
+    핸들러 단위 메트릭 묶음
+    """
+
+    def __init__(self):
+        self.records = Counter()          # 처리한 레코드 수
+        self.emit_time = Histogram()      # 레코드 처리 시간
+        self.flushes = Counter()          # 플러시 횟수
+        self.flush_time = Histogram()     # 플러시 소요 시간
+        self.flush_batch = Histogram(SIZE_BUCKETS)  # 플러시 배치 크기
+        self.bytes_written = Counter()    # 기록한 바이트 수
+        self.write_errors = Counter()     # 쓰기 실패 횟수
+        self.drops = Counter()            # 유실된 레코드 수
+        self.last_error: Optional[str] = None
+        self.gauges: Dict[str, Callable[[], Any]] = {}  # 조회 시점에 계산되는 값
+
+    def record_flush(self, rows: int, elapsed: float, bytes_written: int = 0, error: Optional[str] = None):
+        """플러시 결과 기록 (error가 있으면 해당 배치는 유실로 처리)"""
+        self.flushes.inc()
+        self.flush_time.observe(elapsed)
+        self.flush_batch.observe(rows)
+        if error is not None:
+            self.write_errors.inc()
+            self.drops.inc(rows)
+            self.last_error = error
+        elif bytes_written:
+            self.bytes_written.inc(bytes_written)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태의 사본 반환"""
+        result = {
+            'records': self.records.value,
+            'emit_time': self.emit_time.snapshot(),
+            'flushes': self.flushes.value,
+            'flush_time': self.flush_time.snapshot(),
+            'flush_batch': self.flush_batch.snapshot(),
+            'bytes_written': self.bytes_written.value,
+            'write_errors': self.write_errors.value,
+            'drops': self.drops.value,
+            'last_error': self.last_error,
+        }
+        for key, getter in self.gauges.items():
+            try:
+                result[key] = getter()
+            except Exception:
+                result[key] = None
+        return result
+
+
+def handler_stats(handler) -> HandlerStats:
+    """핸들러에 연결된 메트릭 반환 (없으면 생성)"""
+    stats = getattr(handler, 'stats', None)
+    if not isinstance(stats, HandlerStats):
+        stats = HandlerStats()
+        handler.stats = stats
+    return stats
+
+
+def _label(value: Any) -> str:
+    """프로메테우스 라벨 값 이스케이프"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_bound(bound: float) -> str:
+    return '+Inf' if bound == float('inf') else repr(float(bound))
+
+
+def _histogram_lines(metric: str, labels: str, snapshot: Dict[str, Any]) -> List[str]:
+    lines = []
+    cumulative = 0
+    for bound, bucket_count in snapshot['buckets'].items():
+        cumulative += bucket_count
+        lines.append(f'{metric}_bucket{{{labels},le="{_format_bound(bound)}"}} {cumulative}')
+    lines.append(f'{metric}_sum{{{labels}}} {snapshot["sum"]}')
+    lines.append(f'{metric}_count{{{labels}}} {snapshot["count"]}')
+    return lines
+
+
+def to_prometheus(snapshots: List[Dict[str, Any]]) -> str:
+    """
+    Logger.stats() 결과 목록을 프로메테우스 텍스트 포맷으로 변환
+
+    Args:
+        snapshots: Logger.stats() 결과 목록
+
+    Returns:
+        프로메테우스 텍스트 노출 포맷 문자열
+    """
+    lines = [
+        '# TYPE ineeji_logging_records_total counter',
+        '# TYPE ineeji_logging_drops_total counter',
+        '# TYPE ineeji_logging_queue_depth gauge',
+        '# TYPE ineeji_logging_enqueue_seconds histogram',
+        '# TYPE ineeji_logging_handler_records_total counter',
+        '# TYPE ineeji_logging_handler_emit_seconds histogram',
+        '# TYPE ineeji_logging_handler_flush_seconds histogram',
+        '# TYPE ineeji_logging_handler_flush_batch_size histogram',
+        '# TYPE ineeji_logging_handler_bytes_written_total counter',
+        '# TYPE ineeji_logging_handler_write_errors_total counter',
+        '# TYPE ineeji_logging_handler_drops_total counter',
+        '# TYPE ineeji_logging_handler_buffer_size gauge',
+    ]
+    for snap in snapshots:
+        logger_label = f'logger="{_label(snap["name"])}"'
+        lines.append(f'ineeji_logging_records_total{{{logger_label}}} {snap["records"]}')
+        lines.append(f'ineeji_logging_drops_total{{{logger_label}}} {snap["drops"]}')
+        if snap.get('queue_depth') is not None:
+            lines.append(f'ineeji_logging_queue_depth{{{logger_label}}} {snap["queue_depth"]}')
+        lines.extend(_histogram_lines('ineeji_logging_enqueue_seconds', logger_label, snap['enqueue_latency']))
+
+        for handler_name, hs in snap['handlers'].items():
+            labels = f'{logger_label},handler="{_label(handler_name)}"'
+            lines.append(f'ineeji_logging_handler_records_total{{{labels}}} {hs["records"]}')
+            lines.append(f'ineeji_logging_handler_bytes_written_total{{{labels}}} {hs["bytes_written"]}')
+            lines.append(f'ineeji_logging_handler_write_errors_total{{{labels}}} {hs["write_errors"]}')
+            lines.append(f'ineeji_logging_handler_drops_total{{{labels}}} {hs["drops"]}')
+            if hs.get('buffer_size') is not None:
+                lines.append(f'ineeji_logging_handler_buffer_size{{{labels}}} {hs["buffer_size"]}')
+            lines.extend(_histogram_lines('ineeji_logging_handler_emit_seconds', labels, hs['emit_time']))
+            lines.extend(_histogram_lines('ineeji_logging_handler_flush_seconds', labels, hs['flush_time']))
+            lines.extend(_histogram_lines('ineeji_logging_handler_flush_batch_size', labels, hs['flush_batch']))
+    return '\n'.join(lines) + '\n'
+
+
+class MetricsExporter:
+    """
+    메트릭을 주기적으로 프로메테우스 텍스트 파일로 쓰거나 로컬 HTTP 엔드포인트로 노출
+    """
+
+    def __init__(
+        self,
+        collect: Callable[[], List[Dict[str, Any]]],
+        textfile: Optional[str] = None,
+        http_port: Optional[int] = None,
+        http_host: str = '127.0.0.1',
+        interval: float = 15.0
+    ):
+        """
+        메트릭 내보내기 초기화
+
+        Args:
+            collect: 스냅샷 목록을 반환하는 함수 (예: Logger.stats_all)
+            textfile: 프로메테우스 textfile collector용 파일 경로
+            http_port: HTTP 엔드포인트 포트 (0이면 임의 포트)
+            http_host: HTTP 엔드포인트 바인드 주소
+            interval: 텍스트 파일 갱신 주기 (초)
+        """
+        self.collect = collect
+        self.textfile = textfile
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._server: Optional[HTTPServer] = None
+        self._server_thread: Optional[threading.Thread] = None
+
+        if http_port is not None:
+            exporter = self
+
+            class _MetricsRequestHandler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    body = exporter.render().encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, format, *args):
+                    # 요청 로그는 출력하지 않음
+                    pass
+
+            self._server = HTTPServer((http_host, http_port), _MetricsRequestHandler)
+
+    @property
+    def http_port(self) -> Optional[int]:
+        """실제로 바인드된 HTTP 포트"""
+        return self._server.server_address[1] if self._server else None
+
+    def render(self) -> str:
+        """현재 메트릭을 텍스트 포맷으로 렌더링"""
+        return to_prometheus(self.collect())
+
+    def write_textfile(self):
+        """텍스트 파일을 원자적으로 갱신"""
+        if not self.textfile:
+            return
+        directory = os.path.dirname(self.textfile)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.textfile}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp_path, self.textfile)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.write_textfile()
+            except Exception:
+                # 메트릭 내보내기 실패가 애플리케이션을 중단해서는 안 됨
+                pass
+
+    def start(self) -> 'MetricsExporter':
+        """내보내기 스레드 시작"""
+        if self.textfile:
+            self.write_textfile()
+            self._thread = threading.Thread(target=self._run, name='ineeji-metrics-exporter', daemon=True)
+            self._thread.start()
+        if self._server:
+            self._server_thread = threading.Thread(
+                target=self._server.serve_forever, name='ineeji-metrics-http', daemon=True
+            )
+            self._server_thread.start()
+        return self
+
+    def stop(self):
+        """내보내기 중지"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+        try:
+            self.write_textfile()
+        except Exception:
+            pass
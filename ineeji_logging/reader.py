@@ -0,0 +1,199 @@
+"""
+파케이 로그 읽기 (저장 시 분리한 정보를 합쳐 전체 레코드 복원)
+"""
+
+import os
+import re
+import logging
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional, Union, List, Iterator
+
+import pandas as pd
+
+from .fingerprint import attach_tracebacks
+from .templates import rebuild_messages
+
+
+# 날짜 파티션 안의 로그 파일 이름
+LOG_FILE = 'log.parquet'
+
+# Arrow IPC 스트림 저장 백엔드가 쓰는 파일 이름 (log.parquet로 변환하기 전)
+ARROW_FILE = 'log.arrows'
+
+# 날짜 파티션 디렉토리 이름 (YYYY-MM-DD)
+PARTITION_NAME = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
+def partition_dir(base_path: Union[str, Path], project_name: str, env: str,
+                  day: Optional[Union[date, str]] = None) -> Path:
+    """
+    날짜 파티션 디렉토리 경로 (<base_path>/<project_name>/<env>/<YYYY-MM-DD>)
+
+    Args:
+        base_path: 기본 로그 저장 경로 (~ 확장)
+        project_name: 프로젝트 이름
+        env: 환경 이름
+        day: 날짜 또는 'YYYY-MM-DD' 문자열 (기본값: 오늘)
+
+    Returns:
+        파티션 디렉토리 경로
+    """
+    if day is None:
+        day = datetime.now().date()
+    if not isinstance(day, str):
+        day = day.strftime('%Y-%m-%d')
+    return Path(os.path.expanduser(str(base_path))) / project_name / env / day
+
+
+def partition_file(partition: Union[str, Path]) -> Path:
+    """
+    파티션에서 읽을 로그 파일 경로
+
+    아직 변환하지 않은 Arrow 스트림 파티션(log.parquet 없이 log.arrows만 있음)이면 log.arrows,
+    그 외에는 log.parquet 경로를 반환합니다.
+    """
+    partition = Path(partition).expanduser()
+    if (partition / ARROW_FILE).exists() and not (partition / LOG_FILE).exists():
+        return partition / ARROW_FILE
+    return partition / LOG_FILE
+
+
+def list_partitions(base_path: Union[str, Path], project_name: str, env: str,
+                    since: Optional[Union[date, str]] = None,
+                    until: Optional[Union[date, str]] = None) -> List[Path]:
+    """
+    로그 파일(log.parquet 또는 log.arrows)이 있는 날짜 파티션 디렉토리 목록 (날짜순)
+
+    Args:
+        base_path: 기본 로그 저장 경로
+        project_name: 프로젝트 이름
+        env: 환경 이름
+        since: 시작 날짜 (포함)
+        until: 종료 날짜 (포함)
+
+    Returns:
+        파티션 디렉토리 목록
+    """
+    root = partition_dir(base_path, project_name, env).parent
+    if not root.is_dir():
+        return []
+    since = since.strftime('%Y-%m-%d') if isinstance(since, date) else since
+    until = until.strftime('%Y-%m-%d') if isinstance(until, date) else until
+    partitions = []
+    for entry in sorted(os.listdir(root)):
+        if not PARTITION_NAME.match(entry):
+            continue
+        if (since and entry < since) or (until and entry > until):
+            continue
+        if partition_file(root / entry).exists():
+            partitions.append(root / entry)
+    return partitions
+
+
+def iter_row_groups(log_file: Union[str, Path], columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    파케이 로그를 로우 그룹 단위로 읽기 (한 번에 로우 그룹 하나만 메모리에 유지)
+
+    변환 전 Arrow 스트림(log.arrows)은 파일 전체를 읽은 뒤 기록된 배치 단위로 나눠 반환합니다.
+
+    Args:
+        log_file: log.parquet(또는 log.arrows) 경로 또는 날짜 파티션 디렉토리
+        columns: 읽을 컬럼 (파일에 없는 컬럼은 무시, 기본값: 전체)
+
+    Returns:
+        로우 그룹별 DataFrame 이터레이터
+    """
+    from fastparquet import ParquetFile
+
+    path = Path(log_file).expanduser()
+    if path.is_dir():
+        path = partition_file(path)
+    if path.name == ARROW_FILE:
+        from .storage import read_arrow_stream
+        table = read_arrow_stream(path)
+        if columns is not None:
+            table = table.select([column for column in columns if column in table.column_names])
+        for batch in table.to_batches():
+            yield batch.to_pandas()
+        return
+    pf = ParquetFile(str(path))
+    if columns is not None:
+        columns = [column for column in columns if column in pf.columns]
+    yield from pf.iter_row_groups(columns=columns)
+
+
+def log_columns(log_file: Union[str, Path]) -> List[str]:
+    """로그 파일의 컬럼 목록 (파케이는 footer만 읽음)"""
+    path = Path(log_file).expanduser()
+    if path.is_dir():
+        path = partition_file(path)
+    if path.name == ARROW_FILE:
+        from .storage import read_arrow_stream
+        return read_arrow_stream(path).column_names
+    from fastparquet import ParquetFile
+    return list(ParquetFile(str(path)).columns)
+
+
+def parse_level(level: Optional[str]) -> int:
+    """로그 레벨 이름을 숫자로 변환 (None이면 NOTSET)"""
+    if level is None:
+        return logging.NOTSET
+    number = logging.getLevelName(level.upper())
+    if not isinstance(number, int):
+        raise ValueError(f"알 수 없는 로그 레벨입니다: {level}")
+    return number
+
+
+def level_numbers(levelnames: pd.Series) -> pd.Series:
+    """levelname 컬럼을 레벨 숫자로 변환 (고유 값만 조회하므로 행 수와 관계없이 빠름)"""
+    levelnames = levelnames.astype(object)
+    mapping = {name: logging.getLevelName(name) for name in levelnames.dropna().unique()}
+    return pd.to_numeric(levelnames.map(mapping), errors='coerce').fillna(0)
+
+
+def filter_logs(df: pd.DataFrame, min_level: int = logging.NOTSET, name: Optional[str] = None) -> pd.DataFrame:
+    """
+    최소 레벨과 로거 이름(하위 로거 포함)으로 행 필터링
+
+    Args:
+        df: 로그 DataFrame
+        min_level: 최소 로그 레벨 숫자
+        name: 로거 이름
+
+    Returns:
+        조건에 맞는 행만 남긴 DataFrame
+    """
+    if min_level > logging.NOTSET and 'levelname' in df.columns:
+        df = df[level_numbers(df['levelname']) >= min_level]
+    if name is not None and 'name' in df.columns:
+        names = df['name'].astype(object)
+        df = df[(names == name) | names.str.startswith(name + '.')]
+    return df
+
+
+def read_parquet_logs(log_file: Union[str, Path], tracebacks: bool = True, messages: bool = True) -> pd.DataFrame:
+    """
+    파케이 로그를 읽고 분리 저장된 정보 복원
+
+    Args:
+        log_file: log.parquet(또는 log.arrows) 경로 또는 날짜 파티션 디렉토리
+        tracebacks: exceptions.parquet를 합쳐 exception 컬럼에 전체 트레이스백을 복원할지 여부
+        messages: template/args 컬럼으로 raw_message를 복원할지 여부
+
+    Returns:
+        로그 DataFrame
+    """
+    path = Path(log_file).expanduser()
+    if path.is_dir():
+        path = partition_file(path)
+    if path.name == ARROW_FILE:
+        from .storage import read_arrow_stream
+        df = read_arrow_stream(path).to_pandas()
+    else:
+        df = pd.read_parquet(path)
+    if tracebacks:
+        df = attach_tracebacks(df, path.parent)
+    if messages:
+        df = rebuild_messages(df)
+    return df
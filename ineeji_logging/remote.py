@@ -0,0 +1,376 @@
+"""
+원격 로그 수집기로 배치 전송하는 TCP 핸들러 (RFC 5424 syslog / 길이 접두 프레임)
+"""
+
+import os
+import json
+import time
+import socket
+import struct
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, List, Deque
+
+from .metrics import HandlerStats
+from .context import record_context
+
+
+# 로그 레벨 -> syslog severity
+_SYSLOG_SEVERITY = {
+    logging.CRITICAL: 2,
+    logging.ERROR: 3,
+    logging.WARNING: 4,
+    logging.INFO: 6,
+    logging.DEBUG: 7,
+}
+
+_BOM = b'\xef\xbb\xbf'
+
+
+def _syslog_severity(levelno: int) -> int:
+    for level, severity in sorted(_SYSLOG_SEVERITY.items(), reverse=True):
+        if levelno >= level:
+            return severity
+    return 7
+
+
+def _syslog_token(value: str, limit: int) -> str:
+    """syslog 헤더 필드 정리 (공백/비ASCII 제거, 길이 제한)"""
+    token = ''.join(ch for ch in value if 33 <= ord(ch) <= 126)[:limit]
+    return token or '-'
+
+
+class DiskSpool:
+    """
+    전송하지 못한 프레임을 보관하는 용량 제한 디스크 버퍼
+
+    세그먼트 파일에 전송할 바이트를 그대로 이어 쓰고, 가장 오래된 세그먼트부터 재전송합니다.
+    용량을 넘으면 가장 오래된 세그먼트를 삭제합니다.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 64 * 1024 * 1024, segment_bytes: int = 1024 * 1024):
+        """
+        디스크 버퍼 초기화
+
+        Args:
+            directory: 세그먼트 파일을 저장할 디렉토리 (기존 세그먼트는 이어서 재전송)
+            max_bytes: 전체 용량 한도 (바이트)
+            segment_bytes: 세그먼트 파일 하나의 크기 (바이트)
+        """
+        self.directory = Path(os.path.expanduser(directory))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        self.dropped_bytes = 0
+        self._segments: Deque[Path] = deque(sorted(self.directory.glob('*.spool')))
+        self._sequence = int(self._segments[-1].stem) + 1 if self._segments else 0
+        self._size = sum(segment.stat().st_size for segment in self._segments)
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    @property
+    def size(self) -> int:
+        """보관 중인 전체 바이트 수"""
+        return self._size
+
+    def append(self, data: bytes):
+        """프레임 바이트를 마지막 세그먼트에 추가"""
+        if not self._segments or self._segments[-1].stat().st_size >= self.segment_bytes:
+            self._segments.append(self.directory / f"{self._sequence:012d}.spool")
+            self._sequence += 1
+        with open(self._segments[-1], 'ab') as f:
+            f.write(data)
+        self._size += len(data)
+
+        # 용량을 넘으면 가장 오래된 세그먼트부터 삭제 (쓰는 중인 세그먼트는 유지)
+        while self._size > self.max_bytes and len(self._segments) > 1:
+            oldest = self._segments.popleft()
+            size = oldest.stat().st_size
+            oldest.unlink()
+            self._size -= size
+            self.dropped_bytes += size
+
+    def peek(self) -> Optional[bytes]:
+        """가장 오래된 세그먼트 내용 반환 (없으면 None)"""
+        if not self._segments:
+            return None
+        return self._segments[0].read_bytes()
+
+    def pop(self):
+        """가장 오래된 세그먼트 삭제 (재전송 완료 후 호출)"""
+        oldest = self._segments.popleft()
+        self._size -= oldest.stat().st_size
+        oldest.unlink()
+
+
+class RemoteHandler(logging.Handler):
+    """
+    원격 수집기로 로그를 배치 전송하는 TCP 핸들러
+
+    emit은 프레임을 메모리 버퍼에 넣기만 하고, 전용 전송 스레드가 하나의 연결을 유지하며
+    배치 단위로 전송합니다. 연결이 끊기면 백오프로 재연결하는 동안 디스크 버퍼에 보관했다가
+    연결이 돌아오면 순서대로 재전송합니다. 수신측이 느려도 애플리케이션 스레드는 막히지 않습니다.
+    재전송은 세그먼트 단위이므로 연결이 끊긴 시점에 따라 일부 레코드가 중복 전송될 수 있습니다.
+    """
+
+    SYSLOG = 'syslog'
+    LENGTH_PREFIXED = 'length'
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        framing: str = SYSLOG,
+        app_name: Optional[str] = None,
+        facility: int = 1,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        max_pending: int = 100000,
+        spill_dir: Optional[str] = None,
+        max_spill_bytes: int = 64 * 1024 * 1024,
+        connect_timeout: float = 3.0,
+        send_timeout: float = 5.0,
+        backoff_initial: float = 0.5,
+        backoff_max: float = 30.0
+    ):
+        """
+        원격 핸들러 초기화
+
+        Args:
+            host: 수집기 호스트
+            port: 수집기 포트
+            framing: 'syslog' (RFC 5424 + RFC 6587 octet-counting) 또는 'length' (4바이트 길이 + JSON)
+            app_name: syslog APP-NAME (기본값: 로거 이름)
+            facility: syslog facility (기본값: 1, user-level)
+            batch_size: 한 번에 전송할 최대 레코드 수
+            flush_interval: 배치를 기다리는 최대 시간 (초)
+            max_pending: 메모리 버퍼 최대 레코드 수 (초과 시 유실로 집계)
+            spill_dir: 디스크 버퍼 디렉토리 (없으면 연결 끊김 동안 메모리에만 보관)
+            max_spill_bytes: 디스크 버퍼 용량 한도 (바이트)
+            connect_timeout: 연결 제한 시간 (초)
+            send_timeout: 전송 제한 시간 (초, 초과 시 연결 끊김으로 처리)
+            backoff_initial: 재연결 대기 시간 초기값 (초)
+            backoff_max: 재연결 대기 시간 최대값 (초)
+        """
+        if framing not in (self.SYSLOG, self.LENGTH_PREFIXED):
+            raise ValueError(f"지원하지 않는 프레이밍입니다: {framing}")
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.framing = framing
+        self.app_name = app_name
+        self.facility = facility
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.connect_timeout = connect_timeout
+        self.send_timeout = send_timeout
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.hostname = _syslog_token(socket.gethostname(), 255)
+        self.spool = DiskSpool(spill_dir, max_spill_bytes) if spill_dir else None
+
+        self.stats = HandlerStats()
+        self.stats.gauges['pending'] = lambda: len(self._pending)
+        self.stats.gauges['connected'] = lambda: self._sock is not None
+        self.stats.gauges['spill_bytes'] = lambda: self.spool.size if self.spool else 0
+
+        self._pending: Deque[bytes] = deque()
+        self._cond = threading.Condition()
+        self._sock: Optional[socket.socket] = None
+        self._backoff = backoff_initial
+        self._next_connect = 0.0
+        self._closing = False
+        self._sender = threading.Thread(target=self._run, name=f'ineeji-remote-{host}:{port}', daemon=True)
+        self._sender.start()
+
+    # ---- 프레임 생성 ----
+
+    def _syslog_frame(self, record: logging.LogRecord) -> bytes:
+        pri = self.facility * 8 + _syslog_severity(record.levelno)
+        timestamp = datetime.fromtimestamp(record.created).astimezone().isoformat(timespec='microseconds')
+        app_name = _syslog_token(self.app_name or record.name, 48)
+        header = f"<{pri}>1 {timestamp} {self.hostname} {app_name} {record.process or '-'} {record.levelname} - "
+        message = header.encode('utf-8') + _BOM + self.format(record).encode('utf-8')
+        return str(len(message)).encode('ascii') + b' ' + message
+
+    def _length_frame(self, record: logging.LogRecord) -> bytes:
+        document = {
+            'datetime': datetime.fromtimestamp(record.created).isoformat(),
+            'levelname': record.levelname,
+            'name': record.name,
+            'message': self.format(record),
+            'raw_message': record.getMessage(),
+            'pathname': record.pathname,
+            'lineno': record.lineno,
+            'funcName': record.funcName,
+            'process': record.process,
+            'thread': record.thread,
+        }
+        context = record_context(record)
+        if context is not None:
+            document.update(context.values)
+        payload = json.dumps(document, ensure_ascii=False).encode('utf-8')
+        return struct.pack('>I', len(payload)) + payload
+
+    def emit(self, record):
+        """로그 레코드를 프레임으로 만들어 전송 버퍼에 추가 (블로킹 없음)"""
+        try:
+            if self.framing == self.SYSLOG:
+                frame = self._syslog_frame(record)
+            else:
+                frame = self._length_frame(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._cond:
+            if len(self._pending) >= self.max_pending:
+                self.stats.drops.inc()
+                return
+            self._pending.append(frame)
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify()
+
+    # ---- 전송 스레드 ----
+
+    def _connect(self) -> bool:
+        if self._sock is not None:
+            return True
+        if time.monotonic() < self._next_connect:
+            return False
+        try:
+            sock = socket.create_connection((self.host, self.port), timeout=self.connect_timeout)
+            sock.settimeout(self.send_timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            self._connection_failed(e)
+            return False
+        self._sock = sock
+        self._backoff = self.backoff_initial
+        return True
+
+    def _connection_failed(self, error: Exception):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+        self.stats.write_errors.inc()
+        self.stats.last_error = f"{type(error).__name__}: {error}"
+        self._next_connect = time.monotonic() + self._backoff
+        self._backoff = min(self._backoff * 2, self.backoff_max)
+
+    def _send(self, data: bytes, rows: int) -> bool:
+        start = time.perf_counter()
+        try:
+            self._sock.sendall(data)
+        except OSError as e:
+            self._connection_failed(e)
+            return False
+        self.stats.record_flush(rows, time.perf_counter() - start, len(data))
+        return True
+
+    def _take_batch(self) -> List[bytes]:
+        with self._cond:
+            count = min(self.batch_size, len(self._pending))
+            return [self._pending.popleft() for _ in range(count)]
+
+    def _requeue(self, batch: List[bytes]):
+        """전송 실패한 배치를 순서를 유지한 채 보관"""
+        if self.spool is not None:
+            self.spool.append(b''.join(batch))
+            return
+        with self._cond:
+            self._pending.extendleft(reversed(batch))
+            while len(self._pending) > self.max_pending:
+                self._pending.pop()
+                self.stats.drops.inc()
+
+    def _drain_once(self) -> bool:
+        """
+        전송 가능한 만큼 전송
+
+        Returns:
+            더 보낼 데이터가 남아 있고 바로 이어서 보낼 수 있는지 여부
+        """
+        connected = self._connect()
+
+        # 디스크에 밀린 데이터가 있으면 순서 유지를 위해 먼저 재전송
+        while connected and self.spool is not None and len(self.spool):
+            data = self.spool.peek()
+            if not self._send(data, 0):
+                connected = False
+                break
+            self.spool.pop()
+
+        batch = self._take_batch()
+        if not batch:
+            return False
+        if connected and self._send(b''.join(batch), len(batch)):
+            return bool(self._pending)
+        self._requeue(batch)
+        if self.spool is not None:
+            # 연결이 없으면 메모리에 쌓인 레코드를 모두 디스크로 옮김 (max_pending에 걸려 유실되지 않도록)
+            batch = self._take_batch()
+            while batch:
+                self._requeue(batch)
+                batch = self._take_batch()
+        return False
+
+    def _run(self):
+        while True:
+            with self._cond:
+                # 재연결 대기 중에는 보낼 배치가 차 있어도 보낼 수 없으므로 재연결 시각까지 대기
+                # (디스크 버퍼가 있으면 배치가 찰 때마다 깨어나 디스크로 옮김)
+                while not self._closing and self._sock is None:
+                    if self.spool is not None and len(self._pending) >= self.batch_size:
+                        break
+                    delay = self._next_connect - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                if not self._closing and len(self._pending) < self.batch_size:
+                    self._cond.wait(self.flush_interval)
+                closing = self._closing
+            try:
+                while self._drain_once():
+                    pass
+            except Exception as e:
+                self.stats.write_errors.inc()
+                self.stats.last_error = f"{type(e).__name__}: {e}"
+            if closing:
+                break
+
+    def flush(self):
+        """전송 스레드에 즉시 전송 요청"""
+        with self._cond:
+            self._cond.notify()
+
+    def close(self):
+        """남은 레코드를 전송(또는 디스크 보관)한 뒤 연결 종료"""
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        if self._sender is not threading.current_thread():
+            self._sender.join(timeout=self.send_timeout + self.connect_timeout + 1)
+        # 전송하지 못한 레코드는 다음 실행 때 재전송되도록 디스크에 보관
+        leftover = self._take_batch()
+        while leftover:
+            if self.spool is not None:
+                self.spool.append(b''.join(leftover))
+            else:
+                self.stats.drops.inc(len(leftover))
+            leftover = self._take_batch()
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+        super().close()
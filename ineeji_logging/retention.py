@@ -0,0 +1,300 @@
+"""
+날짜 파티션 보존 기간/용량 관리
+
+사용법:
+    python -m ineeji_logging prune --project my_app --env production --max-age-days 30 --max-bytes 5G --dry-run
+    python -m ineeji_logging prune --project my_app --env production --text-root logs/production --max-bytes 5G
+
+~/.ineeji/logs/<project>/<env>/<YYYY-MM-DD>/ (파케이)와 logs/<env>/<YYYY-MM-DD>/ (텍스트) 아래의
+날짜 파티션 중 보존 기간이 지난 것과, 전체 용량이 한도를 넘으면 오래된 것부터 삭제합니다.
+오늘 파티션과 현재 쓰는 중인 파티션은 삭제하지 않습니다.
+"""
+
+import os
+import re
+import sys
+import shutil
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional, Union, List, Iterable, Callable
+
+from .reader import partition_dir, PARTITION_NAME
+
+
+_SIZE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)I?B?\s*$', re.IGNORECASE)
+_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+
+
+def parse_size(value: Union[int, str]) -> int:
+    """'500M', '5G', '1.5GB' 같은 크기 문자열을 바이트로 변환"""
+    if isinstance(value, int):
+        return value
+    match = _SIZE.match(value)
+    if not match:
+        raise ValueError(f"잘못된 크기입니다: {value}")
+    return int(float(match.group(1)) * _UNITS[match.group(2).upper()])
+
+
+def _format_size(size: int) -> str:
+    for unit in ('B', 'K', 'M', 'G'):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}T"
+
+
+def _directory_size(path: Path) -> int:
+    total = 0
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        return 0
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                total += _directory_size(Path(entry.path))
+            else:
+                total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            pass
+    return total
+
+
+class Partition:
+    """보존 관리 대상 날짜 파티션"""
+
+    __slots__ = ('path', 'day', 'size', 'protected', 'reason')
+
+    def __init__(self, path: Path, day: date, size: int, protected: bool):
+        self.path = path
+        self.day = day
+        self.size = size
+        self.protected = protected
+        self.reason: Optional[str] = None  # 삭제 사유 ('age' 또는 'size'), 유지하면 None
+
+    def __repr__(self) -> str:
+        return f"Partition({str(self.path)!r}, size={self.size}, reason={self.reason!r})"
+
+
+class RetentionReport:
+    """보존 정책 적용 결과 (dry-run이면 삭제할 목록)"""
+
+    def __init__(self, partitions: List[Partition], dry_run: bool):
+        self.partitions = partitions
+        self.dry_run = dry_run
+        self.errors: List[str] = []
+
+    @property
+    def deleted(self) -> List[Partition]:
+        """삭제(dry-run이면 삭제 예정)한 파티션"""
+        return [p for p in self.partitions if p.reason is not None]
+
+    @property
+    def total_bytes(self) -> int:
+        """정책 적용 전 전체 용량"""
+        return sum(p.size for p in self.partitions)
+
+    @property
+    def freed_bytes(self) -> int:
+        """삭제로 확보한 용량"""
+        return sum(p.size for p in self.deleted)
+
+    def format(self) -> str:
+        """사람이 읽을 수 있는 보고서"""
+        action = "삭제 예정" if self.dry_run else "삭제"
+        lines = [f"{len(self.partitions)}개 파티션, 전체 {_format_size(self.total_bytes)}"]
+        for p in self.deleted:
+            reason = "보존 기간 초과" if p.reason == 'age' else "용량 한도 초과"
+            lines.append(f"  {action}: {p.path} ({_format_size(p.size)}, {reason})")
+        lines.append(f"{action} {len(self.deleted)}개, {_format_size(self.freed_bytes)} 확보 "
+                     f"-> {_format_size(self.total_bytes - self.freed_bytes)}")
+        lines.extend(f"  실패: {error}" for error in self.errors)
+        return '\n'.join(lines)
+
+
+class RetentionManager:
+    """
+    날짜 파티션 보존 관리자
+
+    여러 루트(파케이 환경 디렉토리, 텍스트 로그 환경 디렉토리)의 파티션을 날짜순으로 합쳐
+    보존 기간과 전체 용량 한도를 함께 적용합니다. start()로 낮은 우선순위 백그라운드 스레드에서
+    주기적으로 실행할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[Union[str, Path]],
+        max_age_days: Optional[int] = None,
+        max_bytes: Optional[Union[int, str]] = None,
+        interval: float = 3600.0,
+        protected: Optional[Callable[[], Iterable[Path]]] = None,
+        pause: float = 0.05
+    ):
+        """
+        보존 관리자 초기화
+
+        Args:
+            roots: 날짜 파티션(YYYY-MM-DD 디렉토리)들이 있는 디렉토리 목록
+            max_age_days: 보존 일수 (오늘 기준으로 이보다 오래된 파티션 삭제)
+            max_bytes: 전체 용량 한도 (바이트 또는 '5G' 같은 문자열)
+            interval: 백그라운드 실행 주기 (초)
+            protected: 삭제하면 안 되는 경로를 반환하는 함수 (쓰는 중인 파티션 등)
+            pause: 파티션 하나를 삭제한 뒤 쉬는 시간 (디스크 I/O 분산)
+        """
+        self.roots = [Path(os.path.expanduser(str(root))) for root in roots]
+        self.max_age_days = max_age_days
+        self.max_bytes = parse_size(max_bytes) if max_bytes is not None else None
+        self.interval = interval
+        self.protected = protected
+        self.pause = pause
+        self.last_report: Optional[RetentionReport] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _protected_paths(self) -> set:
+        paths = set()
+        if self.protected is not None:
+            for path in self.protected():
+                paths.add(os.path.realpath(path))
+        return paths
+
+    def scan(self, today: Optional[date] = None) -> List[Partition]:
+        """루트 아래 날짜 파티션 목록 (오래된 순)"""
+        today = today or datetime.now().date()
+        protected = self._protected_paths()
+        partitions = []
+        for root in self.roots:
+            try:
+                names = os.listdir(root)
+            except OSError:
+                continue
+            for name in names:
+                path = root / name
+                if not PARTITION_NAME.match(name) or not path.is_dir():
+                    continue
+                try:
+                    day = datetime.strptime(name, '%Y-%m-%d').date()
+                except ValueError:
+                    continue
+                real = os.path.realpath(path)
+                is_protected = day >= today or any(
+                    real == p or p.startswith(real + os.sep) for p in protected
+                )
+                partitions.append(Partition(path, day, _directory_size(path), is_protected))
+        partitions.sort(key=lambda p: (p.day, str(p.path)))
+        return partitions
+
+    def plan(self, today: Optional[date] = None) -> RetentionReport:
+        """삭제할 파티션 결정 (실제로 삭제하지 않음)"""
+        today = today or datetime.now().date()
+        partitions = self.scan(today)
+        if self.max_age_days is not None:
+            cutoff = today - timedelta(days=self.max_age_days)
+            for p in partitions:
+                if not p.protected and p.day < cutoff:
+                    p.reason = 'age'
+        if self.max_bytes is not None:
+            remaining = sum(p.size for p in partitions if p.reason is None)
+            for p in partitions:
+                if remaining <= self.max_bytes:
+                    break
+                if p.reason is None and not p.protected:
+                    p.reason = 'size'
+                    remaining -= p.size
+        return RetentionReport(partitions, dry_run=True)
+
+    def run_once(self, dry_run: bool = False, today: Optional[date] = None) -> RetentionReport:
+        """
+        보존 정책을 한 번 적용
+
+        Args:
+            dry_run: True이면 삭제하지 않고 보고서만 반환
+            today: 기준 날짜 (기본값: 오늘)
+
+        Returns:
+            RetentionReport
+        """
+        report = self.plan(today)
+        report.dry_run = dry_run
+        if not dry_run:
+            for p in report.deleted:
+                if self._stop.is_set() and self._thread is threading.current_thread():
+                    p.reason = None  # 종료 중 - 남은 파티션은 다음 실행에서 처리
+                    continue
+                try:
+                    shutil.rmtree(p.path)
+                except OSError as e:
+                    p.reason = None
+                    report.errors.append(f"{p.path}: {e}")
+                if self.pause:
+                    self._stop.wait(self.pause)
+        self.last_report = report
+        return report
+
+    def _run(self):
+        # 로깅 스레드보다 낮은 CPU 우선순위로 실행 (리눅스에서는 스레드 단위로 적용)
+        if hasattr(os, 'setpriority') and hasattr(threading, 'get_native_id'):
+            try:
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+            except OSError:
+                pass
+        while True:
+            try:
+                self.run_once()
+            except Exception:
+                # 보존 관리 실패가 애플리케이션을 중단해서는 안 됨
+                pass
+            if self._stop.wait(self.interval):
+                break
+
+    def start(self) -> 'RetentionManager':
+        """백그라운드 보존 관리 시작"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='ineeji-retention', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """백그라운드 보존 관리 중지"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+def log_roots(base_path: Union[str, Path], project_name: str, env: str,
+              text_roots: Iterable[Union[str, Path]] = ()) -> List[Path]:
+    """프로젝트/환경의 파케이 파티션 루트와 텍스트 로그 루트 목록"""
+    return [partition_dir(base_path, project_name, env).parent] + [Path(root) for root in text_roots]
+
+
+# ---- CLI ----
+
+def add_arguments(parser):
+    """prune 하위 명령 인자 등록"""
+    parser.add_argument('--project', required=True, help='프로젝트 이름')
+    parser.add_argument('--env', default='development', help='환경 이름 (기본값: development)')
+    parser.add_argument('--base-path', default='~/.ineeji/logs', help='파케이 로그 기본 경로')
+    parser.add_argument('--text-root', action='append', default=[],
+                        help='텍스트 로그 날짜 디렉토리들의 상위 경로 (예: logs/production, 여러 번 지정 가능)')
+    parser.add_argument('--max-age-days', type=int, default=None, help='보존 일수')
+    parser.add_argument('--max-bytes', default=None, help='전체 용량 한도 (예: 500M, 5G)')
+    parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 삭제할 목록만 출력')
+    parser.set_defaults(func=run)
+
+
+def run(args) -> int:
+    """prune 하위 명령 실행"""
+    if args.max_age_days is None and args.max_bytes is None:
+        print("--max-age-days 또는 --max-bytes 중 하나 이상을 지정하세요", file=sys.stderr)
+        return 2
+    try:
+        manager = RetentionManager(log_roots(args.base_path, args.project, args.env, args.text_root),
+                                   max_age_days=args.max_age_days, max_bytes=args.max_bytes, pause=0)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    report = manager.run_once(dry_run=args.dry_run)
+    print(report.format())
+    return 1 if report.errors else 0
@@ -0,0 +1,314 @@
+"""
+파케이 로그 메시지 토큰 역색인과 검색
+
+사용법:
+    python -m ineeji_logging search --project my_app --env production "order-12345"
+    python -m ineeji_logging index --project my_app --env production   # 지난 파티션 색인 생성/압축
+
+날짜 파티션마다 index.parquet에 토큰 -> 행 범위(start, stop) 목록을 저장합니다.
+검색은 단어 단위(대소문자 무시)로 일치를 확인합니다. 질의 토큰의 행 범위만 읽어 후보 행을 구하고,
+후보 행이 들어 있는 로우 그룹만 읽은 뒤 실제 메시지로 다시 확인하므로
+색인이 없거나 일부만 있어도 결과는 정확합니다.
+
+색인에는 빈 토큰('')으로 색인된 행 범위를 함께 기록해, 색인되지 않은 행은 전체 스캔으로 처리합니다.
+"""
+
+import os
+import re
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Optional, Union, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .reader import list_partitions, iter_row_groups, partition_file, log_columns, ARROW_FILE
+from .fingerprint import attach_tracebacks
+from .templates import rebuild_messages
+
+
+INDEX_FILE = 'index.parquet'
+
+# 색인하는 최소 토큰 길이 (더 짧은 질의 토큰은 색인 없이 확인)
+MIN_TOKEN_LENGTH = 2
+
+# 압축한 색인의 로우 그룹 크기 (토큰순 정렬 + min/max 통계로 필요한 로우 그룹만 읽음)
+INDEX_ROW_GROUP_ROWS = 20000
+
+# 색인된 행 범위를 기록하는 토큰
+_COVERAGE = ''
+
+_TOKEN = re.compile(r'\w+')
+
+_MESSAGE_COLUMNS = ['template', 'args', 'raw_message']
+
+
+def tokenize(text: str) -> List[str]:
+    """텍스트를 색인 토큰 목록으로 분리 (소문자, 중복 제거, 등장 순서 유지)"""
+    tokens = dict.fromkeys(token for token in _TOKEN.findall(text.lower()) if len(token) >= MIN_TOKEN_LENGTH)
+    return list(tokens)
+
+
+def _phrase_pattern(query: str) -> 're.Pattern':
+    """질의를 단어 경계에서만 일치하는 정규식으로 변환 ("order-12"는 "order-123"과 일치하지 않음)"""
+    pattern = re.escape(query.lower())
+    if query[:1] and _TOKEN.match(query[:1]):
+        pattern = r'(?<!\w)' + pattern
+    if query[-1:] and _TOKEN.match(query[-1:]):
+        pattern += r'(?!\w)'
+    return re.compile(pattern)
+
+
+def _messages(df: pd.DataFrame) -> pd.Series:
+    """색인/검색 대상 메시지 (template/args에서 복원한 raw_message)"""
+    if 'template' in df.columns:
+        df = rebuild_messages(df[[column for column in _MESSAGE_COLUMNS if column in df.columns]].copy())
+    if 'raw_message' not in df.columns:
+        return pd.Series('', index=df.index, dtype=object)
+    return df['raw_message'].astype(object).fillna('').astype(str)
+
+
+def build_postings(df: pd.DataFrame, base_row: int) -> pd.DataFrame:
+    """
+    로그 DataFrame의 토큰 -> 행 범위 목록 생성
+
+    Args:
+        df: 로그 DataFrame (연속된 행)
+        base_row: df 첫 행의 파일 내 행 번호
+
+    Returns:
+        token, start, stop 컬럼의 DataFrame (색인 범위 행 포함)
+    """
+    rows = np.arange(base_row, base_row + len(df), dtype='int64')
+    tokens = _messages(df).str.lower().str.findall(_TOKEN.pattern)
+    pairs = pd.DataFrame({'row': rows, 'token': tokens.values}).explode('token').dropna()
+    pairs = pairs[pairs['token'].str.len() >= MIN_TOKEN_LENGTH].drop_duplicates()
+    pairs = pairs.sort_values(['token', 'row'], kind='stable')
+
+    # 같은 토큰의 연속된 행은 하나의 범위로 합침
+    token = pairs['token'].to_numpy()
+    row = pairs['row'].to_numpy(dtype='int64')
+    new_range = np.ones(len(pairs), dtype=bool)
+    if len(pairs) > 1:
+        new_range[1:] = (token[1:] != token[:-1]) | (row[1:] != row[:-1] + 1)
+    first = np.flatnonzero(new_range)
+    last = np.append(first[1:] - 1, len(pairs) - 1).astype('int64')
+    postings = pd.DataFrame({'token': token[first], 'start': row[first], 'stop': row[last] + 1})
+
+    coverage = pd.DataFrame({'token': [_COVERAGE], 'start': [base_row], 'stop': [base_row + len(df)]})
+    return pd.concat([coverage, postings], ignore_index=True).astype({'start': 'int64', 'stop': 'int64'})
+
+
+def _write_index(path: Path, postings: pd.DataFrame, append: bool):
+    from fastparquet import write
+    write(str(path), postings, compression='snappy', append=append, stats=['token'],
+          row_group_offsets=INDEX_ROW_GROUP_ROWS)
+
+
+def update_index(partition: Path, df: pd.DataFrame, base_row: int):
+    """
+    새로 저장한 배치의 색인을 파티션 색인에 추가 (플러시 시 호출)
+
+    Args:
+        partition: 날짜 파티션 디렉토리
+        df: 새로 저장한 배치
+        base_row: 배치 첫 행의 파일 내 행 번호
+    """
+    path = Path(partition) / INDEX_FILE
+    if base_row == 0 and path.exists():
+        path.unlink()  # 로그 파일이 새로 만들어짐 - 이전 색인은 맞지 않음
+    _write_index(path, build_postings(df, base_row), append=path.exists())
+
+
+def build_index(partition: Union[str, Path]) -> int:
+    """
+    파티션 전체 색인을 새로 만들어 토큰순으로 정렬해 저장 (압축)
+
+    플러시 시 추가된 색인은 배치 단위의 작은 로우 그룹으로 쌓이므로, 쓰기가 끝난 파티션은
+    이 함수로 다시 만들면 토큰 통계로 필요한 로우 그룹만 읽을 수 있어 검색이 빨라집니다.
+
+    Args:
+        partition: 날짜 파티션 디렉토리
+
+    Returns:
+        색인한 행 수
+    """
+    partition = Path(partition).expanduser()
+    parts, rows = [], 0
+    for chunk in iter_row_groups(partition, columns=_MESSAGE_COLUMNS):
+        parts.append(build_postings(chunk, rows))
+        rows += len(chunk)
+    postings = pd.concat(parts, ignore_index=True) if parts else build_postings(pd.DataFrame(), 0)
+    postings = postings.sort_values(['token', 'start'], kind='stable', ignore_index=True)
+
+    temp = partition / (INDEX_FILE + '.tmp')
+    _write_index(temp, postings, append=False)
+    os.replace(temp, partition / INDEX_FILE)
+    return rows
+
+
+def _ranges_mask(starts: pd.Series, stops: pd.Series, total: int) -> np.ndarray:
+    """[start, stop) 범위 목록을 행 마스크로 변환"""
+    delta = np.zeros(total + 1, dtype='int64')
+    np.add.at(delta, starts.clip(upper=total).to_numpy(), 1)
+    np.add.at(delta, stops.clip(upper=total).to_numpy(), -1)
+    return np.cumsum(delta[:-1]) > 0
+
+
+def _candidate_rows(partition: Path, tokens: List[str], total: int) -> np.ndarray:
+    """색인으로 후보 행 마스크 계산 (색인되지 않은 행은 항상 후보)"""
+    path = partition / INDEX_FILE
+    if not tokens or not path.exists():
+        return np.ones(total, dtype=bool)
+
+    from fastparquet import ParquetFile
+    try:
+        pf = ParquetFile(str(path))
+        wanted = tokens + [_COVERAGE]
+        postings = pf.to_pandas(filters=[('token', 'in', wanted)])
+    except Exception:
+        return np.ones(total, dtype=bool)
+    postings = postings[postings['token'].isin(wanted)]
+
+    coverage = postings[postings['token'] == _COVERAGE]
+    not_covered = ~_ranges_mask(coverage['start'], coverage['stop'], total)
+    candidates = np.ones(total, dtype=bool)
+    for token in tokens:
+        entries = postings[postings['token'] == token]
+        candidates &= _ranges_mask(entries['start'], entries['stop'], total) | not_covered
+    return candidates
+
+
+def search_partition(partition: Union[str, Path], query: str, tracebacks: bool = True) -> Tuple[pd.DataFrame, int]:
+    """
+    파티션에서 메시지에 query가 단어 단위로 들어 있는 행 검색 (대소문자 무시)
+
+    Args:
+        partition: 날짜 파티션 디렉토리
+        query: 찾을 문자열
+        tracebacks: exception 컬럼에 전체 트레이스백 복원 여부
+
+    Returns:
+        (일치하는 행 DataFrame, 읽은 로우 그룹 수)
+    """
+    from fastparquet import ParquetFile
+
+    partition = Path(partition).expanduser()
+    path = partition_file(partition)
+    if path.name == ARROW_FILE:
+        # 변환 전 Arrow 스트림은 기록된 배치를 로우 그룹처럼 사용 (색인은 변환할 때 만듦)
+        groups = list(iter_row_groups(path))
+        counts = [len(group) for group in groups]
+        columns = log_columns(path)
+        read_group = groups.__getitem__
+    else:
+        pf = ParquetFile(str(path))
+        counts = [rg.num_rows for rg in pf.row_groups]
+        columns = pf.columns
+
+        def read_group(index):
+            return pf[index].to_pandas()
+    candidates = _candidate_rows(partition, tokenize(query), sum(counts))
+
+    pattern = _phrase_pattern(query)
+    matches, groups_read, start = [], 0, 0
+    for index, count in enumerate(counts):
+        selected = candidates[start:start + count]
+        start += count
+        if not selected.any():
+            continue
+        groups_read += 1
+        chunk = read_group(index)[selected]
+        found = chunk[_messages(chunk).str.lower().str.contains(pattern)]
+        if len(found):
+            matches.append(found)
+
+    if not matches:
+        return pd.DataFrame(columns=columns), groups_read
+    result = rebuild_messages(pd.concat(matches))
+    if tracebacks:
+        result = attach_tracebacks(result, partition)
+    return result, groups_read
+
+
+def search_logs(
+    base_path: Union[str, Path],
+    project_name: str,
+    env: str,
+    query: str,
+    since: Optional[Union[date, str]] = None,
+    until: Optional[Union[date, str]] = None,
+    tracebacks: bool = True
+) -> pd.DataFrame:
+    """
+    날짜 파티션들에서 메시지에 query가 단어 단위로 들어 있는 행 검색
+
+    Args:
+        base_path: 기본 로그 저장 경로
+        project_name: 프로젝트 이름
+        env: 환경 이름
+        query: 찾을 문자열 (대소문자 무시)
+        since: 시작 날짜 (포함)
+        until: 종료 날짜 (포함)
+        tracebacks: exception 컬럼에 전체 트레이스백 복원 여부
+
+    Returns:
+        일치하는 행 DataFrame (날짜순)
+    """
+    results = []
+    for partition in list_partitions(base_path, project_name, env, since, until):
+        found, _ = search_partition(partition, query, tracebacks=tracebacks)
+        if len(found):
+            results.append(found)
+    if not results:
+        return pd.DataFrame()
+    return pd.concat(results, ignore_index=True)
+
+
+# ---- CLI ----
+
+def add_search_arguments(parser):
+    """search 하위 명령 인자 등록"""
+    parser.add_argument('query', help='찾을 문자열 (단어 단위, 대소문자 무시)')
+    parser.add_argument('--project', required=True, help='프로젝트 이름')
+    parser.add_argument('--env', default='development', help='환경 이름 (기본값: development)')
+    parser.add_argument('--base-path', default='~/.ineeji/logs', help='파케이 로그 기본 경로')
+    parser.add_argument('--since', default=None, help='시작 날짜 (YYYY-MM-DD, 포함)')
+    parser.add_argument('--until', default=None, help='종료 날짜 (YYYY-MM-DD, 포함)')
+    parser.set_defaults(func=run_search)
+
+
+def run_search(args) -> int:
+    """search 하위 명령 실행"""
+    df = search_logs(args.base_path, args.project, args.env, args.query, args.since, args.until)
+    for row in df.to_dict('records'):
+        timestamp = row['datetime'].strftime('%Y-%m-%d %H:%M:%S,%f')[:-3]
+        print(f"{timestamp} [{row['levelname']}] {row['name']}: {row.get('raw_message')}")
+    print(f"{len(df)}건", file=sys.stderr)
+    return 0
+
+
+def add_index_arguments(parser):
+    """index 하위 명령 인자 등록"""
+    parser.add_argument('--project', required=True, help='프로젝트 이름')
+    parser.add_argument('--env', default='development', help='환경 이름 (기본값: development)')
+    parser.add_argument('--base-path', default='~/.ineeji/logs', help='파케이 로그 기본 경로')
+    parser.add_argument('--since', default=None, help='시작 날짜 (YYYY-MM-DD, 포함)')
+    parser.add_argument('--until', default=None, help='종료 날짜 (YYYY-MM-DD, 포함)')
+    parser.add_argument('--include-today', action='store_true', help='쓰는 중인 오늘 파티션도 색인')
+    parser.set_defaults(func=run_index)
+
+
+def run_index(args) -> int:
+    """index 하위 명령 실행"""
+    today = date.today().strftime('%Y-%m-%d')
+    for partition in list_partitions(args.base_path, args.project, args.env, args.since, args.until):
+        if partition.name == today and not args.include_today:
+            continue
+        if partition_file(partition).name == ARROW_FILE:
+            print(f"{partition}: 변환 전 Arrow 파티션 - convert --index로 색인하세요", file=sys.stderr)
+            continue
+        rows = build_index(partition)
+        print(f"{partition}: {rows}행 색인", file=sys.stderr)
+    return 0
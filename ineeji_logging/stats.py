@@ -0,0 +1,181 @@
+"""
+파케이 로그 집계 (레벨별 분당 건수, 상위 로거, 일별 에러율)
+
+사용법:
+    python -m ineeji_logging stats --project my_app --env production --since 2024-01-01
+    python -m ineeji_logging stats --project my_app --per-minute --format json
+
+집계에 필요한 컬럼(datetime, levelname, name)만 로우 그룹 단위로 읽어 벡터화된 group-by로
+부분 집계한 뒤 합치므로, 한 달치 로그도 로우 그룹 하나 크기의 메모리로 처리할 수 있습니다.
+"""
+
+import sys
+import json
+import logging
+from datetime import date
+from pathlib import Path
+from typing import Optional, Union, List, Dict, Any
+
+import pandas as pd
+
+from .reader import list_partitions, iter_row_groups, level_numbers
+
+
+STATS_COLUMNS = ['datetime', 'levelname', 'name']
+
+
+class LogStats:
+    """
+    청크 단위로 누적하는 로그 집계
+
+    update()로 DataFrame 청크를 넣고 per_minute / loggers / daily로 결과를 조회합니다.
+    """
+
+    def __init__(self, freq: str = '1min'):
+        """
+        집계 초기화
+
+        Args:
+            freq: 시간 구간 단위 (pandas 빈도 문자열, 기본값: 1분)
+        """
+        self.freq = freq
+        self.rows = 0
+        self._per_minute: List[pd.Series] = []
+        self._loggers: Optional[pd.Series] = None
+        self._daily: List[pd.DataFrame] = []
+
+    def update(self, df: pd.DataFrame):
+        """청크 하나를 집계에 추가"""
+        if df.empty:
+            return
+        self.rows += len(df)
+        times = pd.to_datetime(df['datetime'])
+        levels = df['levelname'].astype(object)
+
+        self._per_minute.append(levels.groupby([times.dt.floor(self.freq), levels]).size())
+
+        loggers = df['name'].astype(object).value_counts()
+        self._loggers = loggers if self._loggers is None else self._loggers.add(loggers, fill_value=0)
+
+        errors = level_numbers(levels) >= logging.ERROR
+        daily = errors.groupby(times.dt.date).agg(['size', 'sum'])
+        self._daily.append(daily)
+
+    @property
+    def per_minute(self) -> pd.DataFrame:
+        """시간 구간 x 레벨 건수 (행: 구간 시작 시각, 열: levelname)"""
+        if not self._per_minute:
+            return pd.DataFrame()
+        counts = pd.concat(self._per_minute).groupby(level=[0, 1]).sum()
+        self._per_minute = [counts]  # 다음 조회 때 다시 합치지 않도록 압축
+        table = counts.unstack(fill_value=0).astype('int64')
+        table.index.name = 'time'
+        table.columns.name = None
+        return table
+
+    def loggers(self, top: Optional[int] = 10) -> pd.Series:
+        """로거별 건수 (많은 순, top개)"""
+        if self._loggers is None:
+            return pd.Series(dtype='int64')
+        counts = self._loggers.astype('int64').sort_values(ascending=False, kind='stable')
+        counts.index.name = 'name'
+        return counts if top is None else counts.head(top)
+
+    @property
+    def daily(self) -> pd.DataFrame:
+        """일별 전체 건수, 에러(ERROR 이상) 건수, 에러율"""
+        if not self._daily:
+            return pd.DataFrame(columns=['total', 'errors', 'error_rate'])
+        sums = pd.concat(self._daily).groupby(level=0).sum()
+        table = pd.DataFrame({'total': sums['size'].astype('int64'), 'errors': sums['sum'].astype('int64')})
+        table['error_rate'] = table['errors'] / table['total']
+        table.index.name = 'date'
+        return table
+
+    def to_dict(self, top: Optional[int] = 10, per_minute: bool = True) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 딕셔너리로 변환"""
+        result = {
+            'rows': self.rows,
+            'daily': [
+                {'date': str(day), 'total': int(row.total), 'errors': int(row.errors),
+                 'error_rate': float(row.error_rate)}
+                for day, row in self.daily.iterrows()
+            ],
+            'loggers': [{'name': name, 'count': int(count)} for name, count in self.loggers(top).items()],
+        }
+        if per_minute:
+            table = self.per_minute
+            result['per_minute'] = [
+                {'time': time.isoformat(), **{level: int(count) for level, count in row.items()}}
+                for time, row in table.iterrows()
+            ]
+        return result
+
+
+def log_stats(
+    base_path: Union[str, Path],
+    project_name: str,
+    env: str,
+    since: Optional[Union[date, str]] = None,
+    until: Optional[Union[date, str]] = None,
+    freq: str = '1min'
+) -> LogStats:
+    """
+    날짜 파티션들의 파케이 로그 집계
+
+    Args:
+        base_path: 기본 로그 저장 경로
+        project_name: 프로젝트 이름
+        env: 환경 이름
+        since: 시작 날짜 (포함)
+        until: 종료 날짜 (포함)
+        freq: 시간 구간 단위
+
+    Returns:
+        LogStats
+    """
+    stats = LogStats(freq=freq)
+    for partition in list_partitions(base_path, project_name, env, since, until):
+        for chunk in iter_row_groups(partition, columns=STATS_COLUMNS):
+            stats.update(chunk)
+    return stats
+
+
+# ---- CLI ----
+
+def add_arguments(parser):
+    """stats 하위 명령 인자 등록"""
+    parser.add_argument('--project', required=True, help='프로젝트 이름')
+    parser.add_argument('--env', default='development', help='환경 이름 (기본값: development)')
+    parser.add_argument('--base-path', default='~/.ineeji/logs', help='파케이 로그 기본 경로')
+    parser.add_argument('--since', default=None, help='시작 날짜 (YYYY-MM-DD, 포함)')
+    parser.add_argument('--until', default=None, help='종료 날짜 (YYYY-MM-DD, 포함)')
+    parser.add_argument('--freq', default='1min', help='시간 구간 단위 (기본값: 1min)')
+    parser.add_argument('--top', type=int, default=10, help='출력할 상위 로거 수')
+    parser.add_argument('--per-minute', action='store_true', help='시간 구간별 레벨 건수도 출력')
+    parser.add_argument('--format', choices=['text', 'json'], default='text', help='출력 형식')
+    parser.set_defaults(func=run)
+
+
+def run(args) -> int:
+    """stats 하위 명령 실행"""
+    stats = log_stats(args.base_path, args.project, args.env, args.since, args.until, freq=args.freq)
+    if args.format == 'json':
+        json.dump(stats.to_dict(top=args.top, per_minute=args.per_minute), sys.stdout,
+                  indent=2, ensure_ascii=False)
+        print()
+        return 0
+
+    if not stats.rows:
+        print("집계할 로그가 없습니다")
+        return 0
+    daily = stats.daily
+    daily['error_rate'] = daily['error_rate'].map('{:.2%}'.format)
+    print(f"전체 {stats.rows}건\n\n[일별]")
+    print(daily.to_string())
+    print("\n[상위 로거]")
+    print(stats.loggers(args.top).to_string())
+    if args.per_minute:
+        print(f"\n[{args.freq} 단위 레벨별 건수]")
+        print(stats.per_minute.to_string())
+    return 0
@@ -0,0 +1,384 @@
+"""
+로그 배치 저장 백엔드
+
+ParquetLogHandler와 인코더 워커는 플러시한 배치를 StorageBackend로 날짜 파티션에 저장합니다.
+
+    fastparquet: pandas DataFrame을 거쳐 log.parquet에 저장 (기본값, 추가 의존성 없음)
+    pyarrow:     DataFrame 없이 레코드에서 바로 Arrow 테이블을 만들어 log.parquet에 저장
+    arrow:       log.arrows(Arrow IPC 스트림)에 배치를 이어 붙임 (기존 데이터를 다시 쓰지 않음)
+                 지난 파티션은 convert_partition()이나 `python -m ineeji_logging convert`로 log.parquet로 변환
+
+압축 코덱과 레벨은 백엔드마다 지정할 수 있습니다. pyarrow/arrow 백엔드는 pyarrow가 필요합니다.
+
+사용법:
+    python -m ineeji_logging convert --project my_app --env production --compression zstd --index
+"""
+
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Union
+
+import pandas as pd
+
+from . import encoder
+from .encoder import append_parquet
+from .reader import partition_dir, PARTITION_NAME, LOG_FILE, ARROW_FILE
+
+
+STORAGE_BACKENDS = ('fastparquet', 'pyarrow', 'arrow')
+
+# 코덱 이름 (None이나 'none'은 압축하지 않음)
+PARQUET_CODECS = ('snappy', 'zstd', 'lz4', 'gzip', 'none')
+ARROW_CODECS = ('zstd', 'lz4', 'none')  # Arrow IPC는 snappy를 지원하지 않음
+
+# fastparquet 코덱 이름과 레벨 인자 이름 (lz4는 하둡 프레임이 아닌 LZ4_RAW로 저장)
+_FASTPARQUET_CODECS = {'snappy': 'SNAPPY', 'zstd': 'ZSTD', 'lz4': 'LZ4_RAW', 'gzip': 'GZIP'}
+_FASTPARQUET_LEVEL_ARGS = {'zstd': 'level', 'gzip': 'level'}
+
+
+def _pyarrow():
+    """pyarrow 모듈 (설치되어 있지 않으면 ImportError)"""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("pyarrow/arrow 저장 백엔드를 쓰려면 pyarrow를 설치하세요 (pip install 'ineeji_logging[arrow]')") from None
+    return pyarrow
+
+
+def _normalize_codec(compression: Optional[str], supported: tuple, backend: str) -> Optional[str]:
+    codec = (compression or 'none').lower()
+    if codec not in supported:
+        raise ValueError(f"{backend} 백엔드가 지원하지 않는 압축 코덱입니다: {compression} "
+                         f"(지원: {', '.join(supported)})")
+    return None if codec == 'none' else codec
+
+
+class StorageBackend:
+    """
+    로그 배치 저장 방식
+
+    파티션 디렉토리의 파일 하나(file_name)에 배치를 이어서 저장합니다.
+    하위 클래스는 append_frame을 구현하고, DataFrame을 거치지 않는 경우 append도 재정의합니다.
+    """
+
+    name = ''
+    file_name = LOG_FILE
+
+    def __init__(self, compression: Optional[str] = 'snappy', compression_level: Optional[int] = None):
+        """
+        저장 백엔드 초기화
+
+        Args:
+            compression: 압축 코덱 ('snappy', 'zstd', 'lz4', 'gzip', 'none')
+            compression_level: 압축 레벨 (zstd/gzip 등 레벨을 지원하는 코덱만, None이면 코덱 기본값)
+        """
+        self.compression = compression
+        self.compression_level = compression_level
+
+    def append(self, log_file: Path, records: List[Dict[str, Any]], index_messages: bool = False) -> int:
+        """
+        레코드 배치를 파일에 추가
+
+        Args:
+            log_file: 저장할 파일 경로
+            records: 로그 레코드 딕셔너리 목록 (args는 이미 JSON 문자열)
+            index_messages: 저장 후 메시지 토큰 색인 갱신 여부
+
+        Returns:
+            저장 후 파일 크기 (바이트)
+        """
+        return self.append_frame(log_file, pd.DataFrame(records), index_messages)
+
+    def append_frame(self, log_file: Path, df: pd.DataFrame, index_messages: bool = False) -> int:
+        """DataFrame 배치를 파일에 추가 (인코더 워커가 디코딩한 배치용)"""
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        level = f", level={self.compression_level}" if self.compression_level is not None else ""
+        return f"{type(self).__name__}({self.compression!r}{level})"
+
+
+class FastParquetBackend(StorageBackend):
+    """fastparquet으로 log.parquet에 저장 (기존 파일과 합쳐 다시 씀)"""
+
+    name = 'fastparquet'
+
+    def __init__(self, compression: Optional[str] = 'snappy', compression_level: Optional[int] = None):
+        super().__init__(compression, compression_level)
+        codec = _normalize_codec(compression, PARQUET_CODECS, self.name)
+        if codec is None:
+            self._compression = None
+        elif compression_level is not None and codec in _FASTPARQUET_LEVEL_ARGS:
+            # fastparquet은 사전 인코딩 컬럼에 인자가 있는 압축 설정을 쓰지 못하므로 해당 컬럼은 기본 레벨로 압축
+            self._compression = {'_default': {'type': _FASTPARQUET_CODECS[codec],
+                                              'args': {_FASTPARQUET_LEVEL_ARGS[codec]: compression_level}}}
+            self._compression.update((column, _FASTPARQUET_CODECS[codec]) for column in encoder.DICTIONARY_COLUMNS)
+        else:
+            self._compression = _FASTPARQUET_CODECS[codec]
+
+    def append_frame(self, log_file: Path, df: pd.DataFrame, index_messages: bool = False) -> int:
+        return append_parquet(log_file, df, index_messages=index_messages, compression=self._compression)
+
+
+def _column_array(pa, name: str, values: List[Any]):
+    """값 목록을 Arrow 배열로 변환 (타입이 섞여 있으면 문자열로 저장)"""
+    if name in encoder.DICTIONARY_COLUMNS:
+        return pa.array(values, type=pa.string()).dictionary_encode()
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if value is None else str(value) for value in values], type=pa.string())
+
+
+def records_table(records: List[Dict[str, Any]]):
+    """
+    레코드 딕셔너리 목록을 pandas 없이 Arrow 테이블로 변환
+
+    Args:
+        records: 로그 레코드 목록 (컬럼 순서는 처음 나타난 순서)
+
+    Returns:
+        pyarrow.Table
+    """
+    pa = _pyarrow()
+    columns: Dict[str, None] = {}
+    for record in records:
+        for key in record:
+            columns.setdefault(key)
+    return pa.table({name: _column_array(pa, name, [record.get(name) for record in records])
+                     for name in columns})
+
+
+def _concat(pa, tables: list):
+    """스키마가 조금씩 다른 테이블 합치기 (새 컬럼은 앞쪽 행에서 null, 호환되지 않는 타입은 문자열로 통일)"""
+    tables = [table for table in tables if table.num_rows]
+    if len(tables) <= 1:
+        return tables[0] if tables else None
+    try:
+        return pa.concat_tables(tables, promote_options='permissive')
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        pass
+    types: Dict[str, set] = {}
+    for table in tables:
+        for field in table.schema:
+            if not pa.types.is_null(field.type):
+                types.setdefault(field.name, set()).add(field.type)
+    conflicting = {name for name, kinds in types.items() if len(kinds) > 1}
+    unified = []
+    for table in tables:
+        for i, field in enumerate(table.schema):
+            if field.name in conflicting:
+                column = table.column(i)
+                if pa.types.is_dictionary(field.type):
+                    column = column.cast(field.type.value_type)
+                table = table.set_column(i, field.name, column.cast(pa.string()))
+        unified.append(table)
+    return pa.concat_tables(unified, promote_options='permissive')
+
+
+def _write_parquet_table(pa, table, path: Path, compression: Optional[str], compression_level: Optional[int]):
+    """Arrow 테이블을 임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)"""
+    temp = path.with_name(path.name + '.tmp')
+    # 배치마다 다른 사전을 하나로 합침 (fastparquet은 컬럼 청크당 사전 페이지를 하나만 읽음)
+    table = table.unify_dictionaries()
+    pa.parquet.write_table(table, temp, compression=compression or 'none', compression_level=compression_level,
+                           row_group_size=encoder.ROW_GROUP_ROWS)
+    os.replace(temp, path)
+
+
+class PyArrowBackend(StorageBackend):
+    """pyarrow로 log.parquet에 저장 (레코드에서 바로 Arrow 테이블 생성)"""
+
+    name = 'pyarrow'
+
+    def __init__(self, compression: Optional[str] = 'snappy', compression_level: Optional[int] = None):
+        super().__init__(compression, compression_level)
+        self._codec = _normalize_codec(compression, PARQUET_CODECS, self.name)
+        _pyarrow()
+
+    def append(self, log_file: Path, records: List[Dict[str, Any]], index_messages: bool = False) -> int:
+        return self._append_table(log_file, records_table(records), index_messages)
+
+    def append_frame(self, log_file: Path, df: pd.DataFrame, index_messages: bool = False) -> int:
+        pa = _pyarrow()
+        return self._append_table(log_file, pa.Table.from_pandas(df, preserve_index=False), index_messages)
+
+    def _append_table(self, log_file: Path, batch, index_messages: bool) -> int:
+        pa = _pyarrow()
+        base_row = 0
+        table = batch
+        if log_file.exists():
+            try:
+                existing = pa.parquet.read_table(log_file)
+                base_row = existing.num_rows
+                table = _concat(pa, [existing, batch])
+            except (OSError, pa.ArrowInvalid):
+                # 파일 읽기 실패 시 새로 저장
+                pass
+        _write_parquet_table(pa, table, log_file, self._codec, self.compression_level)
+        if index_messages:
+            from .search import update_index
+            update_index(log_file.parent, batch.to_pandas(), base_row)
+        return log_file.stat().st_size
+
+
+class ArrowStreamBackend(StorageBackend):
+    """
+    Arrow IPC 스트림(log.arrows)에 배치를 이어 붙이는 백엔드
+
+    배치마다 완결된 스트림(스키마 + 배치 + 끝 표시)을 파일 끝에 추가하므로 기존 데이터를 다시 쓰지 않고,
+    배치마다 컬럼이 달라져도 됩니다. 메시지 색인은 log.parquet로 변환할 때 만듭니다.
+    """
+
+    name = 'arrow'
+    file_name = ARROW_FILE
+
+    def __init__(self, compression: Optional[str] = 'lz4', compression_level: Optional[int] = None):
+        super().__init__(compression, compression_level)
+        self._codec = _normalize_codec(compression, ARROW_CODECS, self.name)
+        _pyarrow()
+
+    def _options(self, pa):
+        if self._codec is None:
+            return pa.ipc.IpcWriteOptions()
+        codec = pa.Codec(self._codec, compression_level=self.compression_level)
+        return pa.ipc.IpcWriteOptions(compression=codec)
+
+    def append(self, log_file: Path, records: List[Dict[str, Any]], index_messages: bool = False) -> int:
+        return self._append_table(log_file, records_table(records))
+
+    def append_frame(self, log_file: Path, df: pd.DataFrame, index_messages: bool = False) -> int:
+        pa = _pyarrow()
+        return self._append_table(log_file, pa.Table.from_pandas(df, preserve_index=False))
+
+    def _append_table(self, log_file: Path, table) -> int:
+        pa = _pyarrow()
+        with open(log_file, 'ab') as f:
+            with pa.ipc.new_stream(f, table.schema, options=self._options(pa)) as writer:
+                writer.write_table(table)
+        return log_file.stat().st_size
+
+
+def read_arrow_stream(path: Union[str, Path]):
+    """
+    이어 붙인 Arrow IPC 스트림 파일 전체를 하나의 테이블로 읽기
+
+    쓰다가 중단된 마지막 스트림(프로세스 강제 종료 등)은 건너뜁니다.
+
+    Returns:
+        pyarrow.Table (행이 없으면 빈 테이블)
+    """
+    pa = _pyarrow()
+    tables = []
+    size = os.path.getsize(path)
+    with pa.OSFile(str(path)) as f:
+        while f.tell() < size:
+            try:
+                tables.append(pa.ipc.open_stream(f).read_all())
+            except (pa.ArrowInvalid, OSError):
+                break
+    return _concat(pa, tables) or pa.table({})
+
+
+def make_storage(backend: str = 'fastparquet', compression: Optional[str] = None,
+                 compression_level: Optional[int] = None) -> StorageBackend:
+    """
+    이름으로 저장 백엔드 생성
+
+    Args:
+        backend: 'fastparquet', 'pyarrow', 'arrow'
+        compression: 압축 코덱 (None이면 백엔드 기본값: 파케이는 snappy, arrow는 lz4)
+        compression_level: 압축 레벨
+
+    Raises:
+        ValueError: 알 수 없는 백엔드나 지원하지 않는 코덱
+        ImportError: pyarrow가 필요한 백엔드인데 설치되어 있지 않은 경우
+    """
+    classes = {'fastparquet': FastParquetBackend, 'pyarrow': PyArrowBackend, 'arrow': ArrowStreamBackend}
+    if backend not in classes:
+        raise ValueError(f"알 수 없는 저장 백엔드입니다: {backend} (지원: {', '.join(STORAGE_BACKENDS)})")
+    kwargs = {'compression_level': compression_level}
+    if compression is not None:
+        kwargs['compression'] = compression
+    return classes[backend](**kwargs)
+
+
+def convert_partition(partition: Union[str, Path], compression: Optional[str] = 'snappy',
+                      compression_level: Optional[int] = None, index_messages: bool = False) -> int:
+    """
+    파티션의 log.arrows를 log.parquet로 변환
+
+    log.parquet가 이미 있으면 그 뒤에 이어 붙이고, 변환이 끝나면 log.arrows를 삭제합니다.
+    쓰는 중인 파티션(오늘)은 변환하지 마세요.
+
+    Args:
+        partition: 날짜 파티션 디렉토리
+        compression: 파케이 압축 코덱
+        compression_level: 압축 레벨
+        index_messages: 변환 후 메시지 토큰 색인(index.parquet) 재생성
+
+    Returns:
+        변환한 행 수 (log.arrows가 없으면 0)
+    """
+    pa = _pyarrow()
+    partition = Path(partition).expanduser()
+    arrow_file = partition / ARROW_FILE
+    if not arrow_file.exists():
+        return 0
+    codec = _normalize_codec(compression, PARQUET_CODECS, 'pyarrow')
+    streamed = read_arrow_stream(arrow_file)
+    log_file = partition / LOG_FILE
+    tables = [pa.parquet.read_table(log_file)] if log_file.exists() else []
+    table = _concat(pa, tables + [streamed])
+    if table is not None:
+        _write_parquet_table(pa, table, log_file, codec, compression_level)
+    arrow_file.unlink()
+    if index_messages and log_file.exists():
+        from .search import build_index
+        build_index(partition)
+    return streamed.num_rows
+
+
+# ---- CLI ----
+
+def add_arguments(parser):
+    """convert 하위 명령 인자 등록"""
+    parser.add_argument('--project', required=True, help='프로젝트 이름')
+    parser.add_argument('--env', default='development', help='환경 이름 (기본값: development)')
+    parser.add_argument('--base-path', default='~/.ineeji/logs', help='파케이 로그 기본 경로')
+    parser.add_argument('--compression', default='snappy', choices=PARQUET_CODECS, help='파케이 압축 코덱')
+    parser.add_argument('--compression-level', type=int, default=None, help='압축 레벨')
+    parser.add_argument('--index', action='store_true', help='변환 후 메시지 토큰 색인 생성')
+    parser.add_argument('--include-today', action='store_true', help='오늘 파티션도 변환 (쓰는 중이면 유실 위험)')
+    parser.set_defaults(func=run)
+
+
+def run(args) -> int:
+    """convert 하위 명령 실행"""
+    root = partition_dir(args.base_path, args.project, args.env).parent
+    today = datetime.now().strftime('%Y-%m-%d')
+    try:
+        names = sorted(os.listdir(root))
+    except OSError:
+        names = []
+    converted = 0
+    for name in names:
+        partition = root / name
+        if not PARTITION_NAME.match(name) or (name >= today and not args.include_today):
+            continue
+        if not (partition / ARROW_FILE).exists():
+            continue
+        try:
+            rows = convert_partition(partition, args.compression, args.compression_level, args.index)
+        except (ImportError, ValueError, OSError) as e:
+            print(f"{partition}: {e}", file=sys.stderr)
+            return 1
+        print(f"{partition}: {rows}행 변환", file=sys.stderr)
+        converted += 1
+    if not converted:
+        print("변환할 파티션이 없습니다", file=sys.stderr)
+    return 0
@@ -0,0 +1,473 @@
+"""
+텍스트/파케이 로그 실시간 추적 (tail -f)
+
+사용법:
+    python -m ineeji_logging tail --project my_app --env production
+    python -m ineeji_logging tail --project my_app --level ERROR --name my_app.db
+    python -m ineeji_logging tail --file logs/production/2024-01-01/app.log
+
+파케이 로그는 이미 읽은 행 수를 기억해 두고 파일 footer의 로우 그룹 정보로
+새 행이 들어 있는 마지막 로우 그룹만 읽습니다. 텍스트 로그는 읽은 위치부터 이어 읽고,
+파일이 교체(로테이션)되면 남은 내용을 마저 읽은 뒤 새 파일을 처음부터 읽습니다.
+변경 감지는 리눅스에서는 inotify를, 그 외 환경에서는 stat 폴링을 사용합니다.
+"""
+
+import os
+import re
+import sys
+import select
+import ctypes
+import ctypes.util
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, List, Iterable, Iterator, Tuple
+
+import pandas as pd
+
+from .reader import partition_dir, partition_file, parse_level, filter_logs, ARROW_FILE
+from .fingerprint import attach_tracebacks
+from .templates import rebuild_messages
+
+
+# inotify 이벤트 마스크 (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE)
+_IN_MASK = 0x002 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200
+
+# 텍스트 로그 줄에서 레벨과 로거 이름 추출 ("... [LEVEL] name: ..." 또는 "... [LEVEL] name (...")
+_TEXT_HEADER = re.compile(r'\[(DEBUG|INFO|WARNING|ERROR|CRITICAL)\]\s+([^\s:(]+)')
+
+# 텍스트 로그의 마지막 N줄을 찾을 때 한 번에 읽는 크기
+_TAIL_BLOCK = 64 * 1024
+
+
+def _name_matches(name: str, prefix: Optional[str]) -> bool:
+    return prefix is None or name == prefix or name.startswith(prefix + '.')
+
+
+# ---- 변경 감지 ----
+
+class PollingWatcher:
+    """stat 폴링 기반 변경 감지 (wait는 단순히 주기만큼 대기)"""
+
+    def __init__(self):
+        self._stop = threading.Event()
+
+    def watch(self, directories: Iterable[Path]):
+        pass
+
+    def wait(self, timeout: float) -> bool:
+        self._stop.wait(timeout)
+        return False
+
+    def close(self):
+        self._stop.set()
+
+
+class InotifyWatcher:
+    """inotify 기반 변경 감지 (리눅스 전용, 디렉토리 단위로 감시)"""
+
+    def __init__(self):
+        name = ctypes.util.find_library('c')
+        libc = ctypes.CDLL(name or 'libc.so.6', use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError("inotify를 사용할 수 없습니다")
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+        self._libc = libc
+        self._fd = fd
+
+    def watch(self, directories: Iterable[Path]):
+        """디렉토리 감시 추가 (이미 감시 중이면 커널이 같은 감시를 재사용)"""
+        for directory in directories:
+            self._libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), _IN_MASK)
+
+    def wait(self, timeout: float) -> bool:
+        """
+        이벤트가 오거나 timeout이 지날 때까지 대기
+
+        Returns:
+            이벤트 수신 여부
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self._fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def make_watcher(use_inotify: bool = True):
+    """가능하면 inotify, 아니면 폴링 감시자 생성"""
+    if use_inotify and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher()
+
+
+# ---- 추적 대상 ----
+
+class ParquetTail:
+    """
+    날짜 파티션의 log.parquet 추적
+
+    읽은 행 수(오프셋)를 기억하고, 파일이 바뀌면 footer만 읽어 새 행이 있는
+    로우 그룹부터 읽으므로 하루치 파일 전체를 메모리에 올리지 않습니다.
+    날짜가 바뀌어 새 파티션이 생기면 이전 파티션을 마저 읽은 뒤 새 파티션으로 넘어갑니다.
+    """
+
+    def __init__(
+        self,
+        base_path: str,
+        project_name: str,
+        env: str,
+        level: Optional[str] = None,
+        name: Optional[str] = None,
+        lines: int = 10,
+        tracebacks: bool = False
+    ):
+        """
+        파케이 추적 초기화
+
+        Args:
+            base_path: 기본 로그 저장 경로
+            project_name: 프로젝트 이름
+            env: 환경 이름
+            level: 최소 로그 레벨
+            name: 로거 이름 (하위 로거 포함)
+            lines: 시작할 때 보여줄 최근 행 수
+            tracebacks: 예외가 있으면 전체 트레이스백 출력
+        """
+        self.base_path = base_path
+        self.project_name = project_name
+        self.env = env
+        self.min_level = parse_level(level)
+        self.name = name
+        self.tracebacks = tracebacks
+        self.path = partition_file(partition_dir(base_path, project_name, env))
+        self.rows_seen: Optional[int] = None  # None이면 아직 시작 위치를 정하지 않음
+        self._initial_lines = lines
+        self._signature: Optional[Tuple[int, int, int]] = None
+
+    def watch_dirs(self) -> List[Path]:
+        """감시할 디렉토리 (파티션이 아직 없으면 환경 디렉토리)"""
+        partition = self.path.parent
+        for directory in (partition, partition.parent):
+            if directory.is_dir():
+                return [directory]
+        return []
+
+    def _signature_of(self, path: Path) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def _read_new_rows(self) -> Optional[pd.DataFrame]:
+        """마지막으로 읽은 행 이후의 행만 읽기 (변경이 없으면 None)"""
+        path = partition_file(self.path.parent)
+        if path != self.path:
+            # log.arrows가 log.parquet로 변환됨 - 행 순서가 같으므로 읽은 위치는 유지
+            self.path = path
+            self._signature = None
+        signature = self._signature_of(self.path)
+        if signature is None or signature == self._signature:
+            return None
+        if self.path.name == ARROW_FILE:
+            return self._read_new_stream_rows(signature)
+
+        from fastparquet import ParquetFile
+        try:
+            pf = ParquetFile(str(self.path))
+        except Exception:
+            return None  # 쓰는 중인 파일 - 다음 변경 때 다시 시도
+        counts = [rg.num_rows for rg in pf.row_groups]
+        total = sum(counts)
+
+        if self.rows_seen is None:
+            self.rows_seen = max(total - self._initial_lines, 0)
+        elif total < self.rows_seen:
+            self.rows_seen = 0  # 파일이 새로 만들어짐
+        if total == self.rows_seen:
+            self._signature = signature
+            return None
+
+        start, first = 0, 0
+        for index, count in enumerate(counts):
+            if start + count > self.rows_seen:
+                first = index
+                break
+            start += count
+        try:
+            df = pf[first:].to_pandas()
+        except Exception:
+            return None
+        df = df.iloc[self.rows_seen - start:]
+        self.rows_seen = total
+        self._signature = signature
+        return df
+
+    def _read_new_stream_rows(self, signature: Tuple[int, int, int]) -> Optional[pd.DataFrame]:
+        """변환 전 Arrow 스트림에서 마지막으로 읽은 행 이후의 행만 읽기 (끝을 알 수 없어 파일 전체를 읽음)"""
+        from .storage import read_arrow_stream
+        try:
+            table = read_arrow_stream(self.path)
+        except Exception:
+            return None
+        total = table.num_rows
+
+        if self.rows_seen is None:
+            self.rows_seen = max(total - self._initial_lines, 0)
+        elif total < self.rows_seen:
+            self.rows_seen = 0  # 파일이 새로 만들어짐
+        self._signature = signature
+        if total == self.rows_seen:
+            return None
+        df = table.slice(self.rows_seen).to_pandas()
+        self.rows_seen = total
+        return df
+
+    def _roll_partition(self) -> bool:
+        """오늘 파티션이 현재 추적 중인 파티션과 다르고 이미 생겼으면 전환"""
+        path = partition_file(partition_dir(self.base_path, self.project_name, self.env))
+        if path.parent == self.path.parent or not path.exists():
+            return False
+        self.path = path
+        self.rows_seen = 0
+        self._signature = None
+        return True
+
+    def _format(self, df: pd.DataFrame) -> List[str]:
+        df = rebuild_messages(df)
+        if self.tracebacks:
+            df = attach_tracebacks(df, self.path.parent)
+        lines = []
+        for row in df.to_dict('records'):
+            # 지연 포맷 여부와 관계없이 같은 모양으로 출력하도록 저장된 컬럼으로 조립
+            timestamp = row['datetime'].strftime('%Y-%m-%d %H:%M:%S,%f')[:-3]
+            message = f"{timestamp} [{row['levelname']}] {row['name']}: {row.get('raw_message')}"
+            exception = row.get('exception')
+            if isinstance(exception, str):
+                message = f"{message}\n{exception}"
+            elif isinstance(row.get('exception_message'), str):
+                message = f"{message}\n    {row['exception_message']}"
+            lines.append(message)
+        return lines
+
+    def read_new(self) -> List[str]:
+        """새로 추가된 행을 출력용 문자열로 반환"""
+        lines = []
+        while True:
+            df = self._read_new_rows()
+            if df is not None and len(df):
+                lines.extend(self._format(filter_logs(df, self.min_level, self.name)))
+            if not self._roll_partition():
+                return lines
+
+
+class TextTail:
+    """
+    텍스트 로그 파일 추적 (tail -F와 같이 로테이션을 따라감)
+    """
+
+    def __init__(self, path: str, level: Optional[str] = None, name: Optional[str] = None, lines: int = 10):
+        """
+        텍스트 추적 초기화
+
+        Args:
+            path: 로그 파일 경로
+            level: 최소 로그 레벨
+            name: 로거 이름 (하위 로거 포함)
+            lines: 시작할 때 보여줄 마지막 줄 수
+        """
+        self.path = Path(os.path.expanduser(path))
+        self.min_level = parse_level(level)
+        self.name = name
+        self._initial_lines = lines
+        self._file = None
+        self._inode: Optional[int] = None
+        self._partial = ''
+        self._keep = True  # 연속 줄(트레이스백)은 앞 레코드의 필터 결과를 따름
+
+    def watch_dirs(self) -> List[Path]:
+        directory = self.path.parent
+        return [directory] if directory.is_dir() else []
+
+    def _open(self, from_start: bool) -> List[str]:
+        try:
+            f = open(self.path, 'r', encoding='utf-8', errors='replace')
+        except FileNotFoundError:
+            return []
+        self._file = f
+        self._inode = os.fstat(f.fileno()).st_ino
+        self._partial = ''
+        if from_start:
+            return []
+        return self._last_lines(f)
+
+    def _last_lines(self, f) -> List[str]:
+        """파일 끝에서 블록 단위로 거슬러 올라가 마지막 N줄 읽기"""
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        if self._initial_lines <= 0 or end == 0:
+            return []
+        with open(self.path, 'rb') as raw:
+            position, data = end, b''
+            while position > 0 and data.count(b'\n') <= self._initial_lines:
+                step = min(_TAIL_BLOCK, position)
+                position -= step
+                raw.seek(position)
+                data = raw.read(step) + data
+        lines = data[:end - position].decode('utf-8', errors='replace').split('\n')
+        # 마지막 줄이 아직 쓰는 중이면 다음 읽기에서 마저 처리
+        self._partial = lines.pop()
+        return lines[-self._initial_lines:]
+
+    def _read_available(self) -> List[str]:
+        data = self._file.read()
+        if not data:
+            return []
+        data = self._partial + data
+        lines = data.split('\n')
+        self._partial = lines.pop()
+        return lines
+
+    def _rotated(self) -> bool:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return False  # 교체 중 - 새 파일이 생길 때까지 기존 파일을 계속 읽음
+        return st.st_ino != self._inode or st.st_size < self._file.tell()
+
+    def _filter(self, lines: List[str]) -> List[str]:
+        if self.min_level <= logging.NOTSET and self.name is None:
+            return lines
+        kept = []
+        for line in lines:
+            match = _TEXT_HEADER.search(line)
+            if match:
+                self._keep = (logging.getLevelName(match.group(1)) >= self.min_level
+                              and _name_matches(match.group(2), self.name))
+            if self._keep:
+                kept.append(line)
+        return kept
+
+    def read_new(self) -> List[str]:
+        """새로 추가된 줄 반환"""
+        if self._file is None:
+            first_open = self._inode is None
+            lines = self._open(from_start=not first_open)
+            if self._file is None:
+                return []
+            return self._filter(lines + self._read_available())
+
+        lines = self._read_available()
+        if self._rotated():
+            # 이전 파일의 남은 내용을 마저 읽고 새 파일로 전환
+            lines.extend(self._read_available())
+            if self._partial:
+                lines.append(self._partial)
+            self._file.close()
+            self._open(from_start=True)
+            if self._file is not None:
+                lines.extend(self._read_available())
+        return self._filter(lines)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def follow(
+    sources: List,
+    watcher=None,
+    interval: float = 1.0,
+    follow: bool = True,
+    stop: Optional[threading.Event] = None
+) -> Iterator[str]:
+    """
+    추적 대상의 새 줄을 순서대로 반환하는 제너레이터
+
+    Args:
+        sources: ParquetTail/TextTail 목록
+        watcher: 변경 감지자 (기본값: make_watcher())
+        interval: 최대 대기 시간 (inotify 사용 시에도 이 주기로 한 번씩 확인)
+        follow: False이면 현재 내용만 출력하고 종료
+        stop: 설정되면 추적 종료
+    """
+    own_watcher = watcher is None
+    if own_watcher:
+        watcher = make_watcher()
+    stop = stop or threading.Event()
+    try:
+        for source in sources:
+            yield from source.read_new()
+        while follow and not stop.is_set():
+            for source in sources:
+                watcher.watch(source.watch_dirs())
+            watcher.wait(interval)
+            for source in sources:
+                yield from source.read_new()
+    finally:
+        if own_watcher:
+            watcher.close()
+        for source in sources:
+            if hasattr(source, 'close'):
+                source.close()
+
+
+# ---- CLI ----
+
+def add_arguments(parser):
+    """tail 하위 명령 인자 등록"""
+    parser.add_argument('--project', help='프로젝트 이름 (파케이 로그 추적)')
+    parser.add_argument('--env', default='development', help='환경 이름 (기본값: development)')
+    parser.add_argument('--base-path', default='~/.ineeji/logs', help='파케이 로그 기본 경로')
+    parser.add_argument('--file', action='append', default=[], help='추적할 텍스트 로그 파일 (여러 번 지정 가능)')
+    parser.add_argument('--level', default=None, help='최소 로그 레벨 (예: ERROR)')
+    parser.add_argument('--name', default=None, help='로거 이름 (하위 로거 포함)')
+    parser.add_argument('-n', '--lines', type=int, default=10, help='시작할 때 보여줄 최근 줄 수')
+    parser.add_argument('--tracebacks', action='store_true', help='전체 트레이스백 출력')
+    parser.add_argument('--interval', type=float, default=1.0, help='최대 확인 주기 (초)')
+    parser.add_argument('--poll', action='store_true', help='inotify 대신 폴링 사용')
+    parser.add_argument('--once', action='store_true', help='현재 내용만 출력하고 종료')
+    parser.set_defaults(func=run)
+
+
+def run(args) -> int:
+    """tail 하위 명령 실행"""
+    sources = []
+    try:
+        if args.project:
+            sources.append(ParquetTail(args.base_path, args.project, args.env, level=args.level,
+                                       name=args.name, lines=args.lines, tracebacks=args.tracebacks))
+        for path in args.file:
+            sources.append(TextTail(path, level=args.level, name=args.name, lines=args.lines))
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    if not sources:
+        print("--project 또는 --file 중 하나 이상을 지정하세요", file=sys.stderr)
+        return 2
+
+    watcher = make_watcher(use_inotify=not args.poll)
+    try:
+        for line in follow(sources, watcher, interval=args.interval, follow=not args.once):
+            print(line, flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    return 0
@@ -0,0 +1,96 @@
+"""
+메시지 템플릿과 인자 분리 저장
+
+"user %s logged in"처럼 같은 템플릿에서 나온 메시지는 template 컬럼(사전 인코딩)으로 묶고,
+인자는 타입을 보존하는 JSON 배열로 args 컬럼에 저장합니다. 메시지 문자열은 읽을 때 복원합니다.
+"""
+
+import json
+import logging
+from typing import Any, Optional, Tuple
+
+import pandas as pd
+
+
+# 그대로 보관해도 안전한(불변) 인자 타입 - 그 외 타입이 있으면 emit 시점에 바로 포맷
+# (Enum, IntFlag처럼 str/int를 상속해 __str__을 바꾼 하위 클래스도 바로 포맷)
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def message_template(record: logging.LogRecord) -> Tuple[Optional[str], Any]:
+    """
+    레코드의 메시지 템플릿과 인자 반환
+
+    비동기 로깅에서는 큐 핸들러가 보존해 둔 원래 템플릿과 인자를 사용합니다.
+
+    Returns:
+        (템플릿, 인자) - 템플릿이 문자열이 아니면 (None, None)
+    """
+    template = record.__dict__.get('ineeji_template')
+    if template is not None:
+        return template, record.__dict__.get('ineeji_template_args')
+    if isinstance(record.msg, str):
+        return record.msg, record.args
+    return None, None
+
+
+def deferrable_args(args) -> bool:
+    """인자를 포맷하지 않고 나중에 복원할 수 있는지 여부 (불변 스칼라로만 구성)"""
+    if isinstance(args, dict):
+        return all(type(value) in _SCALARS for value in args.values())
+    return all(type(value) in _SCALARS for value in args)
+
+
+def encode_args(args) -> Optional[str]:
+    """인자를 타입을 보존하는 JSON 문자열로 변환 (인자가 없으면 None)"""
+    if not args:
+        return None
+    if isinstance(args, dict):
+        return json.dumps(args, ensure_ascii=False)
+    return json.dumps(list(args), ensure_ascii=False)
+
+
+def format_template(template: Optional[str], args: Optional[str]) -> Optional[str]:
+    """
+    템플릿과 JSON 인자로 메시지 복원 (LogRecord.getMessage와 같은 규칙)
+
+    Args:
+        template: 메시지 템플릿
+        args: encode_args로 만든 JSON 문자열
+
+    Returns:
+        복원된 메시지
+    """
+    if template is None or (isinstance(template, float) and template != template):
+        return None
+    if not isinstance(args, str):
+        return template
+    values = json.loads(args)
+    try:
+        return template % (values if isinstance(values, dict) else tuple(values))
+    except (TypeError, ValueError, KeyError):
+        return f"{template} {args}"
+
+
+def rebuild_messages(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    template/args 컬럼으로 raw_message 복원 (이미 저장된 raw_message는 유지)
+
+    Args:
+        df: 파케이 로그 DataFrame
+
+    Returns:
+        raw_message 컬럼이 채워진 DataFrame
+    """
+    if 'template' not in df.columns:
+        return df
+    args = df['args'] if 'args' in df.columns else pd.Series(None, index=df.index, dtype=object)
+    rebuilt = pd.Series(
+        [format_template(template, value) for template, value in zip(df['template'].astype(object), args)],
+        index=df.index, dtype=object
+    )
+    if 'raw_message' in df.columns:
+        df['raw_message'] = df['raw_message'].astype(object).where(df['raw_message'].notna(), rebuilt)
+    else:
+        df['raw_message'] = rebuilt
+    return df
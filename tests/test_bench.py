@@ -0,0 +1,145 @@
+"""
+벤치마크 스위트 단위 테스트
+"""
+
+import sys
+import os
+import io
+import unittest
+import tempfile
+import shutil
+from contextlib import redirect_stdout, redirect_stderr
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import bench
+
+
+class TestBench(unittest.TestCase):
+    """벤치마크 측정 및 기준선 비교 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.original_home = os.environ.get('HOME')
+
+    def tearDown(self):
+        """테스트 정리"""
+        if self.original_home:
+            os.environ['HOME'] = self.original_home
+        shutil.rmtree(self.temp_dir)
+
+    def test_percentile(self):
+        """nearest-rank 백분위수 테스트"""
+        values = list(range(1, 1001))
+        self.assertEqual(bench.percentile(values, 0.5), 500)
+        self.assertEqual(bench.percentile(values, 0.99), 990)
+        self.assertEqual(bench.percentile(values, 0.999), 999)
+        self.assertEqual(bench.percentile([], 0.5), 0.0)
+
+    def test_run_scenario_persists_everything(self):
+        """시나리오 실행 후 모든 메시지가 파일에 기록되는지 테스트"""
+        raw = bench.run_scenario('async_file', bench.SCENARIOS['async_file'], 200, self.temp_dir)
+        summary = bench._summarize(raw)
+
+        self.assertEqual(summary['messages'], 200)
+        self.assertEqual(summary['write_errors'], 0)
+        self.assertGreater(summary['msgs_per_sec'], 0)
+        self.assertLessEqual(summary['p50_us'], summary['p99_us'])
+        self.assertGreater(summary['calibration'], 0)
+
+        log_file = os.path.join(self.temp_dir, f"bench_async_file_{os.getpid()}", 'app.log')
+        with open(log_file, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 200)
+
+    def test_storage_scenario_reports_cpu_and_disk(self):
+        """저장 백엔드 시나리오는 실제 로그 구성으로 기록하고 CPU 시간과 파일 크기를 보고"""
+        name = 'storage_fastparquet_zstd'
+        summary = bench._summarize(bench.run_scenario(name, bench.SCENARIOS[name], 200, self.temp_dir))
+
+        self.assertEqual(summary['messages'], 200)
+        self.assertEqual(summary['write_errors'], 0)
+        self.assertGreater(summary['cpu_seconds'], 0)
+        self.assertGreater(summary['disk_bytes'], 0)
+
+    def test_scenarios_do_not_inherit_presets(self):
+        """시나리오 설정은 환경 프리셋과 무관하고, 지연 포맷 시나리오만 지연 포맷을 사용"""
+        from ineeji_logging.logger import Logger, ParquetLogHandler
+
+        os.environ['HOME'] = self.temp_dir
+        deferred = {}
+        for name in ('async_parquet', 'async_parquet_deferred'):
+            logger = bench._build_logger(name, self.temp_dir, bench.SCENARIOS[name]['config'])
+            handler = next(h for h in logger.handlers if isinstance(h, ParquetLogHandler))
+            deferred[name] = handler.deferred_formatting
+            self.assertEqual(handler.flush_threshold, 100)
+            self.assertIsNone(handler.flush_policy)
+            self.assertEqual(handler._flush_delays, [])
+            bench._persist(logger)
+            for h in logger.handlers:
+                logger.logger.removeHandler(h)
+                h.close()
+            ParquetLogHandler._instances.remove(handler)
+            Logger._instances.pop(name, None)
+        self.assertEqual(deferred, {'async_parquet': False, 'async_parquet_deferred': True})
+
+    def test_compare_detects_regressions(self):
+        """기준선 비교 시 회귀 감지 테스트"""
+        baseline = {'a': {'msgs_per_sec': 1000.0, 'p99_us': 10.0, 'persist_seconds': 1.0, 'peak_rss_mb': 50.0}}
+        ok = {'a': {'msgs_per_sec': 900.0, 'p99_us': 12.0, 'persist_seconds': 1.1, 'peak_rss_mb': 51.0}}
+        slow = {'a': {'msgs_per_sec': 500.0, 'p99_us': 30.0, 'persist_seconds': 1.0, 'peak_rss_mb': 50.0}}
+
+        self.assertEqual(bench.compare(ok, baseline), [])
+        regressions = bench.compare(slow, baseline)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(any('msgs_per_sec' in line for line in regressions))
+        self.assertTrue(any('p99_us' in line for line in regressions))
+        self.assertEqual(len(bench.compare({'a': {'error': 'timeout'}}, baseline)), 1)
+
+    def test_compare_normalizes_by_calibration(self):
+        """시나리오별 calibration 비율로 기준선의 시간/처리량 지표를 보정하고 메모리는 보정하지 않음"""
+        reference = {'msgs_per_sec': 1000.0, 'p99_us': 10.0, 'persist_seconds': 1.0, 'peak_rss_mb': 50.0}
+        half_speed = {'msgs_per_sec': 500.0, 'p99_us': 25.0, 'persist_seconds': 2.0, 'peak_rss_mb': 50.0}
+
+        self.assertEqual(len(bench.compare({'a': half_speed}, {'a': reference})), 3)
+        self.assertEqual(len(bench.compare({'a': dict(half_speed, calibration=50.0)}, {'a': reference})), 3)
+        calibrated = {'a': dict(reference, calibration=100.0)}
+        self.assertEqual(bench.compare({'a': dict(half_speed, calibration=50.0)}, calibrated), [])
+
+        bloated = {'a': dict(half_speed, calibration=50.0, peak_rss_mb=100.0)}
+        regressions = bench.compare(bloated, calibrated)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn('peak_rss_mb', regressions[0])
+
+    def test_compare_skips_contended_p99(self):
+        """스레드 경쟁 시나리오의 p99 지연은 비교하지 않음"""
+        baseline = {name: {'msgs_per_sec': 1000.0, 'p99_us': 10.0} for name in ('sync_file', 'threads_16')}
+        current = {name: {'msgs_per_sec': 1000.0, 'p99_us': 100.0} for name in ('sync_file', 'threads_16')}
+
+        regressions = bench.compare(current, baseline)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith('sync_file: p99_us'))
+
+    def test_calibrate(self):
+        """calibration은 양수의 초당 레코드 수를 반환"""
+        self.assertGreater(bench.calibrate(records=200, rounds=2), 0)
+
+    def test_missing_baseline_fails(self):
+        """비교할 기준선 파일이 없으면 종료 코드 2"""
+        output = os.path.join(self.temp_dir, 'result.json')
+        baseline = os.path.join(self.temp_dir, 'missing.json')
+        argv = ['-s', 'sync_file', '-n', '20', '-o', output, '--baseline', baseline]
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            self.assertEqual(bench.main(argv), 2)
+            self.assertTrue(os.path.exists(output))
+            self.assertEqual(bench.main(argv + ['--save-baseline']), 0)
+            self.assertEqual(bench.main(argv + ['--tolerance', '100']), 0)  # 측정값 편차는 무시
+            with open(baseline, encoding='utf-8') as f:
+                self.assertGreater(bench.json.load(f)['results']['sync_file']['calibration'], 0)
+            # 메시지 수가 다른 기준선과는 비교하지 않음
+            self.assertEqual(bench.main(['-s', 'sync_file', '-n', '40', '-o', output, '--baseline', baseline]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+벌크 HTTP 핸들러 단위 테스트 (로컬 HTTP 서버 사용)
+"""
+
+import sys
+import os
+import json
+import gzip
+import time
+import unittest
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import BulkHandler
+
+
+class FakeBulkServer:
+    """`_bulk` 요청을 받아 문서를 모으는 로컬 HTTP 서버"""
+
+    def __init__(self, fail_first: int = 0, delay: float = 0.0, reject_items: int = 0):
+        self.docs = []
+        self.requests = 0
+        self.fail_first = fail_first
+        self.reject_items = reject_items
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.clients = set()
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                if self.headers.get('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
+                with server.lock:
+                    server.requests += 1
+                    server.clients.add(self.client_address)
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                    failing = server.requests <= server.fail_first
+                time.sleep(server.delay)
+
+                lines = body.decode('utf-8').splitlines()
+                docs = [json.loads(line) for line in lines[1::2]]
+                items = []
+                if failing:
+                    status, payload = 429, b'{"error":"too many requests"}'
+                else:
+                    status = 200
+                    for doc in docs:
+                        with server.lock:
+                            if server.reject_items > 0:
+                                server.reject_items -= 1
+                                items.append({'index': {'status': 429}})
+                                continue
+                            server.docs.append(doc)
+                        items.append({'index': {'status': 201}})
+                    payload = json.dumps({'errors': any(i['index']['status'] != 201 for i in items),
+                                          'items': items}).encode('utf-8')
+                with server.lock:
+                    server.active -= 1
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/_bulk"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestBulkHandler(unittest.TestCase):
+    """BulkHandler 테스트"""
+
+    def _logger(self, name, handler):
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        return logger
+
+    def test_bulk_ndjson_gzip(self):
+        """gzip NDJSON 본문을 keep-alive 연결로 전송"""
+        server = FakeBulkServer()
+        self.addCleanup(server.close)
+        handler = BulkHandler(server.url, index='app-%Y', batch_size=25, max_in_flight=1, flush_interval=0.1)
+        logger = self._logger("bulk_basic", handler)
+        for i in range(100):
+            logger.info("문서 %d", i)
+        handler.wait()
+        handler.close()
+
+        self.assertEqual([d['raw_message'] for d in server.docs], [f"문서 {i}" for i in range(100)])
+        self.assertEqual(server.requests, 4)
+        self.assertEqual(len(server.clients), 1)  # 연결 재사용
+        self.assertEqual(handler.stats.snapshot()['flushes'], 4)
+
+    def test_parallel_in_flight(self):
+        """여러 요청이 동시에 진행"""
+        server = FakeBulkServer(delay=0.2)
+        self.addCleanup(server.close)
+        handler = BulkHandler(server.url, batch_size=10, max_in_flight=4, flush_interval=0.1)
+        logger = self._logger("bulk_parallel", handler)
+        for i in range(40):
+            logger.info("병렬 %d", i)
+        handler.wait()
+        handler.close()
+
+        self.assertEqual(len(server.docs), 40)
+        self.assertGreaterEqual(server.max_active, 2)
+
+    def test_retry_on_429(self):
+        """429 응답과 항목 단위 거절을 백오프 후 재시도"""
+        server = FakeBulkServer(fail_first=2, reject_items=3)
+        self.addCleanup(server.close)
+        handler = BulkHandler(server.url, batch_size=10, max_in_flight=1, backoff_initial=0.01)
+        logger = self._logger("bulk_retry", handler)
+        for i in range(10):
+            logger.info("재시도 %d", i)
+        handler.wait()
+        handler.close()
+
+        self.assertEqual(sorted(d['raw_message'] for d in server.docs), sorted(f"재시도 {i}" for i in range(10)))
+        stats = handler.stats.snapshot()
+        self.assertEqual(stats['retries'], 3)
+        self.assertEqual(stats['drops'], 0)
+
+    def test_gives_up_after_max_retries(self):
+        """최대 재시도 후 유실로 집계"""
+        server = FakeBulkServer(fail_first=100)
+        self.addCleanup(server.close)
+        handler = BulkHandler(server.url, batch_size=5, max_in_flight=1, max_retries=2, backoff_initial=0.01)
+        logger = self._logger("bulk_give_up", handler)
+        for i in range(5):
+            logger.info("실패 %d", i)
+        handler.wait()
+        handler.close()
+
+        stats = handler.stats.snapshot()
+        self.assertEqual(stats['drops'], 5)
+        self.assertEqual(stats['write_errors'], 3)
+        self.assertEqual(server.requests, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
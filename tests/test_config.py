@@ -0,0 +1,245 @@
+"""
+실행 중 재구성과 설정 파일/환경 변수 테스트
+"""
+
+import sys
+import os
+import json
+import time
+import logging
+import unittest
+import tempfile
+import shutil
+import threading
+from unittest import mock
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import Logger
+from ineeji_logging.config import ConfigWatcher, config_from_env, load_config
+from ineeji_logging.logger import ParquetLogHandler
+from ineeji_logging.reader import read_parquet_logs, partition_dir, LOG_FILE
+
+
+class TestReconfigure(unittest.TestCase):
+    """Logger.reconfigure 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.home = mock.patch.dict(os.environ, {'HOME': self.temp_dir})
+        self.home.start()
+        self.log_file = os.path.join(self.temp_dir, "app.log")
+        self.log = Logger("reconfigure_test", log_file=self.log_file, console_output=False,
+                          parquet_logging=True, project_name="reconfigure", env="test",
+                          parquet_flush_threshold=1000)
+
+    def tearDown(self):
+        """테스트 정리"""
+        listener = Logger._listeners.pop("reconfigure_test", None)
+        if listener is not None:
+            listener.stop()
+        for handler in self.log.handlers:
+            handler.close()
+            if handler in ParquetLogHandler._instances:
+                ParquetLogHandler._instances.remove(handler)
+        Logger._instances.pop("reconfigure_test", None)
+        self.home.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def _parquet_messages(self):
+        partition = partition_dir(os.path.join(self.temp_dir, ".ineeji", "logs"), "reconfigure", "test")
+        if not (partition / LOG_FILE).exists():
+            return []
+        return read_parquet_logs(partition)['raw_message'].tolist()
+
+    def test_unchanged_handlers_kept(self):
+        """레벨과 임계값만 바꾸면 핸들러와 큐 리스너를 그대로 유지"""
+        listener = Logger._listeners["reconfigure_test"]
+        handlers = list(self.log.handlers)
+        self.log.info("버퍼에 남은 레코드")
+        Logger._wait_for_listener(listener)
+        self.log.reconfigure(level="DEBUG", parquet_flush_threshold=500)
+        self.assertIs(Logger._listeners["reconfigure_test"], listener)
+        self.assertEqual(self.log.handlers, handlers)
+        self.assertEqual(handlers[1].flush_threshold, 500)
+        self.assertEqual(handlers[1]._buffered_count(), 1)
+        self.assertEqual(self.log.logger.level, logging.DEBUG)
+
+    def test_removed_handler_flushes_buffer(self):
+        """빠지는 핸들러는 닫으면서 버퍼에 남은 레코드를 저장"""
+        for i in range(20):
+            self.log.info("레코드 %d", i)
+        self.log.reconfigure(parquet_logging=False)
+        self.assertEqual(len(self._parquet_messages()), 20)
+        self.assertEqual(len(self.log.handlers), 1)
+
+    def test_replaced_file_handler(self):
+        """파일 경로가 바뀌면 파일 핸들러만 교체"""
+        parquet_handler = self.log.handlers[1]
+        self.log.info("첫 번째 파일")
+        new_file = os.path.join(self.temp_dir, "new", "app.log")
+        self.log.reconfigure(log_file=new_file)
+        self.log.info("두 번째 파일")
+        Logger._wait_for_listener(Logger._listeners["reconfigure_test"])
+        self.assertIs(self.log.handlers[1], parquet_handler)
+        with open(self.log_file, encoding='utf-8') as f:
+            self.assertIn("첫 번째 파일", f.read())
+        with open(new_file, encoding='utf-8') as f:
+            self.assertIn("두 번째 파일", f.read())
+
+    def test_child_levels(self):
+        """하위 로거 레벨을 지정하고, 설정에서 빠지면 되돌림"""
+        self.log.reconfigure(levels={"reconfigure_test.db": "DEBUG"})
+        self.assertEqual(logging.getLogger("reconfigure_test.db").level, logging.DEBUG)
+        self.log.reconfigure(levels={})
+        self.assertEqual(logging.getLogger("reconfigure_test.db").level, logging.NOTSET)
+
+    def test_invalid_config_changes_nothing(self):
+        """잘못된 설정은 적용하지 않음"""
+        handlers = list(self.log.handlers)
+        with self.assertRaises(ValueError):
+            self.log.reconfigure(level="LOUD", log_file=None)
+        with self.assertRaises(ValueError):
+            self.log.reconfigure(flush_threshold=10)
+        self.assertEqual(self.log.handlers, handlers)
+        self.assertEqual(self.log.logger.level, logging.INFO)
+
+    def test_recreate_with_same_name(self):
+        """같은 이름으로 다시 생성해도 바뀌지 않은 핸들러와 리스너를 이어받음"""
+        listener = Logger._listeners["reconfigure_test"]
+        handlers = list(self.log.handlers)
+        self.log.info("다시 생성하기 전")
+        self.log = Logger("reconfigure_test", log_file=self.log_file, console_output=False,
+                          parquet_logging=True, project_name="reconfigure", env="test",
+                          parquet_flush_threshold=1000, level=logging.WARNING)
+        self.assertIs(Logger._listeners["reconfigure_test"], listener)
+        self.assertEqual(self.log.handlers, handlers)
+        self.log.reconfigure(parquet_logging=False)
+        self.assertEqual(self._parquet_messages(), ["다시 생성하기 전"])
+
+    def test_exit_hook_registered_once(self):
+        """재구성과 재생성을 반복해도 종료 훅을 다시 등록하지 않음"""
+        with mock.patch('ineeji_logging.logger.atexit.register') as register:
+            for _ in range(3):
+                self.log.reconfigure(level="DEBUG", format_string=None)
+                self.log.reconfigure(async_logging=False)
+                self.log.reconfigure(async_logging=True)
+            self.log = Logger("reconfigure_test", log_file=self.log_file, console_output=False,
+                              parquet_logging=True, project_name="reconfigure", env="test",
+                              parquet_flush_threshold=1000)
+        self.assertEqual(register.call_count, 0)
+
+    def test_switch_to_sync(self):
+        """비동기에서 동기로 바꾸면 큐에 남은 레코드를 처리한 뒤 리스너 종료"""
+        for i in range(100):
+            self.log.info("레코드 %d", i)
+        self.log.reconfigure(async_logging=False, parquet_flush_threshold=1)
+        self.assertNotIn("reconfigure_test", Logger._listeners)
+        self.log.info("동기 레코드")
+        self.assertEqual(len(self._parquet_messages()), 101)
+
+    def test_replace_parquet_handler_while_logging(self):
+        """로깅 중에 파케이 핸들러를 교체해도 이전/새 핸들러의 저장이 겹치지 않아 레코드가 유실되지 않음"""
+        self.log.reconfigure(async_logging=False, parquet_flush_threshold=50)
+        started = threading.Event()
+
+        def write():
+            for i in range(10000):
+                self.log.info("동시 레코드 %d", i)
+                if i == 100:
+                    started.set()
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        started.wait()
+        self.log.reconfigure(parquet_flush_threshold=500)
+        self.log.reconfigure(parquet_compression='zstd')
+        writer.join()
+        self.log.reconfigure(parquet_logging=False)
+
+        messages = self._parquet_messages()
+        self.assertEqual(len(messages), 10000)
+        self.assertEqual(len(set(messages)), 10000)
+
+
+class TestConfigSources(unittest.TestCase):
+    """설정 파일/환경 변수 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_config_from_env(self):
+        """환경 변수 값 변환"""
+        config = config_from_env(environ={
+            'INEEJI_LOG_LEVEL': 'DEBUG',
+            'INEEJI_LOG_CONSOLE_OUTPUT': 'no',
+            'INEEJI_LOG_PARQUET_FLUSH_THRESHOLD': 'auto',
+            'INEEJI_LOG_PARQUET_MAX_BUFFER_BYTES': '32M',
+            'INEEJI_LOG_LEVELS': 'my_app.db=DEBUG, my_app.http=WARNING',
+            'OTHER': '1',
+        })
+        self.assertEqual(config, {
+            'level': 'DEBUG',
+            'console_output': False,
+            'parquet_flush_threshold': 'auto',
+            'parquet_max_buffer_bytes': 32 * 1024 * 1024,
+            'levels': {'my_app.db': 'DEBUG', 'my_app.http': 'WARNING'},
+        })
+        with self.assertRaises(ValueError):
+            config_from_env(environ={'INEEJI_LOG_ASYNC_LOGGING': 'maybe'})
+
+    def test_load_config(self):
+        """JSON/TOML 설정 파일"""
+        json_path = os.path.join(self.temp_dir, "logging.json")
+        with open(json_path, 'w') as f:
+            json.dump({"level": "WARNING", "levels": {"my_app.db": "DEBUG"}}, f)
+        self.assertEqual(load_config(json_path), {"level": "WARNING", "levels": {"my_app.db": "DEBUG"}})
+
+        toml_path = os.path.join(self.temp_dir, "logging.toml")
+        with open(toml_path, 'w') as f:
+            f.write('level = "ERROR"\nparquet_flush_threshold = 50\n\n[levels]\n"my_app.db" = "DEBUG"\n')
+        self.assertEqual(load_config(toml_path),
+                         {"level": "ERROR", "parquet_flush_threshold": 50, "levels": {"my_app.db": "DEBUG"}})
+
+    def test_watcher(self):
+        """파일이 바뀌면 적용하고, 잘못된 설정은 건너뛰며, 빠진 항목은 원래 설정으로 되돌림"""
+        path = os.path.join(self.temp_dir, "logging.json")
+        log = Logger("watcher_test", console_output=False, async_logging=False,
+                     log_file=os.path.join(self.temp_dir, "app.log"))
+        handler = log.handlers[0]
+
+        def write(config):
+            with open(path, 'w') as f:
+                json.dump(config, f)
+            os.utime(path, ns=(time.time_ns(), time.time_ns() + 10 ** 9 * watcher.applied))
+
+        watcher = ConfigWatcher(log, path, env_prefix=None, interval=3600)
+        try:
+            write({"level": "DEBUG"})
+            self.assertTrue(watcher.check())
+            self.assertEqual(log.logger.level, logging.DEBUG)
+
+            write({"level": "LOUD"})
+            self.assertFalse(watcher.check())
+            self.assertIn("LOUD", watcher.last_error)
+            self.assertEqual(log.logger.level, logging.DEBUG)
+
+            write({})
+            self.assertTrue(watcher.check())
+            self.assertEqual(log.logger.level, logging.INFO)
+            self.assertIs(log.handlers[0], handler)
+            self.assertFalse(watcher.check())  # 바뀌지 않았으면 다시 적용하지 않음
+        finally:
+            handler.close()
+            Logger._instances.pop("watcher_test", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
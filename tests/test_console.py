@@ -0,0 +1,113 @@
+"""
+배치 콘솔 핸들러 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+import logging
+from io import StringIO
+from unittest import mock
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import Logger
+from ineeji_logging.console import BatchedConsoleHandler, stream_supports_color
+
+
+class CountingStream(StringIO):
+    """write 호출 횟수를 세는 스트림"""
+
+    def __init__(self, tty: bool = False):
+        super().__init__()
+        self.writes = 0
+        self.tty = tty
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+    def isatty(self):
+        return self.tty
+
+
+class TestBatchedConsoleHandler(unittest.TestCase):
+    """BatchedConsoleHandler 테스트"""
+
+    def _logger(self, name, handler):
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        self.addCleanup(handler.close)
+        return logger
+
+    def test_line_mode_writes_each_record(self):
+        """line 모드는 레코드마다 출력"""
+        stream = CountingStream()
+        logger = self._logger("console_line", BatchedConsoleHandler(stream))
+        for i in range(5):
+            logger.info("line %d", i)
+        self.assertEqual(stream.writes, 5)
+        self.assertEqual(stream.getvalue().count("\n"), 5)
+
+    def test_throughput_mode_batches_writes(self):
+        """throughput 모드는 batch_size 단위로 한 번에 출력"""
+        stream = CountingStream()
+        handler = BatchedConsoleHandler(stream, mode='throughput', batch_size=10, flush_interval=60)
+        logger = self._logger("console_batch", handler)
+        for i in range(25):
+            logger.info("batch %d", i)
+        self.assertEqual(stream.writes, 2)
+
+        # 에러 레벨은 남은 레코드와 함께 즉시 출력
+        logger.error("즉시 출력")
+        self.assertEqual(stream.writes, 3)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(lines[:25], [f"batch {i}" for i in range(25)])
+        self.assertEqual(lines[-1], "즉시 출력")
+        self.assertEqual(handler.stats.snapshot()['flushes'], 3)
+
+    def test_close_flushes_pending(self):
+        """종료 시 남은 레코드 출력"""
+        stream = CountingStream()
+        handler = BatchedConsoleHandler(stream, mode='throughput', batch_size=100, flush_interval=60)
+        logger = self._logger("console_close", handler)
+        logger.info("남은 레코드")
+        self.assertEqual(stream.getvalue(), "")
+        handler.close()
+        self.assertEqual(stream.getvalue(), "남은 레코드\n")
+
+    def test_invalid_mode(self):
+        """지원하지 않는 모드 검증"""
+        with self.assertRaises(ValueError):
+            BatchedConsoleHandler(StringIO(), mode='fast')
+
+
+class TestColorDetection(unittest.TestCase):
+    """TTY 기반 색상 적용 테스트"""
+
+    def test_stream_supports_color(self):
+        """TTY와 환경변수에 따른 색상 판단"""
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertTrue(stream_supports_color(CountingStream(tty=True)))
+            self.assertFalse(stream_supports_color(CountingStream(tty=False)))
+        with mock.patch.dict(os.environ, {'NO_COLOR': '1'}, clear=True):
+            self.assertFalse(stream_supports_color(CountingStream(tty=True)))
+        with mock.patch.dict(os.environ, {'FORCE_COLOR': '1'}, clear=True):
+            self.assertTrue(stream_supports_color(CountingStream(tty=False)))
+
+    def test_logger_without_tty_has_no_ansi_codes(self):
+        """stdout이 TTY가 아니면 ANSI 코드 없이 출력"""
+        stream = CountingStream(tty=False)
+        with mock.patch.dict(os.environ, {}, clear=True), mock.patch('sys.stdout', stream):
+            logger = Logger("console_no_tty", async_logging=False)
+            logger.warning("경고")
+        self.assertIn("[WARNING]", stream.getvalue())
+        self.assertNotIn("\033[", stream.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
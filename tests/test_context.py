@@ -0,0 +1,165 @@
+"""
+컨텍스트 바인딩(bind, logging_context) 테스트
+"""
+
+import sys
+import os
+import time
+import asyncio
+import unittest
+import tempfile
+import logging
+import shutil
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import Logger, logging_context, get_context
+from ineeji_logging.context import ContextFields, record_context
+from ineeji_logging.logger import ParquetLogHandler
+
+
+class _ListHandler(logging.Handler):
+    """레코드를 리스트에 모으는 테스트용 핸들러"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append((record, self.format(record)))
+
+
+class TestLoggingContext(unittest.TestCase):
+    """contextvars 기반 컨텍스트 테스트"""
+
+    def test_nested_context(self):
+        """중첩하면 필드가 합쳐지고 블록을 벗어나면 복원"""
+        with logging_context(request_id="r1", tenant="acme"):
+            with logging_context(request_id="r2", user=7):
+                self.assertEqual(get_context(), {'request_id': 'r2', 'tenant': 'acme', 'user': '7'})
+            self.assertEqual(get_context(), {'request_id': 'r1', 'tenant': 'acme'})
+        self.assertEqual(get_context(), {})
+
+    def test_isolated_per_task_and_thread(self):
+        """asyncio 태스크와 스레드마다 독립적인 컨텍스트 유지"""
+        async def handle(request_id):
+            with logging_context(request_id=request_id):
+                await asyncio.sleep(0.01)
+                return get_context()['request_id']
+
+        async def main():
+            return await asyncio.gather(*(handle(f"r{i}") for i in range(5)))
+
+        self.assertEqual(asyncio.run(main()), [f"r{i}" for i in range(5)])
+
+        seen = []
+        with logging_context(request_id="main"):
+            thread = threading.Thread(target=lambda: seen.append(get_context()))
+            thread.start()
+            thread.join()
+        self.assertEqual(seen, [{}])
+
+    def test_reserved_names(self):
+        """기본 컬럼과 겹치는 이름은 거부"""
+        with self.assertRaises(ValueError):
+            ContextFields.build({'message': 'x'})
+        with self.assertRaises(ValueError):
+            ContextFields.build({'not-valid': 'x'})
+
+    def test_rendered_text(self):
+        """텍스트 표현은 생성 시 한 번 계산 (공백이 있는 값은 따옴표 처리)"""
+        fields = ContextFields.build({'request_id': 'abc', 'path': 'a b', 'empty': None})
+        self.assertEqual(fields.text, 'request_id=abc path="a b" empty=-')
+
+
+class TestBoundLogger(unittest.TestCase):
+    """Logger.bind 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.temp_dir, "app.log")
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_bound_fields_in_text_and_parquet(self):
+        """바인딩된 필드가 텍스트 로그 끝과 파케이 컬럼에 기록"""
+        parquet_handler = ParquetLogHandler(self.temp_dir, "test", "context", flush_threshold=1000)
+        logger = Logger("context_bind", log_file=self.log_file, console_output=False,
+                        async_logging=False, extra_handlers=[parquet_handler])
+        try:
+            request_logger = logger.bind(request_id="abc123", tenant="acme")
+            request_logger.info("요청 처리 %s", "시작")
+            with logging_context(request_id="ctx", job="nightly"):
+                request_logger.warning("경고")
+                logger.info("컨텍스트만")
+            logger.info("필드 없음")
+        finally:
+            for handler in logger.handlers:
+                logger.logger.removeHandler(handler)
+                handler.close()
+            ParquetLogHandler._instances.remove(parquet_handler)
+
+        with open(self.log_file, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertTrue(lines[0].endswith("요청 처리 시작 | request_id=abc123 tenant=acme"))
+        self.assertIn("test_context.py", lines[1])  # 호출 위치는 BoundLogger가 아닌 호출자
+        self.assertTrue(lines[1].endswith("| request_id=abc123 job=nightly tenant=acme"))
+        self.assertTrue(lines[2].endswith("컨텍스트만 | request_id=ctx job=nightly"))
+        self.assertTrue(lines[3].endswith("필드 없음"))
+
+        today = time.strftime('%Y-%m-%d')
+        df = pd.read_parquet(Path(self.temp_dir) / "context" / "test" / today / "log.parquet")
+        self.assertEqual(df['request_id'].tolist()[:3], ['abc123', 'abc123', 'ctx'])
+        self.assertEqual(df['tenant'].tolist()[:2], ['acme', 'acme'])
+        self.assertTrue(pd.isna(df['request_id'].iloc[3]))
+
+    def test_context_captured_in_caller_with_async_logging(self):
+        """비동기 로깅에서도 로그를 남긴 쪽의 컨텍스트가 기록"""
+        handler = _ListHandler()
+        logger = Logger("context_async", console_output=False, async_logging=True, extra_handlers=[handler])
+        with logging_context(request_id="async-1"):
+            logger.bind(step="load").info("비동기")
+        Logger._listeners.pop("context_async").stop()
+
+        record, text = handler.records[0]
+        self.assertEqual(record_context(record).values, {'request_id': 'async-1', 'step': 'load'})
+        self.assertTrue(text.endswith("비동기 | request_id=async-1 step=load"))
+
+    def test_child_logger_records(self):
+        """하위 로거에서 전파된 레코드도 컨텍스트, 예외 지문, 레코드 수가 한 번씩 적용"""
+        for async_logging in (False, True):
+            with self.subTest(async_logging=async_logging):
+                name = f"context_child_{async_logging}"
+                first, second = _ListHandler(), _ListHandler()
+                logger = Logger(name, console_output=False, async_logging=async_logging,
+                                extra_handlers=[first, second])
+                child = logging.getLogger(f"{name}.db")
+                with logging_context(request_id="r-child"):
+                    logger.info("상위")
+                    child.info("하위")
+                    try:
+                        raise ValueError("실패")
+                    except ValueError:
+                        child.exception("하위 예외")
+                if async_logging:
+                    Logger._listeners.pop(name).stop()
+                Logger._instances.pop(name, None)
+
+                self.assertEqual(logger.stats()['records'], 3)
+                self.assertEqual(len(second.records), 3)
+                for record, text in second.records:
+                    self.assertEqual(record_context(record).values, {'request_id': 'r-child'})
+                    self.assertIn("| request_id=r-child", text)
+                self.assertIsNotNone(getattr(second.records[2][0], 'exception_id', None))
+
+
+if __name__ == "__main__":
+    unittest.main()
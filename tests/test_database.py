@@ -0,0 +1,130 @@
+"""
+SQLite 데이터베이스 핸들러 단위 테스트
+"""
+
+import sys
+import os
+import time
+import sqlite3
+import unittest
+import tempfile
+import logging
+import shutil
+import threading
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import Logger, DatabaseHandler
+
+
+class TestDatabaseHandler(unittest.TestCase):
+    """DatabaseHandler 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "logs", "app.db")
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def _logger(self, name, handler):
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        return logger
+
+    def test_schema_and_wal(self):
+        """WAL 모드와 인덱스 생성 확인"""
+        handler = DatabaseHandler(f"sqlite:///{self.db_path}", table="app_logs")
+        handler.close()
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            indexes = {row[1] for row in conn.execute("PRAGMA index_list(app_logs)")}
+        finally:
+            conn.close()
+        self.assertEqual(indexes, {"idx_app_logs_created", "idx_app_logs_level", "idx_app_logs_name"})
+
+    def test_batched_inserts(self):
+        """배치 단위 삽입 및 조회"""
+        handler = DatabaseHandler(self.db_path, batch_size=100, flush_interval=60)
+        logger = self._logger("db_batch", handler)
+        for i in range(250):
+            logger.info("메시지 %d", i)
+        logger.error("에러 메시지")
+
+        # 배치 두 개(200행)만 저장된 상태
+        self.assertEqual(len(handler.query(limit=1000)), 200)
+        handler.close()
+
+        rows = handler.query(limit=1000)
+        self.assertEqual(len(rows), 251)
+        self.assertEqual([r['raw_message'] for r in rows[:3]], ["메시지 0", "메시지 1", "메시지 2"])
+        errors = handler.query(level=logging.ERROR)
+        self.assertEqual([r['raw_message'] for r in errors], ["에러 메시지"])
+        self.assertEqual(handler.stats.snapshot()['flushes'], 3)
+
+    def test_reads_while_writing(self):
+        """쓰는 중에도 다른 연결에서 조회 가능"""
+        handler = DatabaseHandler(self.db_path, batch_size=200, flush_interval=0.05)
+        logger = self._logger("db_concurrent", handler)
+        stop = threading.Event()
+
+        def writer():
+            i = 0
+            while not stop.is_set():
+                logger.info("동시 %d", i)
+                i += 1
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            seen = 0
+            deadline = time.time() + 5
+            while seen < 1000 and time.time() < deadline:
+                seen = len(handler.query(name="db_concurrent", limit=100000))
+        finally:
+            stop.set()
+            thread.join()
+            handler.close()
+        self.assertGreaterEqual(seen, 1000)
+        self.assertEqual(handler.stats.snapshot()['write_errors'], 0)
+
+    def test_retention_delete(self):
+        """보관 기간이 지난 행 삭제"""
+        handler = DatabaseHandler(self.db_path, batch_size=1000, flush_interval=60)
+        logger = self._logger("db_retention", handler)
+        old = logging.LogRecord("db_retention", logging.INFO, __file__, 1, "오래된 로그", None, None)
+        old.created = time.time() - 3 * 86400
+        logger.handle(old)
+        logger.info("새 로그")
+        handler.flush()
+
+        self.assertEqual(handler.delete_older_than(86400), 1)
+        handler.close()
+        self.assertEqual([r['raw_message'] for r in handler.query()], ["새 로그"])
+
+    def test_logger_extra_handlers(self):
+        """Logger의 extra_handlers로 연결"""
+        handler = DatabaseHandler(self.db_path, flush_interval=60)
+        logger = Logger("db_logger", console_output=False, async_logging=False, extra_handlers=[handler])
+        logger.warning("경고 %s", "저장")
+        handler.close()
+        rows = handler.query()
+        self.assertEqual(rows[0]['raw_message'], "경고 저장")
+        self.assertIn("[WARNING]", rows[0]['message'])
+
+    def test_invalid_table_name(self):
+        """잘못된 테이블 이름 검증"""
+        with self.assertRaises(ValueError):
+            DatabaseHandler(self.db_path, table="logs; DROP TABLE x")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+파케이 인코더 풀 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+import tempfile
+import logging
+import shutil
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging.encoder import ParquetEncoderPool, encode_batch, decode_batch
+from ineeji_logging.logger import ParquetLogHandler
+
+
+class TestBatchFrame(unittest.TestCase):
+    """컬럼 바이너리 프레임 테스트"""
+
+    def test_round_trip(self):
+        """직렬화 후 복원 시 값이 보존되는지 테스트"""
+        created = datetime(2025, 3, 1, 12, 30, 45, 123456)
+        records = [
+            {'datetime': created, 'levelname': 'INFO', 'message': '한글 메시지', 'lineno': 10},
+            {'datetime': created, 'levelname': 'ERROR', 'message': '', 'lineno': 20,
+             'exception': 'Traceback ...'},
+        ]
+
+        batch_id, path, df = decode_batch(encode_batch(7, '/tmp/log.parquet', records))
+
+        self.assertEqual(batch_id, 7)
+        self.assertEqual(path, '/tmp/log.parquet')
+        self.assertEqual(list(df.columns), ['datetime', 'levelname', 'message', 'lineno', 'exception'])
+        self.assertEqual(df['datetime'].iloc[0], pd.Timestamp(created))
+        self.assertEqual(df['message'].tolist(), ['한글 메시지', ''])
+        self.assertEqual(df['lineno'].tolist(), [10, 20])
+        self.assertTrue(pd.isna(df['exception'].iloc[0]))
+        self.assertEqual(df['exception'].iloc[1], 'Traceback ...')
+
+
+class TestParquetEncoderPool(unittest.TestCase):
+    """워커 프로세스 인코딩 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.pool = ParquetEncoderPool(workers=2)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.pool.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_handler_offloads_to_worker(self):
+        """핸들러 배치가 워커에서 순서대로 저장되는지 테스트"""
+        handler = ParquetLogHandler(self.temp_dir, "test", "encoder", flush_threshold=10, encoder=self.pool)
+        logger = logging.getLogger("encoder_offload")
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        try:
+            for i in range(35):
+                logger.info("메시지 %d", i)
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+            ParquetLogHandler._instances.remove(handler)
+
+        today = datetime.now().strftime('%Y-%m-%d')
+        df = pd.read_parquet(Path(self.temp_dir) / "encoder" / "test" / today / "log.parquet")
+        self.assertEqual(df['raw_message'].tolist(), [f"메시지 {i}" for i in range(35)])
+
+        stats = handler.stats.snapshot()
+        self.assertEqual(stats['flushes'], 4)
+        self.assertEqual(stats['write_errors'], 0)
+        self.assertGreater(stats['bytes_written'], 0)
+        self.assertEqual(self.pool.in_flight, 0)
+
+    def test_worker_error_is_reported(self):
+        """워커 쓰기 실패가 메트릭에 반영되는지 테스트"""
+        handler = ParquetLogHandler(self.temp_dir, "test", "encoder", encoder=self.pool)
+        blocked = Path(self.temp_dir) / "missing_dir" / "log.parquet"
+        self.assertTrue(self.pool.submit(blocked, [{'message': 'x'}], handler.stats))
+        self.assertTrue(self.pool.drain(timeout=30))
+        ParquetLogHandler._instances.remove(handler)
+
+        stats = handler.stats.snapshot()
+        self.assertEqual(stats['write_errors'], 1)
+        self.assertEqual(stats['drops'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+"""
+예외 지문 계산과 트레이스백 중복 제거 저장 테스트
+"""
+
+import sys
+import os
+import time
+import unittest
+import tempfile
+import logging
+import shutil
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import pandas as pd
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import Logger, read_parquet_logs
+from ineeji_logging import fingerprint
+from ineeji_logging.fingerprint import exception_fingerprint, TracebackStore, EXCEPTIONS_FILE
+from ineeji_logging.logger import ParquetLogHandler
+
+
+def _fail(value):
+    raise ValueError(f"잘못된 값: {value}")
+
+
+def _fail_elsewhere(value):
+    raise ValueError(f"잘못된 값: {value}")
+
+
+def _fail_chained(value):
+    try:
+        _fail(value)
+    except ValueError as e:
+        raise RuntimeError("처리 실패") from e
+
+
+def _exc_info(func, value):
+    try:
+        func(value)
+    except ValueError:
+        return sys.exc_info()
+
+
+class TestExceptionFingerprint(unittest.TestCase):
+    """exception_fingerprint 테스트"""
+
+    def test_same_site_same_fingerprint(self):
+        """메시지가 달라도 같은 위치의 예외는 같은 지문"""
+        self.assertEqual(exception_fingerprint(_exc_info(_fail, 1)), exception_fingerprint(_exc_info(_fail, 2)))
+
+    def test_different_site_different_fingerprint(self):
+        """다른 위치에서 발생한 예외는 다른 지문"""
+        self.assertNotEqual(exception_fingerprint(_exc_info(_fail, 1)),
+                            exception_fingerprint(_exc_info(_fail_elsewhere, 1)))
+
+    def test_chained_exception(self):
+        """연결된 예외의 원인이 다르면 다른 지문"""
+        def wrap(func):
+            try:
+                func(1)
+            except ValueError as e:
+                try:
+                    raise RuntimeError("처리 실패") from e
+                except RuntimeError:
+                    return sys.exc_info()
+
+        self.assertNotEqual(exception_fingerprint(wrap(_fail)), exception_fingerprint(wrap(_fail_elsewhere)))
+
+
+class TestTracebackDeduplication(unittest.TestCase):
+    """ParquetLogHandler 트레이스백 중복 제거 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.partition = Path(self.temp_dir) / "dedupe" / "test" / time.strftime('%Y-%m-%d')
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def _log_failures(self, async_logging, count=50):
+        handler = ParquetLogHandler(self.temp_dir, "test", "dedupe", flush_threshold=10)
+        logger = Logger(f"dedupe_{async_logging}", console_output=False, async_logging=async_logging,
+                        extra_handlers=[handler])
+        try:
+            for i in range(count):
+                try:
+                    _fail(i)
+                except ValueError:
+                    logger.exception("처리 실패 %d", i)
+            logger.info("정상 로그")
+        finally:
+            if async_logging:
+                Logger._listeners.pop(logger.name).stop()
+            handler.close()
+            ParquetLogHandler._instances.remove(handler)
+        return handler
+
+    def _check_partition(self, count=50):
+        df = pd.read_parquet(self.partition / "log.parquet")
+        self.assertEqual(len(df), count + 1)
+        self.assertNotIn('exception', df.columns)
+        self.assertEqual(df['exception_id'].iloc[:count].nunique(), 1)
+        self.assertFalse(df['message'].str.contains('Traceback').any())
+
+        table = pd.read_parquet(self.partition / EXCEPTIONS_FILE)
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table['exception_type'].iloc[0], 'ValueError')
+
+        full = read_parquet_logs(self.partition)
+        for i in (0, count - 1):
+            text = full['exception'].iloc[i]
+            self.assertTrue(text.startswith("Traceback (most recent call last):"))
+            self.assertIn("in _fail", text)
+            self.assertTrue(text.endswith(f"ValueError: 잘못된 값: {i}"))
+        self.assertTrue(pd.isna(full['exception'].iloc[count]))
+
+    def test_sync_logging(self):
+        """동기 로깅: 트레이스백은 한 번만 저장하고 포맷도 한 번만 수행"""
+        self._log_failures(async_logging=False)
+        self._check_partition()
+
+    def test_async_logging(self):
+        """비동기 로깅에서도 호출자 쪽에서 계산한 지문으로 중복 제거"""
+        self._log_failures(async_logging=True)
+        self._check_partition()
+
+    def test_existing_partition_not_rewritten(self):
+        """새 핸들러도 파티션에 이미 있는 트레이스백은 다시 저장하지 않음"""
+        self._log_failures(async_logging=False, count=5)
+        self._log_failures(async_logging=False, count=5)
+        self.assertEqual(len(pd.read_parquet(self.partition / EXCEPTIONS_FILE)), 1)
+
+    def test_pruning_keeps_unwritten_tracebacks(self):
+        """보관 한도를 넘어도 아직 저장하지 않은 지문의 트레이스백은 유지"""
+        store = TracebackStore()
+        for i in range(10):
+            store.remember(SimpleNamespace(exception_id=f"id{i}", exception_type='ValueError',
+                                           exception_stack=f"stack {i}\n"), datetime.now())
+        self.partition.mkdir(parents=True)
+        with mock.patch.object(fingerprint, '_CACHE_SIZE', 4):
+            self.assertEqual(store.store(self.partition, [{'exception_id': f"id{i}"} for i in range(3)]), 3)
+            # 버퍼에 남아 있던 나머지 행이 나중에 저장되어도 트레이스백을 찾을 수 있어야 함
+            self.assertEqual(store.store(self.partition, [{'exception_id': f"id{i}"} for i in range(3, 10)]), 7)
+        table = pd.read_parquet(self.partition / EXCEPTIONS_FILE)
+        self.assertEqual(sorted(table['exception_id']), sorted(f"id{i}" for i in range(10)))
+        self.assertEqual(store._pending, {})
+
+    def test_chained_exception_keeps_cause_message(self):
+        """같은 연결 예외가 다른 원인 메시지로 반복되면 레코드마다 자기 원인 메시지를 기록"""
+        for async_logging in (False, True):
+            with self.subTest(async_logging=async_logging):
+                shutil.rmtree(self.partition, ignore_errors=True)
+                texts = []
+                text_handler = logging.Handler()
+                text_handler.emit = lambda record: texts.append(text_handler.format(record))
+                handler = ParquetLogHandler(self.temp_dir, "test", "dedupe", flush_threshold=1000)
+                logger = Logger(f"dedupe_chained_{async_logging}", console_output=False,
+                                async_logging=async_logging, extra_handlers=[text_handler, handler])
+                try:
+                    for value in ("첫째", "둘째"):
+                        try:
+                            _fail_chained(value)
+                        except RuntimeError:
+                            logger.exception("연결 예외")
+                finally:
+                    if async_logging:
+                        Logger._listeners.pop(logger.name).stop()
+                    Logger._instances.pop(logger.name, None)
+                    handler.close()
+                    ParquetLogHandler._instances.remove(handler)
+
+                full = read_parquet_logs(self.partition)
+                for i, value in enumerate(("첫째", "둘째")):
+                    self.assertIn(f"ValueError: 잘못된 값: {value}\n", texts[i])
+                    self.assertIn(f"ValueError: 잘못된 값: {value}\n", full['exception'].iloc[i])
+                    self.assertTrue(full['exception'].iloc[i].endswith("RuntimeError: 처리 실패"))
+                self.assertEqual(full['exception_id'].nunique(), 1)
+
+    def test_formatting_cached_per_fingerprint(self):
+        """같은 지문의 트레이스백 포맷은 캐시 사용"""
+        handler = ParquetLogHandler(self.temp_dir, "test", "dedupe", flush_threshold=1000)
+        logger = logging.getLogger("dedupe_cache")
+        logger.addHandler(handler)
+        try:
+            for i in range(20):
+                try:
+                    _fail(i)
+                except ValueError:
+                    logger.exception("실패")
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+            ParquetLogHandler._instances.remove(handler)
+        self.assertEqual(handler.fingerprinter.misses, 1)
+        self.assertEqual(handler.fingerprinter.hits, 19)
+
+
+if __name__ == "__main__":
+    unittest.main()
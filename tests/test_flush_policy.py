@@ -0,0 +1,231 @@
+"""
+적응형 플러시 정책 단위 테스트
+"""
+
+import sys
+import os
+import time
+import unittest
+import tempfile
+import logging
+import shutil
+import threading
+from unittest import mock
+from pathlib import Path
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import AdaptiveFlushPolicy
+from ineeji_logging import Logger
+from ineeji_logging.config import config_from_env
+from ineeji_logging.logger import ParquetLogHandler
+from ineeji_logging.reader import read_parquet_logs, partition_dir, LOG_FILE
+
+
+class TestAdaptiveFlushPolicy(unittest.TestCase):
+    """AdaptiveFlushPolicy 테스트"""
+
+    def _update_after(self, policy, elapsed, batch_size, batch_bytes=None):
+        """elapsed초 뒤에 플러시가 일어난 것으로 가정하고 update 호출"""
+        with mock.patch('ineeji_logging.flush_policy.time.monotonic',
+                        return_value=policy._last_flush + elapsed):
+            return policy.update(batch_size, batch_bytes)
+
+    def test_grows_under_high_load(self):
+        """유입률이 높으면 임계값 증가"""
+        policy = AdaptiveFlushPolicy(target_interval=1.0, smoothing=1.0)
+        threshold = self._update_after(policy, 0.01, 100)  # 10,000건/초
+        self.assertEqual(threshold, 10000)
+        self.assertEqual(policy.snapshot()['reason'], 'rate')
+
+    def test_shrinks_under_low_load(self):
+        """유입률이 낮으면 하한까지 임계값 감소"""
+        policy = AdaptiveFlushPolicy(target_interval=1.0, min_threshold=5, smoothing=1.0)
+        threshold = self._update_after(policy, 10.0, 3)  # 0.3건/초
+        self.assertEqual(threshold, 5)
+        self.assertEqual(policy.snapshot()['reason'], 'min')
+
+    def test_memory_limit(self):
+        """버퍼 메모리 한도에 맞춰 임계값 제한"""
+        policy = AdaptiveFlushPolicy(target_interval=1.0, max_buffer_bytes=100000, smoothing=1.0)
+        threshold = self._update_after(policy, 0.01, 100, batch_bytes=100 * 1000)
+        self.assertEqual(threshold, 100)
+        self.assertEqual(policy.snapshot()['reason'], 'memory')
+
+    def test_invalid_arguments(self):
+        """잘못된 인자 검증"""
+        with self.assertRaises(ValueError):
+            AdaptiveFlushPolicy(target_interval=0)
+        with self.assertRaises(ValueError):
+            AdaptiveFlushPolicy(min_threshold=100, max_threshold=10)
+
+
+class TestAdaptiveParquetHandler(unittest.TestCase):
+    """적응형 정책을 사용하는 ParquetLogHandler 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_old_buffer_is_flushed(self):
+        """임계값 미만이어도 목표 주기가 지나면 저장"""
+        policy = AdaptiveFlushPolicy(target_interval=0.2, initial_threshold=1000)
+        handler = ParquetLogHandler(self.temp_dir, "test", "adaptive", flush_policy=policy)
+        logger = logging.getLogger("adaptive_parquet")
+        logger.addHandler(handler)
+        try:
+            logger.warning("천천히 들어오는 로그")
+            deadline = time.time() + 5
+            while handler.stats.flushes.value == 0 and time.time() < deadline:
+                time.sleep(0.05)
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+            ParquetLogHandler._instances.remove(handler)
+
+        self.assertEqual(handler.logs_buffer, [])
+        self.assertEqual(handler.stats.flushes.value, 1)
+        self.assertEqual(handler.flush_threshold, policy.min_threshold)
+        self.assertEqual(handler.stats.snapshot()['flush_policy']['threshold'], policy.min_threshold)
+        today = time.strftime('%Y-%m-%d')
+        self.assertTrue((Path(self.temp_dir) / "adaptive" / "test" / today / "log.parquet").exists())
+
+    def test_new_threshold_applies_to_next_batch(self):
+        """정책이 정한 임계값은 바로 다음 배치부터 적용"""
+        policy = AdaptiveFlushPolicy(target_interval=60.0, initial_threshold=1000)
+        handler = ParquetLogHandler(self.temp_dir, "test", "adaptive", flush_policy=policy)
+        logger = logging.getLogger("adaptive_next_batch")
+        logger.propagate = False
+        logger.addHandler(handler)
+        try:
+            with mock.patch.object(policy, 'update', return_value=5):
+                logger.warning("첫 배치")
+                handler.flush()
+                for i in range(5):
+                    logger.warning("둘째 배치 %d", i)
+                self.assertEqual(handler.stats.flushes.value, 2)
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+            ParquetLogHandler._instances.remove(handler)
+
+
+class TestPriorityFlush(unittest.TestCase):
+    """레벨별 우선 플러시 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.partition = partition_dir(self.temp_dir, "priority", "test")
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def _handler(self, flush_delays, **kwargs):
+        handler = ParquetLogHandler(self.temp_dir, "test", "priority", flush_threshold=1000,
+                                    flush_delays=flush_delays, **kwargs)
+        logger = logging.getLogger(f"priority_{id(handler)}")
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+        self.addCleanup(ParquetLogHandler._instances.remove, handler)
+        self.addCleanup(handler.close)
+        return handler, logger
+
+    def _messages(self):
+        if not (self.partition / LOG_FILE).exists():
+            return []
+        return read_parquet_logs(self.partition)['raw_message'].tolist()
+
+    def test_error_flushes_buffer_immediately(self):
+        """지연 0이면 ERROR가 들어온 즉시 앞서 쌓인 INFO와 함께 시간 순서대로 저장"""
+        handler, logger = self._handler({'ERROR': 0})
+        for i in range(50):
+            logger.info("정보 %d", i)
+        logger.warning("경고")
+        self.assertEqual(self._messages(), [])
+        logger.error("에러")
+        messages = self._messages()
+        self.assertEqual(len(messages), 52)
+        self.assertEqual(messages[0], "정보 0")
+        self.assertEqual(messages[-2:], ["경고", "에러"])
+        self.assertEqual(handler.stats.snapshot()['priority_flushes'], 1)
+
+        logger.critical("치명적")  # 상위 레벨에도 적용
+        self.assertEqual(len(self._messages()), 53)
+
+    def test_priority_flush_merges_threads_by_time(self):
+        """우선 플러시는 merge_by_time이 꺼져 있어도 다른 스레드의 앞선 레코드를 시간순으로 병합해 저장"""
+        handler, logger = self._handler({'ERROR': 0})
+        logger.info("메인 0")
+        time.sleep(0.002)
+
+        def other():
+            for i in range(2):
+                logger.info("다른 스레드 %d", i)
+                time.sleep(0.002)
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        thread.join()
+        logger.error("에러")
+        self.assertEqual(self._messages(), ["메인 0", "다른 스레드 0", "다른 스레드 1", "에러"])
+
+    def test_delayed_flush_coalesces_errors(self):
+        """지연 안에 들어온 ERROR는 한 번의 쓰기로 모아 저장"""
+        handler, logger = self._handler({'WARNING': 30.0, 'ERROR': 0.2})
+        logger.info("정보")
+        logger.error("에러 1")
+        logger.error("에러 2")
+        self.assertEqual(self._messages(), [])
+        deadline = time.time() + 5
+        while handler.stats.flushes.value == 0 and time.time() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(self._messages(), ["정보", "에러 1", "에러 2"])
+        self.assertEqual(handler.stats.flushes.value, 1)
+        self.assertEqual(handler.logs_buffer, [])
+
+        logger.warning("경고")  # WARNING은 30초 기한이므로 아직 저장하지 않음
+        time.sleep(0.3)
+        self.assertEqual(len(self._messages()), 3)
+
+    def test_invalid_delays(self):
+        """알 수 없는 레벨이나 음수 지연"""
+        with self.assertRaises(ValueError):
+            ParquetLogHandler.parse_flush_delays({'LOUD': 0})
+        with self.assertRaises(ValueError):
+            ParquetLogHandler.parse_flush_delays({'ERROR': -1})
+        self.assertEqual(ParquetLogHandler.parse_flush_delays({'ERROR': 0, 'WARNING': '1.5'}),
+                         [(logging.ERROR, 0.0), (logging.WARNING, 1.5)])
+
+    def test_logger_config(self):
+        """Logger 설정, 환경 변수, 실행 중 변경"""
+        self.assertEqual(config_from_env(environ={'INEEJI_LOG_PARQUET_FLUSH_DELAYS': 'ERROR=0.005, WARNING=1'}),
+                         {'parquet_flush_delays': {'ERROR': 0.005, 'WARNING': 1.0}})
+        with mock.patch.dict(os.environ, {'HOME': self.temp_dir}):
+            log = Logger("priority_logger", console_output=False, async_logging=False, parquet_logging=True,
+                         project_name="priority", env="test", parquet_flush_threshold=1000,
+                         parquet_flush_delays={"ERROR": 0})
+        handler = log.handlers[0]
+        try:
+            log.info("정보")
+            log.error("에러")
+            self.assertEqual(handler._buffered_count(), 0)
+            log.reconfigure(parquet_flush_delays=None)
+            self.assertIs(log.handlers[0], handler)
+            log.error("배치로 저장")
+            self.assertEqual(handler._buffered_count(), 1)
+        finally:
+            handler.close()
+            ParquetLogHandler._instances.remove(handler)
+            Logger._instances.pop("priority_logger", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
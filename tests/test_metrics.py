@@ -0,0 +1,174 @@
+"""
+로깅 메트릭 단위 테스트
+"""
+
+import sys
+import os
+import unittest
+import tempfile
+import logging
+import shutil
+import threading
+import urllib.request
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import Logger
+from ineeji_logging.logger import ParquetLogHandler
+from ineeji_logging.metrics import Counter, Histogram, to_prometheus
+
+
+class TestHistogram(unittest.TestCase):
+    """Histogram 테스트"""
+
+    def test_quantiles(self):
+        """백분위수 근사 테스트"""
+        histogram = Histogram((1, 2, 5, 10))
+        for value in [0.5] * 98 + [4, 20]:
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot['count'], 100)
+        self.assertEqual(snapshot['p50'], 1)
+        self.assertEqual(snapshot['p99'], 5)
+        self.assertEqual(snapshot['p999'], float('inf'))
+
+
+class TestThreadCells(unittest.TestCase):
+    """스레드별 누적 카운터/히스토그램 테스트"""
+
+    def test_totals_across_threads(self):
+        """여러 스레드의 기록을 합산하고, 종료된 스레드의 값도 유지"""
+        counter = Counter()
+        histogram = Histogram((1, 2))
+
+        def work():
+            for _ in range(1000):
+                counter.inc()
+                histogram.observe(1.5)
+
+        for _ in range(5):  # 스레드를 계속 새로 만들어도 종료된 스레드의 칸은 합쳐서 정리
+            threads = [threading.Thread(target=work) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        counter.inc(5)
+        self.assertEqual(counter.value, 40005)
+        self.assertEqual(histogram.snapshot()['count'], 40000)
+        self.assertEqual(histogram.snapshot()['sum'], 60000.0)
+        self.assertLessEqual(len(counter._cells._cells), 9)
+
+    def test_record_path_takes_no_lock(self):
+        """등록된 스레드의 기록은 공유 락을 잡지 않음 (읽는 쪽이 락을 잡고 있어도 막히지 않음)"""
+        counter = Counter()
+        histogram = Histogram()
+        done = threading.Event()
+
+        def work():
+            counter.inc()
+            histogram.observe(0.001)
+            registered.set()
+            resume.wait()
+            for _ in range(100):
+                counter.inc()
+                histogram.observe(0.001)
+            done.set()
+
+        registered, resume = threading.Event(), threading.Event()
+        worker = threading.Thread(target=work)
+        worker.start()
+        registered.wait()
+        with counter._cells._lock, histogram._cells._lock:
+            resume.set()
+            self.assertTrue(done.wait(5))
+        worker.join()
+        self.assertEqual(counter.value, 101)
+        self.assertEqual(histogram.snapshot()['count'], 101)
+
+
+class TestLoggerStats(unittest.TestCase):
+    """Logger.stats() 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.temp_dir, "app.log")
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_async_stats(self):
+        """비동기 로거 메트릭 테스트"""
+        logger = Logger("metrics_async", log_file=self.log_file, console_output=False)
+        for i in range(50):
+            logger.info("메시지 %d", i)
+        Logger._listeners[logger.name].stop()
+
+        stats = logger.stats()
+        self.assertTrue(stats['async'])
+        self.assertEqual(stats['records'], 50)
+        self.assertEqual(stats['enqueue_latency']['count'], 50)
+        self.assertEqual(stats['queue_depth'], 0)
+        self.assertEqual(stats['handlers']['FileHandler']['records'], 50)
+        self.assertEqual(stats['handlers']['FileHandler']['emit_time']['count'], 50)
+
+    def test_sync_stats(self):
+        """동기 로거 메트릭 테스트"""
+        logger = Logger("metrics_sync", log_file=self.log_file, console_output=False, async_logging=False)
+        logger.info("메시지")
+        logger.debug("필터링되는 메시지")
+
+        stats = logger.stats()
+        self.assertFalse(stats['async'])
+        self.assertIsNone(stats['queue_depth'])
+        self.assertEqual(stats['records'], 1)
+        self.assertEqual(stats['handlers']['FileHandler']['records'], 1)
+
+    def test_parquet_write_error_is_counted(self):
+        """파케이 쓰기 실패가 메트릭에 기록되는지 테스트"""
+        # 파일을 디렉토리처럼 사용하여 쓰기 실패 유도
+        blocker = os.path.join(self.temp_dir, "blocker")
+        open(blocker, 'w').close()
+        handler = ParquetLogHandler(blocker, "test", "project", flush_threshold=2)
+        logger = logging.getLogger("metrics_parquet_error")
+        logger.addHandler(handler)
+        try:
+            logger.warning("첫 번째")
+            logger.warning("두 번째")
+        finally:
+            logger.removeHandler(handler)
+            ParquetLogHandler._instances.remove(handler)
+
+        stats = handler.stats.snapshot()
+        self.assertEqual(stats['flushes'], 1)
+        self.assertEqual(stats['write_errors'], 1)
+        self.assertEqual(stats['drops'], 2)
+        self.assertEqual(stats['buffer_size'], 0)
+        self.assertIsNotNone(stats['last_error'])
+
+    def test_prometheus_export(self):
+        """프로메테우스 텍스트 및 HTTP 내보내기 테스트"""
+        logger = Logger("metrics_export", log_file=self.log_file, console_output=False, async_logging=False)
+        logger.error("에러")
+
+        text = to_prometheus([logger.stats()])
+        self.assertIn('ineeji_logging_records_total{logger="metrics_export"} 1', text)
+        self.assertIn('ineeji_logging_handler_records_total{logger="metrics_export",handler="FileHandler"} 1', text)
+
+        textfile = os.path.join(self.temp_dir, "metrics", "ineeji.prom")
+        exporter = Logger.start_metrics_exporter(textfile=textfile, http_port=0, interval=60)
+        try:
+            with open(textfile, encoding='utf-8') as f:
+                self.assertIn('logger="metrics_export"', f.read())
+            url = f"http://127.0.0.1:{exporter.http_port}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                self.assertIn('logger="metrics_export"', response.read().decode('utf-8'))
+        finally:
+            exporter.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
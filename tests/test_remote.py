@@ -0,0 +1,247 @@
+"""
+원격 핸들러 단위 테스트 (로컬 소켓 서버 사용)
+"""
+
+import sys
+import os
+import json
+import time
+import socket
+import struct
+import unittest
+import tempfile
+import logging
+import shutil
+import threading
+from unittest import mock
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import Logger, RemoteHandler
+
+
+class CollectorServer:
+    """수신한 바이트를 모두 모으는 로컬 TCP 서버"""
+
+    def __init__(self, port: int = 0):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(('127.0.0.1', port))
+        self.sock.listen(5)
+        self.port = self.sock.getsockname()[1]
+        self.data = bytearray()
+        self.connections = 0
+        self.lock = threading.Lock()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._read, args=(conn,), daemon=True).start()
+
+    def _read(self, conn):
+        with conn:
+            while True:
+                try:
+                    chunk = conn.recv(65536)
+                except OSError:
+                    return
+                if not chunk:
+                    return
+                with self.lock:
+                    self.data.extend(chunk)
+
+    def syslog_messages(self):
+        """octet-counting 프레임을 메시지 목록으로 분리"""
+        with self.lock:
+            data = bytes(self.data)
+        messages, offset = [], 0
+        while offset < len(data):
+            space = data.index(b' ', offset)
+            length = int(data[offset:space])
+            messages.append(data[space + 1:space + 1 + length].decode('utf-8'))
+            offset = space + 1 + length
+        return messages
+
+    def close(self):
+        self.sock.close()
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+class TestRemoteHandler(unittest.TestCase):
+    """RemoteHandler 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def _logger(self, name, handler):
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        return logger
+
+    def test_syslog_batches_over_one_connection(self):
+        """RFC 5424 프레임을 하나의 연결로 배치 전송"""
+        server = CollectorServer()
+        self.addCleanup(server.close)
+        handler = RemoteHandler('127.0.0.1', server.port, app_name='my app', batch_size=50, flush_interval=0.05)
+        logger = self._logger("remote_syslog", handler)
+
+        for i in range(120):
+            logger.warning("메시지 %d", i)
+        self.assertTrue(wait_until(lambda: len(server.syslog_messages()) == 120))
+        handler.close()
+
+        messages = server.syslog_messages()
+        self.assertEqual(server.connections, 1)
+        self.assertTrue(messages[0].startswith("<12>1 "))
+        self.assertIn(" myapp ", messages[0])
+        self.assertTrue(messages[0].endswith("﻿메시지 0"))
+        self.assertEqual([m.rsplit("﻿", 1)[1] for m in messages], [f"메시지 {i}" for i in range(120)])
+        self.assertLess(handler.stats.snapshot()['flushes'], 120)
+
+    def test_length_prefixed_json(self):
+        """길이 접두 JSON 프레임 전송"""
+        server = CollectorServer()
+        self.addCleanup(server.close)
+        handler = RemoteHandler('127.0.0.1', server.port, framing='length', flush_interval=0.05)
+        logger = self._logger("remote_length", handler)
+        logger.error("에러 %s", "발생")
+        self.assertTrue(wait_until(lambda: len(server.data) > 4))
+        handler.close()
+
+        (length,) = struct.unpack('>I', bytes(server.data[:4]))
+        payload = json.loads(bytes(server.data[4:4 + length]).decode('utf-8'))
+        self.assertEqual(payload['levelname'], 'ERROR')
+        self.assertEqual(payload['raw_message'], '에러 발생')
+
+    def test_spill_and_replay_in_order(self):
+        """연결 끊김 동안 디스크에 보관 후 재연결 시 순서대로 재전송"""
+        probe = socket.socket()
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+        probe.close()
+
+        spill_dir = os.path.join(self.temp_dir, "spill")
+        handler = RemoteHandler('127.0.0.1', port, batch_size=10, flush_interval=0.05,
+                                spill_dir=spill_dir, backoff_initial=0.05, backoff_max=0.1)
+        logger = self._logger("remote_spill", handler)
+
+        for i in range(30):
+            logger.info("오프라인 %d", i)
+        self.assertTrue(wait_until(lambda: handler.spool.size > 0))
+        self.assertGreater(handler.stats.snapshot()['write_errors'], 0)
+
+        server = CollectorServer(port)
+        self.addCleanup(server.close)
+        for i in range(10):
+            logger.info("온라인 %d", i)
+        self.assertTrue(wait_until(lambda: len(server.syslog_messages()) == 40))
+        handler.close()
+
+        bodies = [m.rsplit("﻿", 1)[1] for m in server.syslog_messages()]
+        expected = [f"오프라인 {i}" for i in range(30)] + [f"온라인 {i}" for i in range(10)]
+        self.assertEqual(bodies, expected)
+        self.assertEqual(handler.spool.size, 0)
+
+    def test_spill_burst_beyond_memory_limit(self):
+        """연결이 끊긴 동안 메모리 한도보다 많이 쌓여도 디스크로 옮겨 유실 없이 재전송"""
+        probe = socket.socket()
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+        probe.close()
+
+        handler = RemoteHandler('127.0.0.1', port, batch_size=100, flush_interval=0.05, max_pending=2000,
+                                spill_dir=os.path.join(self.temp_dir, "burst"),
+                                backoff_initial=0.5, backoff_max=0.5)
+        logger = self._logger("remote_burst", handler)
+
+        for i in range(10000):
+            logger.info("오프라인 %d", i)
+        self.assertTrue(wait_until(lambda: not handler._pending))
+        self.assertEqual(handler.stats.snapshot()['drops'], 0)
+
+        server = CollectorServer(port)
+        self.addCleanup(server.close)
+        self.assertTrue(wait_until(lambda: len(server.syslog_messages()) >= 10000, timeout=10))
+        handler.close()
+        bodies = [m.rsplit("﻿", 1)[1] for m in server.syslog_messages()]
+        self.assertEqual(bodies, [f"오프라인 {i}" for i in range(10000)])
+
+    def test_backoff_does_not_spin(self):
+        """디스크 버퍼 없이 연결이 끊긴 동안 배치가 차 있어도 재연결 시각까지 전송 시도를 멈춤"""
+        probe = socket.socket()
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+        probe.close()
+
+        handler = RemoteHandler('127.0.0.1', port, batch_size=10, flush_interval=0.05,
+                                backoff_initial=0.5, backoff_max=0.5)
+        attempts = mock.patch.object(handler, '_drain_once', wraps=handler._drain_once)
+        drain = attempts.start()
+        self.addCleanup(attempts.stop)
+        logger = self._logger("remote_backoff", handler)
+
+        for i in range(50):
+            logger.info("오프라인 %d", i)
+        time.sleep(1.2)
+        handler.close()
+        # 재연결 간격 0.5초 동안 한두 번만 시도 (대기 없이 반복하면 수만 번)
+        self.assertLess(drain.call_count, 10)
+        self.assertEqual(handler.stats.snapshot()['drops'], 50)
+
+    def test_slow_receiver_does_not_block(self):
+        """수신측이 읽지 않아도 emit은 막히지 않음"""
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)  # accept/recv를 하지 않는 수신측
+        self.addCleanup(server.close)
+        handler = RemoteHandler('127.0.0.1', server.getsockname()[1], send_timeout=0.2,
+                                spill_dir=os.path.join(self.temp_dir, "slow"), backoff_initial=0.05)
+        logger = self._logger("remote_slow", handler)
+
+        payload = "x" * 2000
+        start = time.perf_counter()
+        for i in range(5000):
+            logger.info("%d %s", i, payload)
+        elapsed = time.perf_counter() - start
+        handler.close()
+        self.assertLess(elapsed, 5.0)
+
+    def test_logger_extra_handlers(self):
+        """Logger의 extra_handlers로 비동기 리스너에 연결"""
+        server = CollectorServer()
+        self.addCleanup(server.close)
+        handler = RemoteHandler('127.0.0.1', server.port, flush_interval=0.05)
+        logger = Logger("remote_logger", console_output=False, extra_handlers=[handler])
+        logger.info("리스너 경유")
+        self.assertTrue(wait_until(lambda: len(server.syslog_messages()) == 1))
+        Logger._listeners.pop("remote_logger").stop()
+        handler.close()
+        self.assertIn("리스너 경유", server.syslog_messages()[0])
+        self.assertIn("RemoteHandler", logger.stats()['handlers'])
+
+
+if __name__ == "__main__":
+    unittest.main()
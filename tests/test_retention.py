@@ -0,0 +1,161 @@
+"""
+날짜 파티션 보존 관리 테스트
+"""
+
+import sys
+import os
+import io
+import time
+import unittest
+import tempfile
+import shutil
+from datetime import date, timedelta
+from pathlib import Path
+from contextlib import redirect_stdout
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import Logger, RetentionManager
+from ineeji_logging.__main__ import main
+from ineeji_logging.logger import ParquetLogHandler
+from ineeji_logging.retention import parse_size
+
+
+TODAY = date(2024, 3, 31)
+
+
+class TestRetentionManager(unittest.TestCase):
+    """RetentionManager 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.parquet_root = Path(self.temp_dir) / "parquet" / "app" / "production"
+        self.text_root = Path(self.temp_dir) / "logs" / "production"
+        # 10일치 파티션, 파케이 파티션은 1000바이트, 텍스트 파티션은 500바이트
+        for days_ago in range(10):
+            day = (TODAY - timedelta(days=days_ago)).strftime('%Y-%m-%d')
+            self._make(self.parquet_root / day / "log.parquet", 1000)
+            self._make(self.text_root / day / "app.log", 500)
+        self._make(self.parquet_root / "not-a-date" / "log.parquet", 10000)
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def _make(self, path, size):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b'x' * size)
+
+    def _days(self, root):
+        return sorted(name for name in os.listdir(root) if name != "not-a-date")
+
+    def test_parse_size(self):
+        """크기 문자열 변환"""
+        self.assertEqual(parse_size("500"), 500)
+        self.assertEqual(parse_size("2K"), 2048)
+        self.assertEqual(parse_size("1.5GB"), int(1.5 * 1024 ** 3))
+        with self.assertRaises(ValueError):
+            parse_size("lots")
+
+    def test_dry_run_reports_without_deleting(self):
+        """dry-run은 삭제할 목록만 보고"""
+        manager = RetentionManager([self.parquet_root, self.text_root], max_age_days=7)
+        report = manager.run_once(dry_run=True, today=TODAY)
+        self.assertEqual(len(report.deleted), 4)  # 8, 9일 전 x 2개 루트
+        self.assertEqual(report.freed_bytes, 3000)
+        self.assertEqual(report.total_bytes, 15000)
+        self.assertIn("삭제 예정", report.format())
+        self.assertEqual(len(self._days(self.parquet_root)), 10)
+
+    def test_age_limit(self):
+        """보존 기간이 지난 파티션 삭제"""
+        RetentionManager([self.parquet_root, self.text_root], max_age_days=7, pause=0).run_once(today=TODAY)
+        oldest = (TODAY - timedelta(days=7)).strftime('%Y-%m-%d')
+        self.assertEqual(self._days(self.parquet_root)[0], oldest)
+        self.assertEqual(self._days(self.text_root)[0], oldest)
+        self.assertTrue((self.parquet_root / "not-a-date").exists())
+
+    def test_byte_budget_deletes_oldest_first(self):
+        """전체 용량이 한도 이하가 될 때까지 오래된 파티션부터 삭제"""
+        report = RetentionManager([self.parquet_root, self.text_root], max_bytes=7000, pause=0).run_once(today=TODAY)
+        self.assertEqual(report.total_bytes - report.freed_bytes, 7000)
+        self.assertEqual(len(self._days(self.text_root)), 4)  # 같은 날짜는 경로순 (logs < parquet)
+        self.assertEqual(len(self._days(self.parquet_root)), 5)
+        self.assertEqual(self._days(self.parquet_root)[-1], TODAY.strftime('%Y-%m-%d'))
+
+    def test_protected_partitions_kept(self):
+        """오늘 파티션과 쓰는 중인 파티션은 한도를 넘어도 삭제하지 않음"""
+        writing = self.parquet_root / (TODAY - timedelta(days=9)).strftime('%Y-%m-%d')
+        manager = RetentionManager([self.parquet_root], max_bytes=0, pause=0,
+                                   protected=lambda: [writing / "log.parquet"])
+        manager.run_once(today=TODAY)
+        self.assertEqual(self._days(self.parquet_root), [writing.name, TODAY.strftime('%Y-%m-%d')])
+
+    def test_background_thread(self):
+        """백그라운드 스레드로 주기적으로 실행"""
+        manager = RetentionManager([self.parquet_root], max_age_days=0, interval=0.05, pause=0).start()
+        try:
+            deadline = time.monotonic() + 5
+            while self._days(self.parquet_root) and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            manager.stop()
+        # 실제 오늘 기준으로는 모든 파티션이 보존 기간을 넘었으므로 모두 삭제됨
+        self.assertEqual(self._days(self.parquet_root), [])
+        self.assertIsNotNone(manager.last_report)
+
+    def test_cli(self):
+        """prune 명령 dry-run"""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(['prune', '--project', 'app', '--env', 'production',
+                         '--base-path', os.path.join(self.temp_dir, "parquet"),
+                         '--text-root', str(self.text_root), '--max-bytes', '10K', '--dry-run'])
+        self.assertEqual(code, 0)
+        self.assertIn("삭제 예정", out.getvalue())
+        self.assertEqual(len(self._days(self.text_root)), 10)
+
+
+class TestLoggerRetention(unittest.TestCase):
+    """Logger.start_retention 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_roots_and_active_partitions(self):
+        """로거의 파케이/텍스트 루트를 관리하고 쓰는 중인 파티션은 보호"""
+        today = time.strftime('%Y-%m-%d')
+        log_file = os.path.join(self.temp_dir, "logs", "test", today, "app.log")
+        old_text = Path(self.temp_dir) / "logs" / "test" / "2000-01-01"
+        old_text.mkdir(parents=True)
+        handler = ParquetLogHandler(self.temp_dir, "test", "retention", flush_threshold=1)
+        log = Logger("retention_test", log_file=log_file, console_output=False, async_logging=False,
+                     extra_handlers=[handler])
+        try:
+            log.info("기록")
+            manager = log.start_retention(max_bytes=0, interval=3600)
+            deadline = time.monotonic() + 5
+            while manager.last_report is None and time.monotonic() < deadline:
+                time.sleep(0.02)
+            manager.stop()
+            report = manager.last_report
+            self.assertEqual([p.path for p in report.deleted], [old_text])
+            self.assertFalse(old_text.exists())
+            self.assertTrue(os.path.exists(log_file))
+            self.assertTrue((Path(self.temp_dir) / "retention" / "test" / today / "log.parquet").exists())
+        finally:
+            for h in log.handlers:
+                h.close()
+            ParquetLogHandler._instances.remove(handler)
+            Logger._instances.pop("retention_test", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+메시지 토큰 역색인과 검색 테스트
+"""
+
+import sys
+import os
+import io
+import unittest
+import tempfile
+import logging
+import shutil
+from contextlib import redirect_stdout, redirect_stderr
+from unittest import mock
+
+import pandas as pd
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import encoder, search_logs, build_index
+from ineeji_logging.__main__ import main
+from ineeji_logging.encoder import ParquetEncoderPool
+from ineeji_logging.logger import ParquetLogHandler
+from ineeji_logging.reader import partition_dir
+from ineeji_logging.search import build_postings, search_partition, tokenize, INDEX_FILE
+
+
+class TestPostings(unittest.TestCase):
+    """토큰화와 행 범위 생성 테스트"""
+
+    def test_tokenize(self):
+        """소문자, 중복 제거, 짧은 토큰 제외"""
+        self.assertEqual(tokenize("Order order-123 a 주문 실패"), ['order', '123', '주문', '실패'])
+
+    def test_consecutive_rows_merged(self):
+        """같은 토큰의 연속된 행은 하나의 범위"""
+        df = pd.DataFrame({'raw_message': ["alpha beta", "alpha", "beta", "alpha"]})
+        postings = build_postings(df, base_row=10)
+        ranges = {token: list(zip(group['start'], group['stop']))
+                  for token, group in postings.groupby('token')}
+        self.assertEqual(ranges, {'': [(10, 14)], 'alpha': [(10, 12), (13, 14)], 'beta': [(10, 11), (12, 13)]})
+
+
+class TestSearch(unittest.TestCase):
+    """ParquetLogHandler 색인과 search_logs 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.partition = partition_dir(self.temp_dir, "search", "test")
+        self.row_groups = mock.patch.object(encoder, 'ROW_GROUP_ROWS', 100)
+        self.row_groups.start()
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.row_groups.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def _log_orders(self, start, count, index_messages=True, pool=None):
+        handler = ParquetLogHandler(self.temp_dir, "test", "search", flush_threshold=50,
+                                    deferred_formatting=True, index_messages=index_messages, encoder=pool)
+        logger = logging.getLogger(f"search_{index_messages}_{start}")
+        logger.propagate = False
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        try:
+            for i in range(start, start + count):
+                logger.info("주문 order-%d 처리 완료 (%s)", i, 'Fast' if i % 2 else 'slow')
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+            ParquetLogHandler._instances.remove(handler)
+
+    def test_reads_only_matching_row_groups(self):
+        """색인으로 토큰이 들어 있는 로우 그룹만 읽음"""
+        self._log_orders(0, 1000)
+        self.assertTrue((self.partition / INDEX_FILE).exists())
+
+        found, groups_read = search_partition(self.partition, "ORDER-537")
+        self.assertEqual(found['raw_message'].tolist(), ["주문 order-537 처리 완료 (Fast)"])
+        self.assertEqual(groups_read, 1)
+
+        _, groups_read = search_partition(self.partition, "order-99999")
+        self.assertEqual(groups_read, 0)
+
+    def test_word_boundaries(self):
+        """단어 단위로 일치 ("order-5"는 "order-53"과 일치하지 않음)"""
+        self._log_orders(0, 60)
+        self.assertEqual(len(search_logs(self.temp_dir, "search", "test", "order-5")), 1)
+        self.assertEqual(len(search_logs(self.temp_dir, "search", "test", "fast)")), 30)
+
+    def test_unindexed_rows_are_scanned(self):
+        """색인 없이 쓴 행도 전체 스캔으로 찾음"""
+        self._log_orders(0, 200, index_messages=False)
+        self._log_orders(200, 200)
+        found = search_logs(self.temp_dir, "search", "test", "order-42")
+        self.assertEqual(len(found), 1)
+        self.assertEqual(len(search_logs(self.temp_dir, "search", "test", "order-342")), 1)
+
+    def test_build_index_compacts(self):
+        """build_index로 만든 색인은 플러시 시 색인과 같은 결과"""
+        self._log_orders(0, 500)
+        before = search_partition(self.partition, "order-250")[0]
+        self.assertEqual(build_index(self.partition), 500)
+        after, groups_read = search_partition(self.partition, "order-250")
+        self.assertEqual(after['raw_message'].tolist(), before['raw_message'].tolist())
+        self.assertEqual(groups_read, 1)
+
+    def test_index_from_encoder_worker(self):
+        """인코더 워커 프로세스도 저장 후 색인 갱신"""
+        self.row_groups.stop()
+        pool = ParquetEncoderPool(workers=1)
+        try:
+            self._log_orders(0, 120, pool=pool)
+        finally:
+            pool.close()
+            self.row_groups.start()
+        self.assertTrue((self.partition / INDEX_FILE).exists())
+        self.assertEqual(len(search_logs(self.temp_dir, "search", "test", "order-77")), 1)
+
+    def test_cli(self):
+        """search / index 명령"""
+        self._log_orders(0, 100)
+        out = io.StringIO()
+        with redirect_stdout(out), redirect_stderr(io.StringIO()):
+            self.assertEqual(main(['index', '--project', 'search', '--env', 'test', '--base-path', self.temp_dir,
+                                   '--include-today']), 0)
+            self.assertEqual(main(['search', '--project', 'search', '--env', 'test', '--base-path', self.temp_dir,
+                                   'order-12']), 0)
+        self.assertTrue(out.getvalue().rstrip().endswith("주문 order-12 처리 완료 (slow)"))
+
+
+if __name__ == "__main__":
+    unittest.main()
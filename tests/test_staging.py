@@ -0,0 +1,139 @@
+"""
+ParquetLogHandler 스레드별 스테이징 버퍼 테스트
+"""
+
+import sys
+import os
+import time
+import unittest
+import tempfile
+import logging
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging.logger import ParquetLogHandler, DetailedFormatter
+
+
+class TestThreadStaging(unittest.TestCase):
+    """스레드별 스테이징 버퍼 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.handlers = []
+
+    def tearDown(self):
+        """테스트 정리"""
+        for handler in self.handlers:
+            handler.close()
+            ParquetLogHandler._instances.remove(handler)
+        shutil.rmtree(self.temp_dir)
+
+    def _handler(self, name, **kwargs):
+        handler = ParquetLogHandler(self.temp_dir, "test", name, **kwargs)
+        self.handlers.append(handler)
+        return handler
+
+    def _read(self, name):
+        today = time.strftime('%Y-%m-%d')
+        return pd.read_parquet(Path(self.temp_dir) / name / "test" / today / "log.parquet")
+
+    def _run_threads(self, logger, threads, per_thread):
+        def worker(index):
+            for i in range(per_thread):
+                logger.info(f"{index}:{i}")
+
+        workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+    def test_concurrent_emit_keeps_thread_order(self):
+        """여러 스레드가 동시에 기록해도 유실 없이 스레드 내 순서 유지"""
+        handler = self._handler("staging", flush_threshold=50)
+        logger = logging.getLogger("staging_threads")
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        try:
+            self._run_threads(logger, threads=8, per_thread=200)
+            handler.flush()
+        finally:
+            logger.removeHandler(handler)
+
+        df = self._read("staging")
+        self.assertEqual(len(df), 8 * 200)
+        for index in range(8):
+            sequence = [int(message.split(':')[1]) for message in df['raw_message']
+                        if message.startswith(f"{index}:")]
+            self.assertEqual(sequence, list(range(200)))
+        self.assertEqual(handler.stats.write_errors.value, 0)
+
+    def test_merge_by_time(self):
+        """merge_by_time이면 스레드 버퍼를 시간순으로 병합"""
+        handler = self._handler("merged", flush_threshold=100000, merge_by_time=True)
+        logger = logging.getLogger("staging_merged")
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        try:
+            self._run_threads(logger, threads=4, per_thread=100)
+            self.assertEqual(handler.stats.snapshot()['buffer_size'], 400)
+            handler.flush()
+        finally:
+            logger.removeHandler(handler)
+
+        df = self._read("merged")
+        self.assertEqual(len(df), 400)
+        self.assertTrue(df['datetime'].is_monotonic_increasing)
+
+    def test_dead_thread_buffers_are_pruned(self):
+        """종료된 스레드의 빈 버퍼는 플러시 후 정리"""
+        handler = self._handler("pruned", flush_threshold=100000)
+        logger = logging.getLogger("staging_pruned")
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        try:
+            self._run_threads(logger, threads=4, per_thread=10)
+            handler.flush()
+            handler.flush()
+        finally:
+            logger.removeHandler(handler)
+
+        self.assertEqual(handler.stats.snapshot()['staging_buffers'], 0)
+        self.assertEqual(len(self._read("pruned")), 40)
+
+
+class TestDetailedFormatterThreadSafety(unittest.TestCase):
+    """DetailedFormatter 동시 사용 테스트"""
+
+    def test_levels_use_own_format(self):
+        """레벨별 포맷이 다른 스레드의 포맷 전환에 영향받지 않음"""
+        formatter = DetailedFormatter('%(levelname)s|%(message)s',
+                                      detailed_fmt='%(levelname)s|%(message)s|detail')
+        errors = []
+
+        def worker(level):
+            record = logging.LogRecord("fmt", level, __file__, 1, "msg", None, None)
+            for _ in range(2000):
+                detailed = formatter.format(record).endswith('|detail')
+                if detailed != (level >= logging.WARNING):
+                    errors.append(level)
+
+        threads = [threading.Thread(target=worker, args=(level,))
+                   for level in (logging.INFO, logging.ERROR) * 4]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
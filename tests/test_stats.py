@@ -0,0 +1,180 @@
+"""
+파케이 로그 집계(stats)와 내보내기(export) 테스트
+"""
+
+import sys
+import os
+import io
+import json
+import unittest
+import tempfile
+import logging
+import shutil
+from contextlib import redirect_stdout
+from unittest import mock
+
+import pandas as pd
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import encoder, log_stats, export_logs
+from ineeji_logging.__main__ import main
+from ineeji_logging.encoder import append_parquet
+from ineeji_logging.logger import ParquetLogHandler
+from ineeji_logging.reader import partition_dir, list_partitions, iter_row_groups, LOG_FILE
+
+
+LEVELS = ['DEBUG', 'INFO', 'INFO', 'WARNING', 'ERROR']
+
+
+def _day_frame(day, rows):
+    """하루치 합성 로그 (초 단위로 증가, 5행마다 ERROR 1건)"""
+    start = pd.Timestamp(day)
+    return pd.DataFrame({
+        'datetime': [start + pd.Timedelta(seconds=i) for i in range(rows)],
+        'levelname': [LEVELS[i % 5] for i in range(rows)],
+        'name': [f"app.{'db' if i % 3 == 0 else 'web'}" for i in range(rows)],
+        'template': ["요청 %d 처리"] * rows,
+        'args': [json.dumps([i]) for i in range(rows)],
+        'pathname': ['app.py'] * rows,
+        'lineno': [10] * rows,
+        'funcName': ['handle'] * rows,
+    })
+
+
+class TestLogStats(unittest.TestCase):
+    """log_stats 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        with mock.patch.object(encoder, 'ROW_GROUP_ROWS', 50):
+            for day, rows in (('2024-01-01', 300), ('2024-01-02', 120), ('2024-01-03', 10)):
+                path = partition_dir(self.temp_dir, "stats", "test", day)
+                path.mkdir(parents=True)
+                append_parquet(path / LOG_FILE, _day_frame(day, rows))
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_partitions_and_row_groups(self):
+        """날짜 범위로 파티션 선택, 로우 그룹 단위로 필요한 컬럼만 읽기"""
+        partitions = list_partitions(self.temp_dir, "stats", "test", since='2024-01-02')
+        self.assertEqual([p.name for p in partitions], ['2024-01-02', '2024-01-03'])
+        chunks = list(iter_row_groups(partitions[0], columns=['levelname', 'missing']))
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) <= 50 for chunk in chunks))
+        self.assertEqual(sum(len(chunk) for chunk in chunks), 120)
+        self.assertEqual(list(chunks[0].columns), ['levelname'])
+
+    def test_aggregations(self):
+        """분당 레벨별 건수, 상위 로거, 일별 에러율"""
+        with mock.patch('ineeji_logging.stats.iter_row_groups', wraps=iter_row_groups) as reads:
+            stats = log_stats(self.temp_dir, "stats", "test", until='2024-01-02')
+        self.assertTrue(all(call.kwargs['columns'] == ['datetime', 'levelname', 'name']
+                            for call in reads.call_args_list))
+        self.assertEqual(stats.rows, 420)
+
+        per_minute = stats.per_minute
+        self.assertEqual(per_minute.loc[pd.Timestamp('2024-01-01 00:00'), 'INFO'], 24)
+        self.assertEqual(per_minute.loc[pd.Timestamp('2024-01-01 00:04'), 'ERROR'], 12)
+        self.assertEqual(int(per_minute.values.sum()), 420)
+
+        loggers = stats.loggers(top=1)
+        self.assertEqual(loggers.to_dict(), {'app.web': 280})
+
+        daily = stats.daily
+        self.assertEqual(daily['total'].tolist(), [300, 120])
+        self.assertEqual(daily['errors'].tolist(), [60, 24])
+        self.assertAlmostEqual(daily['error_rate'].iloc[0], 0.2)
+
+    def test_cli_json(self):
+        """CLI JSON 출력"""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(['stats', '--project', 'stats', '--env', 'test', '--base-path', self.temp_dir,
+                         '--format', 'json', '--freq', '1h', '--per-minute'])
+        self.assertEqual(code, 0)
+        result = json.loads(out.getvalue())
+        self.assertEqual(result['rows'], 430)
+        self.assertEqual(len(result['daily']), 3)
+        self.assertEqual(result['per_minute'][0]['time'], '2024-01-01T00:00:00')
+        self.assertEqual(result['per_minute'][0]['ERROR'], 60)
+
+
+class TestExport(unittest.TestCase):
+    """export_logs 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def _write_handler_logs(self):
+        handler = ParquetLogHandler(self.temp_dir, "test", "export", flush_threshold=1000,
+                                    deferred_formatting=True)
+        logger = logging.getLogger("export_test")
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+        try:
+            for i in range(5):
+                logger.info("주문 %s 처리", f"order-{i}")
+            try:
+                raise KeyError("order-3")
+            except KeyError:
+                logger.exception("주문 실패")
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+            ParquetLogHandler._instances.remove(handler)
+
+    def test_jsonl_restores_messages_and_tracebacks(self):
+        """JSON Lines 내보내기는 메시지와 트레이스백을 복원"""
+        self._write_handler_logs()
+        out = io.StringIO()
+        rows = export_logs(self.temp_dir, "export", "test", out, fmt='jsonl')
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(rows, 6)
+        self.assertEqual(len(records), 6)
+        self.assertEqual(records[0]['raw_message'], "주문 order-0 처리")
+        self.assertIn("Traceback (most recent call last):", records[5]['exception'])
+        self.assertIsNone(records[0]['exception'])
+
+    def test_csv_streams_row_groups(self):
+        """CSV 내보내기는 로우 그룹마다 이어 쓰고 헤더는 한 번만 출력"""
+        with mock.patch.object(encoder, 'ROW_GROUP_ROWS', 40):
+            for day in ('2024-01-01', '2024-01-02'):
+                path = partition_dir(self.temp_dir, "export", "test", day)
+                path.mkdir(parents=True)
+                append_parquet(path / LOG_FILE, _day_frame(day, 100))
+
+        out = io.StringIO()
+        rows = export_logs(self.temp_dir, "export", "test", out, level='ERROR', name='app.db',
+                           columns=['datetime', 'name', 'raw_message'])
+        df = pd.read_csv(io.StringIO(out.getvalue()))
+        self.assertEqual(rows, len(df))
+        self.assertEqual(list(df.columns), ['datetime', 'name', 'raw_message'])
+        self.assertEqual(len(df), 14)  # i % 5 == 4 and i % 3 == 0 -> 하루 7건
+        self.assertEqual(df['raw_message'].iloc[0], "요청 9 처리")
+
+    def test_cli_output_file(self):
+        """CLI는 출력 파일 확장자로 형식 결정"""
+        self._write_handler_logs()
+        output = os.path.join(self.temp_dir, "out.jsonl")
+        code = main(['export', '--project', 'export', '--env', 'test', '--base-path', self.temp_dir,
+                     '--level', 'ERROR', '-o', output])
+        self.assertEqual(code, 0)
+        with open(output, encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['levelname'], 'ERROR')
+
+
+if __name__ == "__main__":
+    unittest.main()
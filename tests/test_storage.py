@@ -0,0 +1,188 @@
+"""
+저장 백엔드와 압축 코덱 테스트
+"""
+
+import sys
+import os
+import io
+import unittest
+import tempfile
+import logging
+import shutil
+import importlib.util
+from contextlib import redirect_stderr
+
+import fastparquet
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import make_storage, convert_partition, search_logs
+from ineeji_logging.__main__ import main
+from ineeji_logging.encoder import ParquetEncoderPool
+from ineeji_logging.logger import ParquetLogHandler
+from ineeji_logging.export import export_logs
+from ineeji_logging.reader import read_parquet_logs, partition_dir, list_partitions, LOG_FILE, ARROW_FILE
+from ineeji_logging.stats import log_stats
+from ineeji_logging.storage import FastParquetBackend, read_arrow_stream
+from ineeji_logging.tail import ParquetTail
+
+
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+
+class StorageTestCase(unittest.TestCase):
+    """핸들러로 파티션에 로그를 기록하는 공통 셋업"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.partition = partition_dir(self.temp_dir, "storage", "test")
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def _log(self, storage, start, count, pool=None, **handler_kwargs):
+        handler = ParquetLogHandler(self.temp_dir, "test", "storage", flush_threshold=50,
+                                    storage=storage, encoder=pool, **handler_kwargs)
+        logger = logging.getLogger(f"storage_{storage.name}_{start}")
+        logger.propagate = False
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        try:
+            for i in range(start, start + count):
+                if i % 10 == 9:
+                    try:
+                        raise ValueError(f"실패 {i}")
+                    except ValueError:
+                        logger.exception("주문 order-%d 실패", i)
+                else:
+                    logger.info("주문 order-%d 처리 완료 (%s)", i, 'Fast' if i % 2 else 'slow')
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+            ParquetLogHandler._instances.remove(handler)
+
+
+class TestFastParquetBackend(StorageTestCase):
+    """fastparquet 백엔드 코덱 테스트"""
+
+    def _codecs(self):
+        pf = fastparquet.ParquetFile(str(self.partition / LOG_FILE))
+        return {column.meta_data.codec for rg in pf.row_groups for column in rg.columns}
+
+    def test_zstd_with_level(self):
+        """레벨을 지정한 zstd (사전 인코딩 컬럼 포함)"""
+        self._log(FastParquetBackend('zstd', 9), 0, 120)
+        df = read_parquet_logs(self.partition)
+        self.assertEqual(len(df), 120)
+        self.assertEqual(df['raw_message'].iloc[7], "주문 order-7 처리 완료 (Fast)")
+        self.assertEqual(self._codecs(), {fastparquet.parquet_thrift.CompressionCodec.ZSTD})
+
+    def test_lz4_and_none(self):
+        """lz4와 무압축"""
+        self._log(make_storage('fastparquet', 'lz4'), 0, 60)
+        self.assertEqual(self._codecs(), {fastparquet.parquet_thrift.CompressionCodec.LZ4_RAW})
+        self._log(make_storage('fastparquet', 'none'), 60, 60)
+        self.assertEqual(len(read_parquet_logs(self.partition)), 120)
+
+    def test_invalid_names(self):
+        """알 수 없는 백엔드와 코덱"""
+        with self.assertRaises(ValueError):
+            make_storage('orc')
+        with self.assertRaises(ValueError):
+            make_storage('fastparquet', 'brotli')
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow가 설치되어 있지 않음")
+class TestPyArrowBackends(StorageTestCase):
+    """pyarrow/Arrow IPC 스트림 백엔드 테스트"""
+
+    def test_pyarrow_appends_to_fastparquet_file(self):
+        """fastparquet으로 쓴 파일에 pyarrow로 이어 써도 양쪽 모두 읽고 색인됨"""
+        self._log(make_storage('fastparquet'), 0, 100, index_messages=True)
+        self._log(make_storage('pyarrow', 'zstd', 3), 100, 100, index_messages=True)
+        df = read_parquet_logs(self.partition)
+        self.assertEqual(len(df), 200)
+        self.assertEqual(df['raw_message'].iloc[150], "주문 order-150 처리 완료 (slow)")
+        self.assertEqual(df['exception_message'].iloc[199], "ValueError: 실패 199")
+        found = search_logs(self.temp_dir, "storage", "test", "order-142")
+        self.assertEqual(found['raw_message'].tolist(), ["주문 order-142 처리 완료 (slow)"])
+
+    def test_pyarrow_encoder_pool(self):
+        """인코더 워커 프로세스도 지정한 백엔드로 저장"""
+        storage = make_storage('pyarrow')
+        pool = ParquetEncoderPool(workers=1, storage=storage)
+        try:
+            self._log(storage, 0, 100, pool=pool, deferred_formatting=True)
+        finally:
+            pool.close()
+        df = read_parquet_logs(self.partition)
+        self.assertEqual(df['raw_message'].tolist()[:2], ["주문 order-0 처리 완료 (slow)",
+                                                          "주문 order-1 처리 완료 (Fast)"])
+
+    def test_arrow_stream_and_convert(self):
+        """Arrow 스트림에 이어 붙이고 파케이로 변환"""
+        storage = make_storage('arrow', 'zstd')
+        self._log(storage, 0, 100)
+        self._log(storage, 100, 50)
+        self.assertFalse((self.partition / LOG_FILE).exists())
+        self.assertEqual(read_arrow_stream(self.partition / ARROW_FILE).num_rows, 150)
+        self.assertEqual(len(read_parquet_logs(self.partition)), 150)  # 변환 전에도 읽기 가능
+
+        # 쓰다 만 마지막 스트림은 건너뜀
+        with open(self.partition / ARROW_FILE, 'ab') as f:
+            f.write(b'\xff\xff\xff\xff\x10\x00')
+        self.assertEqual(convert_partition(self.partition, 'zstd', index_messages=True), 150)
+        self.assertFalse((self.partition / ARROW_FILE).exists())
+        df = read_parquet_logs(self.partition)
+        self.assertEqual(len(df), 150)
+        self.assertEqual(df['raw_message'].iloc[149], "주문 order-149 실패")
+        found = search_logs(self.temp_dir, "storage", "test", "order-120")
+        self.assertEqual(len(found), 1)
+
+    def test_arrow_partition_in_commands(self):
+        """변환 전 Arrow 파티션도 집계, 내보내기, 검색, 추적 대상"""
+        storage = make_storage('arrow')
+        self._log(storage, 0, 100)
+        tail = ParquetTail(self.temp_dir, "storage", "test", lines=3)
+        lines = tail.read_new()
+        self.assertEqual(len(lines), 3)
+        self.assertIn("주문 order-98 처리 완료 (slow)", lines[1])
+
+        self._log(storage, 100, 20)
+        self.assertEqual(len(tail.read_new()), 20)
+        self.assertEqual(list_partitions(self.temp_dir, "storage", "test"), [self.partition])
+        self.assertEqual(log_stats(self.temp_dir, "storage", "test").rows, 120)
+        self.assertEqual(export_logs(self.temp_dir, "storage", "test", io.StringIO(), fmt='jsonl'), 120)
+        found = search_logs(self.temp_dir, "storage", "test", "order-105")
+        self.assertEqual(found['raw_message'].tolist(), ["주문 order-105 처리 완료 (Fast)"])
+
+        # log.parquet로 변환되어도 이미 읽은 행은 다시 출력하지 않음
+        convert_partition(self.partition)
+        self.assertEqual(tail.read_new(), [])
+
+    def test_arrow_rejects_snappy(self):
+        """Arrow IPC가 지원하지 않는 코덱"""
+        with self.assertRaises(ValueError):
+            make_storage('arrow', 'snappy')
+
+    def test_convert_cli_skips_today(self):
+        """convert 명령은 오늘 파티션을 건너뜀"""
+        self._log(make_storage('arrow'), 0, 20)
+        err = io.StringIO()
+        with redirect_stderr(err):
+            code = main(['convert', '--project', 'storage', '--env', 'test', '--base-path', self.temp_dir])
+        self.assertEqual(code, 0)
+        self.assertIn("변환할 파티션이 없습니다", err.getvalue())
+        self.assertTrue((self.partition / ARROW_FILE).exists())
+        with redirect_stderr(err):
+            code = main(['convert', '--project', 'storage', '--env', 'test', '--base-path', self.temp_dir,
+                         '--include-today'])
+        self.assertEqual(code, 0)
+        self.assertTrue((self.partition / LOG_FILE).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+"""
+tail 명령 (텍스트/파케이 로그 실시간 추적) 테스트
+"""
+
+import sys
+import os
+import io
+import time
+import unittest
+import tempfile
+import shutil
+import threading
+from pathlib import Path
+from contextlib import redirect_stdout
+from unittest import mock
+
+import pandas as pd
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import encoder
+from ineeji_logging.__main__ import main
+from ineeji_logging.logger import ParquetLogHandler
+from ineeji_logging.tail import ParquetTail, TextTail, InotifyWatcher, make_watcher, follow
+import logging
+
+
+class TestParquetTail(unittest.TestCase):
+    """ParquetTail 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.handler = ParquetLogHandler(self.temp_dir, "test", "tail", flush_threshold=1000)
+        self.logger = logging.getLogger("tail_parquet")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+        self.child = logging.getLogger("tail_parquet.db")
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+        ParquetLogHandler._instances.remove(self.handler)
+        shutil.rmtree(self.temp_dir)
+
+    def _tail(self, **kwargs):
+        return ParquetTail(self.temp_dir, "tail", "test", **kwargs)
+
+    def test_incremental_reads(self):
+        """이미 읽은 행은 다시 출력하지 않고 새 행만 반환"""
+        for i in range(30):
+            self.logger.info("첫 배치 %d", i)
+        self.handler.flush()
+
+        tail = self._tail(lines=5)
+        lines = tail.read_new()
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(lines[-1].endswith("tail_parquet: 첫 배치 29"))
+        self.assertEqual(tail.read_new(), [])
+
+        for i in range(3):
+            self.logger.info("둘째 배치 %d", i)
+        self.handler.flush()
+        lines = tail.read_new()
+        self.assertEqual([line.split(': ', 1)[1] for line in lines], [f"둘째 배치 {i}" for i in range(3)])
+
+    def test_reads_only_new_row_groups(self):
+        """새 행이 있는 로우 그룹부터만 읽음"""
+        with mock.patch.object(encoder, 'ROW_GROUP_ROWS', 10):
+            for i in range(45):
+                self.logger.info("행 %d", i)
+            self.handler.flush()
+            tail = self._tail(lines=0)
+            self.assertEqual(tail.read_new(), [])
+
+            self.logger.info("새 행")
+            self.handler.flush()
+            from fastparquet import ParquetFile
+            with mock.patch.object(ParquetFile, '__getitem__', autospec=True,
+                                   side_effect=ParquetFile.__getitem__) as getitem:
+                lines = tail.read_new()
+            self.assertEqual(len(lines), 1)
+            self.assertTrue(lines[0].endswith("새 행"))
+            self.assertEqual(getitem.call_args[0][1], slice(4, None))
+
+    def test_level_and_name_filter(self):
+        """최소 레벨과 로거 이름(하위 로거 포함)으로 필터링"""
+        self.logger.info("정보")
+        self.logger.error("부모 에러")
+        self.child.warning("자식 경고")
+        self.child.error("자식 에러")
+        logging.getLogger("tail_parquet_other").error("다른 로거")
+        self.handler.flush()
+
+        lines = self._tail(level='WARNING', name='tail_parquet.db').read_new()
+        self.assertEqual([line.split(': ', 1)[1] for line in lines], ["자식 경고", "자식 에러"])
+        lines = self._tail(level='ERROR').read_new()
+        self.assertEqual([line.split(': ', 1)[1] for line in lines], ["부모 에러", "자식 에러"])
+
+    def test_exception_summary(self):
+        """예외는 요약을, --tracebacks이면 전체 트레이스백을 출력"""
+        try:
+            raise ValueError("잘못된 값")
+        except ValueError:
+            self.logger.exception("처리 실패")
+        self.handler.flush()
+
+        summary = self._tail().read_new()
+        self.assertEqual(len(summary), 1)
+        self.assertIn("ValueError: 잘못된 값", summary[0])
+        self.assertNotIn("Traceback", summary[0])
+        full = self._tail(tracebacks=True).read_new()
+        self.assertIn("Traceback (most recent call last):", full[0])
+
+    def test_cli_once(self):
+        """CLI --once는 현재 내용만 출력하고 종료"""
+        self.logger.info("CLI 로그")
+        self.logger.debug("디버그 로그")
+        self.handler.flush()
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(['tail', '--project', 'tail', '--env', 'test', '--base-path', self.temp_dir,
+                         '--level', 'INFO', '--once'])
+        self.assertEqual(code, 0)
+        self.assertEqual(out.getvalue().count('\n'), 1)
+        self.assertIn("CLI 로그", out.getvalue())
+
+
+class TestTextTail(unittest.TestCase):
+    """TextTail 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "app.log"
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, text, mode='a'):
+        with open(self.path, mode, encoding='utf-8') as f:
+            f.write(text)
+
+    def test_last_lines_and_partial(self):
+        """시작 시 마지막 N줄, 쓰는 중인 줄은 완성된 뒤 출력"""
+        self._write(''.join(f"줄 {i}\n" for i in range(100)) + "미완성", mode='w')
+        tail = TextTail(str(self.path), lines=3)
+        self.assertEqual(tail.read_new(), ["줄 97", "줄 98", "줄 99"])
+        self._write(" 줄\n")
+        self.assertEqual(tail.read_new(), ["미완성 줄"])
+        tail.close()
+
+    def test_follows_rotation(self):
+        """파일이 교체되면 이전 파일을 마저 읽고 새 파일을 처음부터 읽음"""
+        self._write("시작\n", mode='w')
+        tail = TextTail(str(self.path), lines=10)
+        self.assertEqual(tail.read_new(), ["시작"])
+
+        self._write("교체 전 마지막\n")
+        os.rename(self.path, str(self.path) + ".1")
+        self._write("새 파일 첫 줄\n", mode='w')
+        self.assertEqual(tail.read_new(), ["교체 전 마지막", "새 파일 첫 줄"])
+
+        self._write("truncate 후\n", mode='w')
+        self.assertEqual(tail.read_new(), ["truncate 후"])
+        tail.close()
+
+    def test_filter_keeps_continuation_lines(self):
+        """트레이스백 같은 연속 줄은 앞 레코드의 필터 결과를 따름"""
+        self._write(
+            "2024-01-01 00:00:00,000 [INFO] app: 시작\n"
+            "2024-01-01 00:00:01,000 [ERROR] app.db (/src/db.py:10 - query): 실패\n"
+            "Traceback (most recent call last):\n"
+            "ValueError: x\n"
+            "2024-01-01 00:00:02,000 [ERROR] other: 무관\n"
+            "  계속\n",
+            mode='w'
+        )
+        tail = TextTail(str(self.path), level='ERROR', name='app', lines=10)
+        self.assertEqual(tail.read_new(), [
+            "2024-01-01 00:00:01,000 [ERROR] app.db (/src/db.py:10 - query): 실패",
+            "Traceback (most recent call last):",
+            "ValueError: x",
+        ])
+        tail.close()
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), "inotify는 리눅스 전용")
+    def test_follow_with_inotify(self):
+        """inotify 감시자로 새 줄을 즉시 수신"""
+        self._write("", mode='w')
+        watcher = make_watcher()
+        self.assertIsInstance(watcher, InotifyWatcher)
+        stop = threading.Event()
+        received = []
+
+        def consume():
+            for line in follow([TextTail(str(self.path), lines=0)], watcher, interval=5.0, stop=stop):
+                received.append(line)
+                stop.set()
+
+        thread = threading.Thread(target=consume)
+        thread.start()
+        time.sleep(0.2)
+        started = time.monotonic()
+        self._write("새 로그\n")
+        thread.join(timeout=10)
+        watcher.close()
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(received, ["새 로그"])
+        self.assertLess(time.monotonic() - started, 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+메시지 템플릿/인자 분리 저장 테스트
+"""
+
+import sys
+import os
+import json
+import time
+import unittest
+import tempfile
+import shutil
+from enum import Enum
+from pathlib import Path
+
+import pandas as pd
+
+# 라이브러리 임포트를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ineeji_logging import Logger, read_parquet_logs
+from ineeji_logging.templates import encode_args, format_template
+from ineeji_logging.logger import ParquetLogHandler
+
+
+class Color(str, Enum):
+    """str을 상속해 __str__이 값과 다른 인자"""
+    RED = 'red'
+
+
+class TestFormatTemplate(unittest.TestCase):
+    """템플릿 복원 테스트"""
+
+    def test_roundtrip_keeps_types(self):
+        """JSON 인자로 LogRecord.getMessage와 같은 결과 복원"""
+        cases = [
+            ("user %s logged in %d times (%.1f%%)", ("kim", 3, 42.5)),
+            ("flag=%s value=%r", (True, None)),
+            ("%(user)s from %(ip)s", {'user': 'lee', 'ip': '10.0.0.1'}),
+            ("100% literal", ()),
+        ]
+        for template, args in cases:
+            expected = template % args if args else template
+            self.assertEqual(format_template(template, encode_args(args)), expected)
+
+    def test_bad_arguments_do_not_raise(self):
+        """포맷 오류가 나면 템플릿과 인자를 그대로 표시"""
+        self.assertEqual(format_template("%d items", json.dumps(["many"])), '%d items ["many"]')
+
+
+class TestTemplateColumns(unittest.TestCase):
+    """ParquetLogHandler 템플릿 컬럼 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.partition = Path(self.temp_dir) / "templates" / "test" / time.strftime('%Y-%m-%d')
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def _log(self, async_logging, deferred_formatting):
+        handler = ParquetLogHandler(self.temp_dir, "test", "templates", flush_threshold=7,
+                                    deferred_formatting=deferred_formatting)
+        logger = Logger(f"templates_{async_logging}_{deferred_formatting}", console_output=False,
+                        async_logging=async_logging, extra_handlers=[handler])
+        try:
+            for i in range(20):
+                logger.info("user %s logged in %d times", f"user{i % 4}", i)
+            logger.warning("설정 %s", {'retries': 3})  # 변경 가능한 인자는 즉시 포맷
+            logger.info("color=%s", Color.RED)  # 스칼라 하위 클래스도 즉시 포맷
+            logger.info({'event': 'dict message'})
+            logger.info("100% literal")
+        finally:
+            if async_logging:
+                Logger._listeners.pop(logger.name).stop()
+            handler.close()
+            ParquetLogHandler._instances.remove(handler)
+
+    def _check(self, deferred_formatting):
+        df = pd.read_parquet(self.partition / "log.parquet", engine='fastparquet')
+        self.assertEqual(len(df), 24)
+        self.assertEqual(df['template'].dtype.name, 'category')
+        self.assertEqual(df['template'].value_counts()['user %s logged in %d times'], 20)
+        self.assertEqual(json.loads(df['args'].iloc[5]), ['user1', 5])
+        self.assertEqual(deferred_formatting, 'message' not in df.columns)
+
+        full = read_parquet_logs(self.partition)
+        expected = [f"user user{i % 4} logged in {i} times" for i in range(20)]
+        expected += ["설정 {'retries': 3}", "color=Color.RED", "{'event': 'dict message'}", "100% literal"]
+        self.assertEqual(full['raw_message'].tolist(), expected)
+
+    def test_sync_deferred(self):
+        """지연 포맷: 포맷된 메시지 없이 저장하고 읽을 때 복원"""
+        self._log(async_logging=False, deferred_formatting=True)
+        self._check(deferred_formatting=True)
+
+    def test_async_deferred(self):
+        """비동기 로깅에서도 원래 템플릿과 인자를 보존"""
+        self._log(async_logging=True, deferred_formatting=True)
+        self._check(deferred_formatting=True)
+
+    def test_presets_keep_formatted_messages(self):
+        """환경 프리셋은 지연 포맷을 켜지 않음 (message 컬럼을 읽는 기존 소비자 보호)"""
+        for env in ("development", "test", "production"):
+            self.assertFalse(Logger.get_default_config(env).get('parquet_deferred_formatting', False))
+
+    def test_async_with_messages(self):
+        """기본 모드는 포맷된 메시지와 함께 템플릿/인자 저장"""
+        self._log(async_logging=True, deferred_formatting=False)
+        self._check(deferred_formatting=False)
+
+
+if __name__ == "__main__":
+    unittest.main()